@@ -0,0 +1,234 @@
+"""
+Programmatic entry point for the CIBC statements parser.
+
+:func:`parse_statements` runs the same pipeline as the CLI but returns the
+result in memory - a ``pandas.DataFrame``, a ``pyarrow.Table`` or an
+iterator of row dictionaries - without printing, exiting or touching the
+filesystem. It keeps no global state and is safe to call repeatedly from
+a long-lived process.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+import pandas as pd
+
+from constants.table_headers import OUTPUT_COLUMNS, Col
+from merchant_dictionary import MerchantDictionary
+from pdf_processor import PDFProcessor
+from pdf_source import PDFSource, source_id
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_YEAR = "2000"
+CARD_COLUMN = "card"
+
+type Card = tuple[str, str]
+type Output = Literal["pandas", "arrow", "records"]
+
+OUTPUTS = ("pandas", "arrow", "records")
+ERRORS = ("raise", "skip")
+
+
+class StatementParseError(RuntimeError):
+    """Raised when a document cannot be parsed and ``errors="raise"``."""
+
+
+@overload
+def parse_statements(
+    sources: PDFSource | Iterable[PDFSource],
+    cards: Card | Sequence[Card],
+    year: str | None = None,
+    *,
+    output: Literal["pandas"] = "pandas",
+    workers: int = 1,
+    errors: Literal["raise", "skip"] = "raise",
+    merchants: Path | None = None,
+) -> pd.DataFrame: ...
+
+
+@overload
+def parse_statements(
+    sources: PDFSource | Iterable[PDFSource],
+    cards: Card | Sequence[Card],
+    year: str | None = None,
+    *,
+    output: Literal["arrow"],
+    workers: int = 1,
+    errors: Literal["raise", "skip"] = "raise",
+    merchants: Path | None = None,
+) -> "pa.Table": ...
+
+
+@overload
+def parse_statements(
+    sources: PDFSource | Iterable[PDFSource],
+    cards: Card | Sequence[Card],
+    year: str | None = None,
+    *,
+    output: Literal["records"],
+    workers: int = 1,
+    errors: Literal["raise", "skip"] = "raise",
+    merchants: Path | None = None,
+) -> Iterator[dict[str, Any]]: ...
+
+
+def parse_statements(  # noqa: PLR0913
+    sources: PDFSource | Iterable[PDFSource],
+    cards: Card | Sequence[Card],
+    year: str | None = None,
+    *,
+    output: Output = "pandas",
+    workers: int = 1,
+    errors: Literal["raise", "skip"] = "raise",
+    merchants: Path | None = None,
+) -> "pd.DataFrame | pa.Table | Iterator[dict[str, Any]]":
+    """
+    Parse CIBC statements and return the transactions in memory.
+
+    Args:
+        sources: One document or an iterable of documents - paths, PDF
+            ``bytes``, binary file objects or ``mmap`` objects.
+        cards: ``(first_four, last_four)`` digits of the card, or a sequence
+            of such pairs. With several cards a ``card`` column
+            (``"<first><last>"``) tells the rows apart.
+        year: Statement year for dates without one; ``None`` reads it from
+            each document's statement date (falling back to ``"2000"``).
+        output: ``"pandas"`` (default), ``"arrow"`` (requires ``pyarrow``)
+            or ``"records"`` - a lazy iterator of row dictionaries that
+            parses one document at a time.
+        workers: Number of worker processes per card (``1`` = serial).
+        errors: ``"raise"`` stops on the first broken document with
+            :class:`StatementParseError`; ``"skip"`` leaves it out.
+        merchants: Optional ``alias,merchant`` CSV (or ``.mdx`` index) that
+            maps store names to canonical merchants. A CSV without an
+            up-to-date ``.mdx`` next to it is compiled in memory.
+
+    Returns:
+        Cleaned transactions with the same columns as the CLI output.
+
+    Raises:
+        ValueError: *output* or *errors* is not one of the values above,
+            or *cards* is empty; checked before any document is parsed.
+    """
+    if output not in OUTPUTS:
+        msg = f"Unknown output {output!r}; expected 'pandas', 'arrow' or 'records'."
+        raise ValueError(msg)
+    if errors not in ERRORS:
+        msg = f"Unknown errors {errors!r}; expected 'raise' or 'skip'."
+        raise ValueError(msg)
+    docs = _as_source_list(sources)
+    card_list = _as_card_list(cards)
+
+    dictionary = (
+        MerchantDictionary(merchants, write_index=False)
+        if merchants is not None
+        else None
+    )
+    frames = _iter_frames(
+        docs,
+        card_list,
+        year=year,
+        workers=workers,
+        errors=errors,
+        merchants=dictionary,
+    )
+    if output == "records":
+        return (row for frame in frames for row in frame.to_dict(orient="records"))
+
+    columns = _columns(card_list)
+    parsed = list(frames)
+    frame = (
+        pd.concat(parsed, ignore_index=True).reindex(columns=columns)
+        if parsed
+        else pd.DataFrame(columns=columns)
+    )
+    if output == "arrow":
+        return _to_arrow(frame)
+    return frame
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _iter_frames(  # noqa: PLR0913
+    docs: list[PDFSource],
+    cards: list[Card],
+    *,
+    year: str | None,
+    workers: int,
+    errors: str,
+    merchants: MerchantDictionary | None,
+) -> Iterator[pd.DataFrame]:
+    """Yield one cleaned frame per document and card."""
+    for first, last in cards:
+        processor = PDFProcessor(first, last, merchants)
+
+        for doc, parsed in zip(
+            docs,
+            processor.iter_pdfs(docs, workers=workers),
+            strict=True,
+        ):
+            if parsed.frame is None:
+                if errors == "raise":
+                    msg = f"{source_id(doc)}: {parsed.error}"
+                    raise StatementParseError(msg)
+                continue
+
+            if parsed.frame.empty:
+                continue
+
+            # same rule as the CLI: every statement is dated on its own
+            statement_date = parsed.summary.parsed_date if parsed.summary else None
+            if year is None and statement_date is not None:
+                frame = processor.process_dataframe(
+                    parsed.frame,
+                    str(statement_date.year),
+                    statement_date.month,
+                )
+            else:
+                frame = processor.process_dataframe(parsed.frame, year or DEFAULT_YEAR)
+            frame.columns = [str(Col(c).value) for c in frame.columns]
+            if len(cards) > 1:
+                frame[CARD_COLUMN] = f"{first}{last}"
+            yield frame
+
+
+def _as_source_list(sources: PDFSource | Iterable[PDFSource]) -> list[PDFSource]:
+    """Treat paths, bytes and streams as one document, other iterables as many."""
+    if isinstance(sources, str | bytes | bytearray | memoryview) or hasattr(
+        sources,
+        "read",
+    ):
+        return [sources]
+    if not isinstance(sources, Iterable):
+        return [sources]
+    return list(sources)
+
+
+def _as_card_list(cards: Card | Sequence[Card]) -> list[Card]:
+    """Accept a single ``(first, last)`` pair or a non-empty sequence of pairs."""
+    if not cards:
+        msg = "At least one (first, last) card pair is required."
+        raise ValueError(msg)
+    if isinstance(cards[0], str) and isinstance(cards[1], str):
+        return [(cards[0], cards[1])]
+    return [(str(pair[0]), str(pair[1])) for pair in cards]
+
+
+def _columns(cards: list[Card]) -> list[str]:
+    names = [str(c.value) for c in OUTPUT_COLUMNS]
+    return [*names, CARD_COLUMN] if len(cards) > 1 else names
+
+
+def _to_arrow(frame: pd.DataFrame) -> "pa.Table":
+    try:
+        import pyarrow as pa  # noqa: PLC0415 - optional dependency
+    except ImportError as exc:
+        msg = 'output="arrow" requires the optional "pyarrow" package.'
+        raise ImportError(msg) from exc
+    return pa.Table.from_pandas(frame, preserve_index=False)
@@ -0,0 +1,101 @@
+"""
+Read statement PDFs straight out of ZIP / TAR bundles.
+
+Listing an archive only reads its member headers. Each PDF is returned
+as an :class:`ArchiveMember` - the archive path plus the member name -
+and decompressed into memory only when that document is parsed, so
+nothing is extracted to disk and a large bundle is never held in memory
+at once. Members pickle as that reference: worker processes read their
+own documents.
+"""
+
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+PDF_SUFFIX = ".pdf"
+
+
+@dataclass(slots=True, frozen=True)
+class ArchiveMember:
+    """
+    A PDF inside a zip or tar file, read on demand.
+
+    ``span`` is the data offset and size of a tar member, so reading it
+    does not walk the archive's headers again; it is ``None`` for zip
+    members, which are found through the zip directory.
+    """
+
+    archive: Path
+    member: str
+    span: tuple[int, int] | None = None
+
+    @property
+    def name(self) -> str:
+        """``"<archive>:<member>"``, for messages and checkpoints."""
+        return f"{self.archive}:{self.member}"
+
+    def read_bytes(self) -> bytes:
+        """Decompress and return the member."""
+        if self.span is None:
+            with zipfile.ZipFile(self.archive) as zf:
+                return zf.read(self.member)
+
+        offset, size = self.span
+        with tarfile.open(self.archive, mode="r:*") as tf:
+            # the decompressed stream: a compressed tar is read up to the
+            # member, a plain one is seeked directly
+            data = tf.fileobj
+            if data is None:
+                msg = f"{self.archive} cannot be read."
+                raise OSError(msg)
+            data.seek(offset)
+            return data.read(size)
+
+
+def is_archive(path: Path) -> bool:
+    """Return ``True`` when *path* is a readable zip or tar (any compression)."""
+    return path.is_file() and (zipfile.is_zipfile(path) or tarfile.is_tarfile(path))
+
+
+def list_archive_pdfs(archive: Path) -> list[ArchiveMember]:
+    """
+    Return every ``*.pdf`` member of *archive*, sorted by member name.
+
+    Args:
+        archive: Path to a ``.zip`` or ``.tar[.gz|.bz2|.xz]`` file.
+
+    Returns:
+        One :class:`ArchiveMember` per PDF member; nothing is decompressed.
+    """
+    members = _list_zip(archive) if zipfile.is_zipfile(archive) else _list_tar(archive)
+    return sorted(members, key=lambda m: m.member)
+
+
+def _is_pdf_member(name: str) -> bool:
+    return name.lower().endswith(PDF_SUFFIX)
+
+
+def _list_zip(archive: Path) -> list[ArchiveMember]:
+    """List PDF members from the zip directory at the end of the file."""
+    with zipfile.ZipFile(archive) as zf:
+        return [
+            ArchiveMember(archive, info.filename)
+            for info in zf.infolist()
+            if not info.is_dir() and _is_pdf_member(info.filename)
+        ]
+
+
+def _list_tar(archive: Path) -> list[ArchiveMember]:
+    """List PDF members of a tar file in one sequential pass over the headers.
+
+    Compressed tar streams cannot seek cheaply, so members are collected
+    in archive order and sorted by the caller.
+    """
+    with tarfile.open(archive, mode="r:*") as tf:
+        return [
+            ArchiveMember(archive, info.name, (info.offset_data, info.size))
+            for info in tf
+            if info.isfile() and _is_pdf_member(info.name)
+        ]
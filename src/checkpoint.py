@@ -0,0 +1,116 @@
+"""
+Resumable batch checkpoints.
+
+Every successfully parsed document is appended to a JSON-lines file
+together with its raw rows, statement summary and the raw columns it was
+parsed with (``--columns``), so an interrupted run can pick up where it
+stopped instead of parsing everything again.
+"""
+
+import json
+from collections.abc import Collection
+from dataclasses import asdict
+from pathlib import Path
+
+import pandas as pd
+
+from constants.table_headers import Col
+from pdf_processor import StatementSummary
+
+
+class Checkpoint:
+    """
+    Append-only record of finished documents and their raw rows.
+
+    Only the rows loaded from an earlier run are held in memory, each until
+    it is served by :meth:`take`; rows recorded by this run go straight to
+    disk. With ``path=None`` nothing is written and nothing is resumed.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        columns: Collection[Col] | None = None,
+    ) -> None:
+        """
+        Initialize the checkpoint, loading finished documents from *path*.
+
+        Args:
+            path (Path | None): JSON-lines checkpoint file; ``None`` disables
+                checkpointing.
+            columns (Collection[Col] | None): Raw columns this run parses
+                (``None``: all). Documents recorded with fewer columns are
+                not resumed but parsed again.
+        """
+        self.path = path
+        self.columns = None if columns is None else sorted(c.value for c in columns)
+        self.frames: dict[str, pd.DataFrame] = {}
+        self.summaries: dict[str, StatementSummary] = {}
+        if path is not None and path.is_file():
+            self._load(path)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Return ``True`` when *doc_id* was resumed and its rows are not taken yet."""
+        return doc_id in self.frames
+
+    def take(self, doc_id: str) -> tuple[pd.DataFrame, StatementSummary | None]:
+        """Return the raw rows and summary of a resumed document and forget them."""
+        return self.frames.pop(doc_id), self.summaries.pop(doc_id, None)
+
+    def record(
+        self,
+        doc_id: str,
+        frame: pd.DataFrame,
+        summary: StatementSummary | None = None,
+    ) -> None:
+        """
+        Append *doc_id* and its parsed *frame* to the checkpoint file.
+
+        Args:
+            doc_id (str): Identifier from ``pdf_source.source_id``.
+            frame (pd.DataFrame): Raw rows returned by ``process_pdf``.
+            summary (StatementSummary | None): Statement-level figures.
+        """
+        if self.path is None:
+            return
+
+        rows = frame.astype(object).where(frame.notna(), None)
+        entry = {
+            "id": doc_id,
+            "columns": [str(Col(c).value) for c in frame.columns],
+            "rows": rows.to_numpy().tolist(),
+            "summary": asdict(summary) if summary is not None else None,
+            "projection": self.columns,
+        }
+        with self.path.open("a", encoding="utf-8") as fp:
+            fp.write(json.dumps(entry) + "\n")
+
+    def clear(self) -> None:
+        """Delete the checkpoint file once the whole batch has been written."""
+        self.frames.clear()
+        self.summaries.clear()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def _load(self, path: Path) -> None:
+        with path.open(encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # the last line may be cut short by an interrupted write
+                    continue
+                if not self._covers(entry.get("projection", [])):
+                    continue  # parsed without columns this run needs
+                self.frames[entry["id"]] = pd.DataFrame(
+                    entry["rows"],
+                    columns=[Col(c) for c in entry["columns"]],
+                )
+                if entry.get("summary"):
+                    self.summaries[entry["id"]] = StatementSummary(**entry["summary"])
+
+    def _covers(self, projection: list[str] | None) -> bool:
+        """Whether rows parsed with *projection* hold every column of this run."""
+        if projection is None:
+            return True
+        return self.columns is not None and set(self.columns) <= set(projection)
@@ -4,6 +4,9 @@ Public API
 ~~~~~~~~~~
 * :class:`CLIArgs` - immutable dataclass that stores *validated* values.
 * The *only* constructor is :meth:`CLIArgs.from_argv`.
+* :class:`SummaryArgs` - the same for the ``summary`` sub-command.
+* :class:`InspectArgs` - the same for the ``inspect`` sub-command.
+* :class:`ManifestArgs` - the jobs of a ``--manifest`` batch run.
 
 Everything else is an implementation detail.
 """
@@ -11,11 +14,23 @@ Everything else is an implementation detail.
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import sys
 from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from rich import print as rprint
 
+from archive_reader import is_archive, list_archive_pdfs
+from constants.table_headers import OUTPUT_COLUMNS, Col
+from date_range import DateRange
+
+if TYPE_CHECKING:
+    from pdf_source import PDFSource
+
 
 @dataclass(slots=True, frozen=True)
 class CLIArgs:
@@ -27,18 +42,59 @@ class CLIArgs:
         Four leading / trailing digits of the credit-card number.
     docs
         List of PDF paths found via ``--folder`` or ``--files`` (never
-        empty, all paths exist, extension *.pdf*).
+        empty, all paths exist, extension *.pdf*), in-memory members of
+        ``--archive`` bundles, or a single ``bytes`` document read with
+        ``--stdin``.
     out_csv
         Where the merged CSV will be written.
     default_year
         Fallback year string used when a PDF page lacks a statement year.
+    workers
+        Number of worker processes used to parse documents (``1`` = serial).
+    dedupe_index
+        Persistent de-duplication index (``--dedupe``), or ``None``.
+    checkpoint
+        JSON-lines file recording finished documents (``--checkpoint``),
+        or ``None``.
+    summary_db
+        Monthly spend aggregate store updated by this run (``--summary``),
+        or ``None``.
+    statements_csv
+        Per-statement summary table (``--statements``), or ``None``.
+    merchants
+        Merchant dictionary used to canonicalize store names
+        (``--merchants``), or ``None``.
+    metrics
+        Prometheus textfile or JSON file kept up to date with throughput
+        metrics (``--metrics``), or ``None``.
+    page_cache
+        Store of already extracted pages (``--page-cache``), or ``None``.
+    period
+        Transaction dates to keep (``--from`` / ``--to``), or ``None`` for
+        every row.
+    threads
+        Threads laying out the pages of each document (``1`` = serial).
+    columns
+        Output columns in the requested order (``--columns``), or ``None``
+        for all of them.
     """
 
     card_first_digits: str
     card_last_digits: str
-    docs: list[Path]
+    docs: list[PDFSource]
     out_csv: Path
     default_year: str
+    workers: int = 1
+    dedupe_index: Path | None = None
+    checkpoint: Path | None = None
+    summary_db: Path | None = None
+    statements_csv: Path | None = None
+    merchants: Path | None = None
+    metrics: Path | None = None
+    page_cache: Path | None = None
+    period: DateRange | None = None
+    threads: int = 1
+    columns: tuple[Col, ...] | None = None
 
     @classmethod
     def from_argv(cls, argv: list[str] | None = None) -> CLIArgs:
@@ -57,19 +113,216 @@ class CLIArgs:
             *Exit code 2* - when :pyclass:`argparse.ArgumentParser`
             rejects the syntax.
             *Exit code 1* - custom validation failures in
-            :func:`_expand_docs`.
+            :func:`_expand_docs` / :func:`_read_stdin`.
         """
         ns = _build_parser().parse_args(argv)
-        docs = _expand_docs(ns.folder, ns.files)
+        docs: list[PDFSource] = (
+            [_read_stdin()]
+            if ns.stdin
+            else _expand_docs(ns.folder, ns.files, ns.archive)
+        )
+        _check_pool_sizes(ns)
+        if ns.merchants is not None and not ns.merchants.is_file():
+            rprint(f"[red]❌ Merchant dictionary {ns.merchants} does not exist[/red]")
+            raise SystemExit(1)
+        if ns.date_from and ns.date_to and ns.date_from > ns.date_to:
+            rprint("[red]❌ --from must not be later than --to[/red]")
+            raise SystemExit(1)
         return cls(
             card_first_digits=ns.first_digits,
             card_last_digits=ns.last_digits,
             docs=docs,
             out_csv=ns.out,
             default_year=ns.default_year,
+            workers=ns.workers,
+            dedupe_index=ns.dedupe,
+            checkpoint=ns.checkpoint,
+            summary_db=_sidecar_path(ns.summary, ns.out, ".summary.sqlite"),
+            statements_csv=_sidecar_path(ns.statements, ns.out, ".statements.csv"),
+            merchants=ns.merchants,
+            metrics=ns.metrics,
+            page_cache=ns.page_cache,
+            period=(
+                DateRange(ns.date_from, ns.date_to)
+                if ns.date_from or ns.date_to
+                else None
+            ),
+            threads=ns.threads,
+            columns=ns.columns,
         )
 
 
+@dataclass(slots=True, frozen=True)
+class SummaryArgs:
+    """Validated parameters of ``cibc-pdf-parser summary``.
+
+    Attributes
+    ----------
+    summary_db
+        Aggregate store written by a ``--summary`` run.
+    by
+        Optional breakdown column (``category``, ``store_name``, ``province``).
+    out_csv
+        Where to write the summary; ``None`` prints a table instead.
+    """
+
+    summary_db: Path
+    by: str | None
+    out_csv: Path | None
+
+    @classmethod
+    def from_argv(cls, argv: list[str]) -> SummaryArgs:
+        """Parse *argv* (tokens after ``summary``) into :class:`SummaryArgs`.
+
+        Raises
+        ------
+        SystemExit
+            *Exit code 2* - invalid syntax, *exit code 1* - the store file
+            does not exist.
+        """
+        ns = _build_summary_parser().parse_args(argv)
+        if not ns.db.is_file():
+            rprint(f"[red]❌ {ns.db} is not a summary store[/red]")
+            raise SystemExit(1)
+        return cls(summary_db=ns.db, by=ns.by, out_csv=ns.out)
+
+
+@dataclass(slots=True, frozen=True)
+class InspectArgs:
+    """Validated parameters of ``cibc-pdf-parser inspect``.
+
+    Attributes
+    ----------
+    docs
+        Documents to check, gathered as for a parsing run.
+    card
+        ``(first, last)`` four card digits whose table header is looked
+        for, or ``None``.
+    workers
+        Number of worker processes (``1`` = serial).
+    out_csv
+        Where to write the per-document report, or ``None``.
+    """
+
+    docs: list[PDFSource]
+    card: tuple[str, str] | None
+    workers: int
+    out_csv: Path | None
+
+    @classmethod
+    def from_argv(cls, argv: list[str]) -> InspectArgs:
+        """Parse *argv* (tokens after ``inspect``) into :class:`InspectArgs`.
+
+        Raises
+        ------
+        SystemExit
+            *Exit code 2* - invalid syntax, *exit code 1* - no documents,
+            a non-positive ``--workers`` or only one half of the card.
+        """
+        ns = _build_inspect_parser().parse_args(argv)
+        if ns.workers < 1:
+            rprint("[red]❌ --workers must be a positive integer[/red]")
+            raise SystemExit(1)
+        if (ns.first_digits is None) != (ns.last_digits is None):
+            rprint("[red]❌ Give both --first-digits and --last-digits[/red]")
+            raise SystemExit(1)
+        return cls(
+            docs=_expand_docs(ns.folder, ns.files, ns.archive),
+            card=(ns.first_digits, ns.last_digits) if ns.first_digits else None,
+            workers=ns.workers,
+            out_csv=ns.out,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ManifestJob:
+    """One entry of a ``--manifest`` file.
+
+    Attributes
+    ----------
+    name
+        Job name used in the status report.
+    args
+        Validated options of the job, or ``None`` when the entry is invalid.
+    """
+
+    name: str
+    args: CLIArgs | None
+
+
+@dataclass(slots=True, frozen=True)
+class ManifestArgs:
+    """Validated parameters of a ``--manifest jobs.json`` batch run.
+
+    Attributes
+    ----------
+    manifest
+        The JSON manifest file.
+    jobs
+        Its entries, in file order.
+    workers
+        Size of the worker pool shared by all jobs (``1`` = serial).
+    status_json
+        Where to write the per-job status report, or ``None``.
+    metrics
+        Metrics file shared by all jobs (``--metrics``), or ``None``.
+    page_cache
+        Page store shared by all jobs (``--page-cache``), or ``None``.
+    threads
+        Threads laying out the pages of each document (``1`` = serial).
+    """
+
+    manifest: Path
+    jobs: list[ManifestJob]
+    workers: int = 1
+    status_json: Path | None = None
+    metrics: Path | None = None
+    page_cache: Path | None = None
+    threads: int = 1
+
+    @classmethod
+    def from_argv(cls, argv: list[str]) -> ManifestArgs:
+        """Parse *argv* and every job of the manifest it names.
+
+        Each job is an object whose keys are the long options of a single
+        run (``first_digits``, ``files``, ``out``, ``default_year`` ...);
+        ``true`` stands for a bare flag. A job that fails validation is
+        kept with ``args=None`` so it shows up in the status report.
+
+        Raises
+        ------
+        SystemExit
+            *Exit code 2* - invalid syntax, *exit code 1* - the manifest is
+            missing, is not valid JSON or has no jobs.
+        """
+        ns = _build_manifest_parser().parse_args(argv)
+        _check_pool_sizes(ns)
+        try:
+            entries = json.loads(ns.manifest.read_text(encoding="utf-8"))["jobs"]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            rprint(f"[red]❌ {ns.manifest} is not a valid job manifest: {exc}[/red]")
+            raise SystemExit(1) from exc
+        if not isinstance(entries, list) or not entries:
+            rprint(f"[red]❌ {ns.manifest} lists no jobs[/red]")
+            raise SystemExit(1)
+
+        jobs = [_parse_job(i, entry) for i, entry in enumerate(entries, start=1)]
+        return cls(
+            manifest=ns.manifest,
+            jobs=jobs,
+            workers=ns.workers,
+            status_json=ns.status,
+            metrics=ns.metrics,
+            page_cache=ns.page_cache,
+            threads=ns.threads,
+        )
+
+
+def is_manifest_run(argv: list[str]) -> bool:
+    """Return ``True`` when *argv* asks for a ``--manifest`` batch run."""
+    return any(x == "--manifest" or x.startswith("--manifest=") for x in argv)
+
+
 # --------------------------------------------------------------------- #
 # Private helpers                                                       #
 # --------------------------------------------------------------------- #
@@ -83,18 +336,11 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--first-digits", "-fd", required=True, metavar="1234")
     parser.add_argument("--last-digits", "-ld", required=True, metavar="5678")
 
-    group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument(
-        "--folder",
-        type=Path,
-        help="Directory with PDFs (non-recursive)",
-    )
+    group = _add_document_arguments(parser)
     group.add_argument(
-        "--files",
-        nargs="+",
-        type=Path,
-        metavar="PDF",
-        help="Explicit PDF paths",
+        "--stdin",
+        action="store_true",
+        help="Read a single PDF from standard input (no temporary files)",
     )
 
     parser.add_argument(
@@ -109,21 +355,363 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-y",
         "--default_year",
+        "--default-year",
         default="2000",
         metavar="YYYY",
         help="Year used when a statement date lacks a year (default: 2000)",
     )
+
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parse documents in N worker processes (default: 1, serial)",
+    )
+
+    parser.add_argument(
+        "--dedupe",
+        nargs="?",
+        type=Path,
+        const=Path("statements_data.dedupe"),
+        default=None,
+        metavar="INDEX",
+        help=(
+            "Drop transactions already seen in earlier statements or runs, "
+            "tracked in INDEX (default: statements_data.dedupe)"
+        ),
+    )
+
+    parser.add_argument(
+        "--checkpoint",
+        nargs="?",
+        type=Path,
+        const=Path("statements_data.checkpoint"),
+        default=None,
+        metavar="FILE",
+        help=(
+            "Record finished documents in FILE and skip them when an "
+            "interrupted run is restarted (default: statements_data.checkpoint)"
+        ),
+    )
+
+    parser.add_argument(
+        "--summary",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DB",
+        help=(
+            "Fold parsed rows into monthly spend aggregates stored in DB "
+            "(default: <out>.summary.sqlite); read them with 'summary'"
+        ),
+    )
+
+    parser.add_argument(
+        "--statements",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="CSV",
+        help=(
+            "Write statement date, previous balance, payments, card total and "
+            "a reconciliation check per statement (default: <out>.statements.csv)"
+        ),
+    )
+
+    parser.add_argument(
+        "--merchants",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Map store names to canonical merchants using an alias,merchant CSV "
+            "(indexed once into FILE.mdx) or a prebuilt .mdx index"
+        ),
+    )
+
+    parser.add_argument(
+        "--columns",
+        type=_column_list,
+        default=None,
+        metavar="COL,COL",
+        help=(
+            "Write only these columns, in this order; the others are not "
+            f"computed. One or more of: {', '.join(c.value for c in OUTPUT_COLUMNS)}"
+        ),
+    )
+
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=_iso_date,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help=(
+            "Keep transactions made on or after this date; statements closed "
+            "earlier are skipped without being parsed"
+        ),
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=_iso_date,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help=(
+            "Keep transactions made on or before this date; statements that "
+            "cannot reach back to it are skipped without being parsed"
+        ),
+    )
+    _add_run_arguments(parser)
+    return parser
+
+
+def _build_summary_parser() -> argparse.ArgumentParser:
+    """Return the parser of the ``summary`` sub-command."""
+    parser = argparse.ArgumentParser(
+        prog="cibc-pdf-parser summary",
+        description="Show monthly spend totals kept by --summary runs.",
+    )
+    parser.add_argument(
+        "db",
+        type=Path,
+        nargs="?",
+        default=Path("statements_data.summary.sqlite"),
+        help="Aggregate store (default: statements_data.summary.sqlite)",
+    )
+    parser.add_argument(
+        "--by",
+        choices=["category", "store_name", "province"],
+        default=None,
+        help="Break monthly totals down by this column",
+    )
+    parser.add_argument(
+        "-o",
+        "--out",
+        type=Path,
+        default=None,
+        metavar="CSV",
+        help="Write the summary to CSV instead of printing it",
+    )
+    return parser
+
+
+def _build_inspect_parser() -> argparse.ArgumentParser:
+    """Return the parser of the ``inspect`` sub-command."""
+    parser = argparse.ArgumentParser(
+        prog="cibc-pdf-parser inspect",
+        description="Check a batch of statement PDFs cheaply before parsing it.",
+    )
+    _add_document_arguments(parser)
+    parser.add_argument(
+        "--first-digits",
+        "-fd",
+        metavar="1234",
+        help="Also check that the table of this card starts on page 2",
+    )
+    parser.add_argument("--last-digits", "-ld", metavar="5678")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Inspect documents in N worker processes (default: all CPUs)",
+    )
+    parser.add_argument(
+        "-o",
+        "--out",
+        type=Path,
+        default=None,
+        metavar="CSV",
+        help="Also write the per-document report to CSV",
+    )
+    return parser
+
+
+def _build_manifest_parser() -> argparse.ArgumentParser:
+    """Return the parser of a ``--manifest`` batch run."""
+    parser = argparse.ArgumentParser(
+        prog="cibc-pdf-parser --manifest",
+        description="Run many parsing jobs in one process with a shared pool.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        required=True,
+        metavar="JSON",
+        help='Job manifest: {"jobs": [{"first_digits": ..., "files": ...}, ...]}',
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes shared by every job (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--status",
+        type=Path,
+        default=None,
+        metavar="JSON",
+        help="Also write the per-job status report to this file",
+    )
+    _add_run_arguments(parser)
     return parser
 
 
-def _expand_docs(folder: Path | None, files: list[Path] | None) -> list[Path]:
-    """Validate folder/files arguments and return a non-empty list of PDFs.
+def _add_document_arguments(
+    parser: argparse.ArgumentParser,
+) -> argparse._MutuallyExclusiveGroup:
+    """Add the required ``--folder`` / ``--files`` / ``--archive`` choice."""
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--folder",
+        type=Path,
+        help="Directory with PDFs (non-recursive)",
+    )
+    group.add_argument(
+        "--files",
+        nargs="+",
+        type=Path,
+        metavar="PDF",
+        help="Explicit PDF paths",
+    )
+    group.add_argument(
+        "--archive",
+        nargs="+",
+        type=Path,
+        metavar="ARCHIVE",
+        help="ZIP/TAR bundles whose PDF members are parsed without extraction",
+    )
+    return group
+
+
+def _check_pool_sizes(ns: argparse.Namespace) -> None:
+    """Exit with code 1 unless ``--workers`` and ``--threads`` are positive."""
+    for option, value in (("--workers", ns.workers), ("--threads", ns.threads)):
+        if value < 1:
+            rprint(f"[red]❌ {option} must be a positive integer[/red]")
+            raise SystemExit(1)
+
+
+def _column_list(text: str) -> tuple[Col, ...]:
+    """``argparse`` type of ``--columns``: comma-separated, no duplicates."""
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    try:
+        columns = tuple(Col(name) for name in names)
+    except ValueError as exc:
+        msg = f"{exc}; choose from {', '.join(c.value for c in OUTPUT_COLUMNS)}"
+        raise argparse.ArgumentTypeError(msg) from exc
+    if not columns or len(set(columns)) != len(columns):
+        msg = f"expected distinct column names, got {text!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return columns
+
+
+def _iso_date(text: str) -> date:
+    """``argparse`` type of ``--from`` / ``--to``."""
+    try:
+        return date.fromisoformat(text)
+    except ValueError as exc:
+        msg = f"invalid date {text!r}, expected YYYY-MM-DD"
+        raise argparse.ArgumentTypeError(msg) from exc
+
+
+def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options shared by single and ``--manifest`` runs."""
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Lay out the pages of each document in N threads (default: 1, "
+            "serial); pays off on free-threaded Python builds"
+        ),
+    )
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Keep throughput metrics in FILE while the run progresses: "
+            "Prometheus text format, or JSON when FILE ends in .json"
+        ),
+    )
+    parser.add_argument(
+        "--page-cache",
+        nargs="?",
+        type=Path,
+        const=Path("statements_data.pages.sqlite"),
+        default=None,
+        metavar="DB",
+        help=(
+            "Serve pages whose content was already extracted, in this or an "
+            "earlier run, from DB (default: statements_data.pages.sqlite)"
+        ),
+    )
+
+
+def _parse_job(number: int, entry: object) -> ManifestJob:
+    """Validate one manifest entry through the regular single-run parser."""
+    if not isinstance(entry, dict):
+        rprint(f"[red]❌ job {number}: expected an object, got {entry!r}[/red]")
+        return ManifestJob(name=f"job-{number}", args=None)
+
+    name = str(entry.get("name", f"job-{number}"))
+    if entry.get("stdin"):
+        rprint(f"[red]❌ {name}: --stdin cannot be used in a manifest[/red]")
+        return ManifestJob(name=name, args=None)
+    try:
+        return ManifestJob(name=name, args=CLIArgs.from_argv(_job_argv(entry)))
+    except SystemExit:
+        rprint(f"[red]❌ {name}: invalid job, see the message above[/red]")
+        return ManifestJob(name=name, args=None)
+
+
+def _job_argv(entry: dict[str, Any]) -> list[str]:
+    """Turn ``{"first_digits": "1234", "files": [...]}`` into CLI tokens."""
+    argv: list[str] = []
+    for key, value in entry.items():
+        if key == "name" or value is None or value is False:
+            continue
+        flag = f"--{key.replace('_', '-')}"
+        if value is True:
+            argv.append(flag)
+        elif isinstance(value, list):
+            argv.extend([flag, *map(str, value)])
+        else:
+            argv.extend([flag, str(value)])
+    return argv
+
+
+def _sidecar_path(value: str | None, out_csv: Path, suffix: str) -> Path | None:
+    """Resolve an optional sidecar flag: absent, bare (next to *out_csv*) or set."""
+    if value is None:
+        return None
+    return Path(value) if value else out_csv.with_suffix(suffix)
+
+
+def _expand_docs(
+    folder: Path | None,
+    files: list[Path] | None,
+    archives: list[Path] | None = None,
+) -> list[PDFSource]:
+    """Validate folder/files/archive arguments and return a non-empty list of PDFs.
 
     * Ensures a folder exists and gathers ``*.pdf`` (non-recursive).
     * Ensures every path in *files* exists and has ``.pdf`` suffix.
+    * Ensures every path in *archives* is a zip/tar and lists its ``*.pdf``
+      members in sorted order (each is read when parsed, nothing is
+      extracted).
     * Exits with code 1 on any error.
     """
-    docs: list[Path] = []
+    docs: list[PDFSource] = []
 
     # -- folder mode ----------------------------------------------------
     if folder is not None:
@@ -140,9 +728,29 @@ def _expand_docs(folder: Path | None, files: list[Path] | None) -> list[Path]:
                 raise SystemExit(1)
             docs.append(p)
 
+    # -- archive mode ---------------------------------------------------
+    if archives:
+        for p in archives:
+            if not is_archive(p):
+                rprint(f"[red]❌ {p} is not a zip/tar archive[/red]")
+                raise SystemExit(1)
+            docs.extend(list_archive_pdfs(p))
+
     # -- no files provided ---------------------------------------------
     if not docs:
         rprint("[red]❌ No PDF files found[/red]")
         raise SystemExit(1)
 
     return docs
+
+
+def _read_stdin() -> bytes:
+    """Read one PDF document from binary standard input.
+
+    * Exits with code 1 when stdin is empty or is not a PDF.
+    """
+    data = sys.stdin.buffer.read()
+    if b"%PDF" not in data[:1024]:
+        rprint("[red]❌ No PDF data on stdin[/red]")
+        raise SystemExit(1)
+    return data
@@ -12,3 +12,12 @@ STORE_NAME_RE: Final[re.Pattern[str]] = re.compile(r"^([^\d#,*/,/]+)")
 STATEMENT_DATE_RE: Final[re.Pattern[str]] = re.compile(
     r"Statement\s+Date\s*([\s\S]+?)\n",
 )
+AMOUNT_RE: Final[re.Pattern[str]] = re.compile(r"^-?\$?-?[\d,]+\.\d{2}$")
+PREVIOUS_BALANCE_RE: Final[re.Pattern[str]] = re.compile(
+    r"Previous\s+balance\s*(-?\$?-?[\d,]+\.\d{2})",
+    re.IGNORECASE,
+)
+PAYMENTS_RE: Final[re.Pattern[str]] = re.compile(
+    r"Payments\s*(-?\$?-?[\d,]+\.\d{2})",
+    re.IGNORECASE,
+)
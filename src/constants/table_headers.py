@@ -5,7 +5,7 @@ Defines column names and types for statement table parsing and DataFrame constru
 """
 
 from enum import Enum, unique
-from typing import Literal
+from typing import Final, Literal
 
 
 @unique
@@ -30,3 +30,32 @@ type ColName = Literal[
     Col.CATEGORY,
     Col.AMOUNT,
 ]
+
+# Columns of a fully processed statement, in output order.
+OUTPUT_COLUMNS: Final[tuple[Col, ...]] = (
+    Col.TRANS_DATE,
+    Col.POST_DATE,
+    Col.DESCRIPTION,
+    Col.CATEGORY,
+    Col.AMOUNT,
+    Col.PROVINCE,
+    Col.CITY,
+    Col.STORE_NAME,
+)
+
+# Columns holding parsed dates and numbers; every other column is text.
+DATE_COLUMNS: Final[tuple[Col, ...]] = (Col.TRANS_DATE, Col.POST_DATE)
+NUMERIC_COLUMNS: Final[tuple[Col, ...]] = (Col.AMOUNT,)
+
+# Columns read from the statement table, in extraction order.
+RAW_COLUMNS: Final[tuple[Col, ...]] = (
+    Col.TRANS_DATE,
+    Col.POST_DATE,
+    Col.DESCRIPTION,
+    Col.CATEGORY,
+    Col.AMOUNT,
+)
+
+# Columns derived from the description, and the raw columns they are built from.
+DERIVED_COLUMNS: Final[tuple[Col, ...]] = (Col.PROVINCE, Col.CITY, Col.STORE_NAME)
+DERIVED_INPUTS: Final[tuple[Col, ...]] = (Col.DESCRIPTION, Col.AMOUNT)
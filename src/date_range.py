@@ -0,0 +1,78 @@
+"""
+Date-range selection of statements and transactions (``--from`` / ``--to``).
+
+A statement only lists transactions made in the billing cycle that ends
+on its statement date, so that single date - printed on the first page -
+tells whether a statement *can* hold rows of a date range. Statements
+that cannot are skipped before any table is extracted; the rows of the
+others are filtered precisely once parsed.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Final
+
+import pandas as pd
+
+from constants.table_headers import Col
+
+# how far back a statement's transaction dates can reach: one billing
+# cycle plus two weeks for late-posting purchases. Err on the long side -
+# skipping a statement that does hold wanted rows loses data silently.
+STATEMENT_SPAN: Final = timedelta(days=45)
+
+_DATE_FORMATS: Final = ("%B %d, %Y", "%b %d, %Y", "%B %d %Y", "%b %d %Y")
+
+
+def parse_statement_date(text: str) -> date | None:
+    """Return the date of ``"July 15, 2024"`` style text, or ``None``."""
+    text = " ".join(text.replace(".", "").split())
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()  # noqa: DTZ007 - a calendar day
+        except ValueError:
+            continue
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class DateRange:
+    """Inclusive range of transaction dates; ``None`` leaves a side open."""
+
+    start: date | None = None
+    end: date | None = None
+
+    def __str__(self) -> str:
+        """Return ``"2024-01-01 to 2024-03-31"`` (``...`` for an open side)."""
+        start = self.start.isoformat() if self.start else "..."
+        end = self.end.isoformat() if self.end else "..."
+        return f"{start} to {end}"
+
+    def may_contain(self, statement_date: date | None) -> bool:
+        """
+        Return whether a statement dated *statement_date* can hold rows in range.
+
+        A statement with an unknown date is always kept.
+        """
+        if statement_date is None:
+            return True
+        if self.start is not None and statement_date < self.start:
+            return False
+        return self.end is None or statement_date - STATEMENT_SPAN <= self.end
+
+    def filter_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Keep the rows whose transaction date is in range.
+
+        *df* must be processed already (dates parsed); rows without a
+        valid transaction date are dropped.
+        """
+        if df.empty:
+            return df
+        dates = df[Col.TRANS_DATE]
+        keep = dates.notna()
+        if self.start is not None:
+            keep &= dates >= pd.Timestamp(self.start)
+        if self.end is not None:
+            keep &= dates <= pd.Timestamp(self.end)
+        return df[keep]
@@ -0,0 +1,132 @@
+"""
+Hash-indexed de-duplication of overlapping statements.
+
+Re-downloaded or overlapping exports repeat transactions that were already
+parsed. :class:`TransactionIndex` keeps a persistent hash index of
+normalized ``(card, dates, amount, description)`` keys and drops rows
+that have been seen before, one document at a time.
+
+Two identical purchases on the same day are legitimate, so the index is
+a *multiset*: it remembers how many times a key occurred within a single
+statement, and a later document only contributes the occurrences beyond
+that count.
+"""
+
+import hashlib
+import struct
+from pathlib import Path
+from typing import Final
+
+import pandas as pd
+
+from constants.table_headers import Col
+
+_RECORD: Final[struct.Struct] = struct.Struct("<16sI")  # digest, occurrences
+KEY_COLUMNS: Final[tuple[Col, ...]] = (
+    Col.TRANS_DATE,
+    Col.POST_DATE,
+    Col.AMOUNT,
+    Col.DESCRIPTION,
+)
+
+
+class TransactionIndex:
+    """
+    Persistent multiset of transaction keys.
+
+    Lookups and updates are dictionary operations, i.e. O(1) per row.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Initialize the index, loading *path* when it exists.
+
+        Args:
+            path (Path | None): Index file; ``None`` keeps the index in memory.
+        """
+        self.path = path
+        self._counts: dict[bytes, int] = {}
+        if path is not None and path.is_file():
+            self._load(path)
+
+    def __len__(self) -> int:
+        """Return the number of distinct keys in the index."""
+        return len(self._counts)
+
+    def drop_duplicates(self, df: pd.DataFrame, card: str) -> pd.DataFrame:
+        """
+        Return rows of one processed statement that were not seen before.
+
+        Args:
+            df (pd.DataFrame): Output of ``PDFProcessor.process_dataframe``
+                for a single document.
+            card (str): Card identifier, part of every key.
+
+        Returns:
+            pd.DataFrame: *df* without previously indexed rows.
+        """
+        if df.empty:
+            return df
+
+        keys = _row_keys(df, card)
+        keep = self._unseen(keys)
+        for key, n in keys.value_counts().items():
+            if n > self._counts.get(key, 0):
+                self._counts[key] = int(n)
+
+        return df[keep]
+
+    def unseen(self, df: pd.DataFrame, card: str) -> list[bool]:
+        """
+        Return which rows of *df* :meth:`drop_duplicates` would keep.
+
+        Nothing is added to the index.
+        """
+        return self._unseen(_row_keys(df, card)) if not df.empty else []
+
+    def _unseen(self, keys: pd.Series) -> list[bool]:
+        # n-th occurrence of the key inside this document (0-based)
+        occurrence = keys.groupby(keys).cumcount()
+        return [
+            n >= self._counts.get(key, 0)
+            for key, n in zip(keys, occurrence, strict=True)
+        ]
+
+    def save(self) -> None:
+        """Atomically write the index to :attr:`path` (no-op when in-memory)."""
+        if self.path is None:
+            return
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("wb") as fp:
+            for key, n in self._counts.items():
+                fp.write(_RECORD.pack(key, n))
+        tmp.replace(self.path)
+
+    def _load(self, path: Path) -> None:
+        data = path.read_bytes()
+        for key, n in _RECORD.iter_unpack(data):
+            self._counts[key] = n
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _row_keys(df: pd.DataFrame, card: str) -> pd.Series:
+    """Return a 16-byte digest of the normalized key of every row in *df*."""
+    parts = [_normalize(df[col]) for col in KEY_COLUMNS]
+    joined = pd.Series(card, index=df.index).str.cat(parts, sep="\x1f")
+    return joined.map(
+        lambda text: hashlib.blake2b(text.encode(), digest_size=16).digest(),
+    )
+
+
+def _normalize(column: pd.Series) -> pd.Series:
+    """Canonical text form of *column*: ISO dates, 2-dp amounts, folded text."""
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column.dt.strftime("%Y-%m-%d").fillna("")
+    if pd.api.types.is_numeric_dtype(column):
+        return column.map(lambda x: "" if pd.isna(x) else f"{x:.2f}")
+    return column.astype(str).str.upper().str.split().str.join(" ").fillna("")
@@ -0,0 +1,211 @@
+"""
+Background writer that overlaps output serialization with parsing.
+
+Finished document frames are handed to :class:`FrameWriter`, which
+appends them to a CSV or Parquet file from a background thread while the
+caller keeps parsing. A bounded queue provides back-pressure, frames are
+written strictly in submission order, and the file only appears at its
+final path once every frame has been written.
+"""
+
+import queue
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Final, Self
+
+import pandas as pd
+
+from constants.table_headers import DATE_COLUMNS, NUMERIC_COLUMNS, Col
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_DONE: Final = object()  # queue sentinel
+
+
+class FrameWriter:
+    """
+    Append frames to ``*.csv`` or ``*.parquet`` on a background thread.
+
+    Use as a context manager. An exception raised by the writer thread is
+    re-raised from the next :meth:`write` call or from :meth:`close`;
+    an exception in the ``with`` body discards the partial output.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: list[str] | None = None,
+        max_pending: int = 8,
+    ) -> None:
+        """
+        Start the writer thread.
+
+        Args:
+            path (Path): Output file; the ``.parquet`` suffix selects Parquet
+                (requires ``pyarrow``), anything else CSV.
+            columns (list[str] | None): Header of the output; every frame is
+                reindexed to it. ``None`` takes the header from the first
+                frame written.
+            max_pending (int): Frames that may wait in the queue before
+                :meth:`write` blocks.
+        """
+        self.path = path
+        self.columns = columns or []
+        self.rows_written = 0
+        self._tmp = path.with_name(path.name + ".part")
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self._parquet: Any = None
+        self._header: list[Any] = []
+        # a ``.part`` left by a killed run must not be appended to
+        self._tmp.unlink(missing_ok=True)
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"writer-{path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        """Return the writer itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Finish the file on success, discard it when the body raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._stop()
+            self._tmp.unlink(missing_ok=True)
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        Queue *df* for writing; blocks while ``max_pending`` frames wait.
+
+        Raises:
+            BaseException: Whatever the writer thread failed with earlier.
+        """
+        self._raise_pending_error()
+        if not df.empty:
+            self._queue.put(df)
+
+    def close(self) -> None:
+        """
+        Flush the queue, finish the file and move it to :attr:`path`.
+
+        When the writer thread failed, the partial file is removed and the
+        error re-raised.
+        """
+        self._stop()
+        try:
+            self._raise_pending_error()
+        except BaseException:
+            self._tmp.unlink(missing_ok=True)
+            raise
+        self._tmp.replace(self.path)
+
+    # ------------------------------------------------------------------ #
+    # Writer thread                                                      #
+    # ------------------------------------------------------------------ #
+    def _run(self) -> None:
+        while (df := self._queue.get()) is not _DONE:
+            if self._error is not None:
+                continue  # keep draining so producers never block forever
+            try:
+                self._append(df)
+            except BaseException as exc:  # noqa: BLE001 - re-raised in caller
+                self._error = exc
+
+        if self._error is None:
+            try:
+                self._finish()
+            except BaseException as exc:  # noqa: BLE001 - re-raised in caller
+                self._error = exc
+
+    def _append(self, df: pd.DataFrame) -> None:
+        if self.rows_written == 0:
+            self._header = self.columns or list(df.columns)
+        # appended CSV rows must line up with the header already written
+        df = df.reindex(columns=self._header)
+        # keep the running 0..N-1 index of a single ``DataFrame.to_csv``
+        df = df.set_axis(
+            range(self.rows_written, self.rows_written + len(df)),
+            axis="index",
+        )
+        if self.path.suffix.lower() == ".parquet":
+            self._append_parquet(df)
+        else:
+            df.to_csv(self._tmp, mode="a", header=self.rows_written == 0)
+        self.rows_written += len(df)
+
+    def _append_parquet(self, df: pd.DataFrame) -> None:
+        pa, pq = _import_pyarrow()
+        df = df.rename(columns=lambda c: getattr(c, "value", c))
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self._tmp, _parquet_schema(df))
+        table = pa.Table.from_pandas(
+            df,
+            schema=self._parquet.schema,
+            preserve_index=False,
+        )
+        self._parquet.write_table(table)
+
+    def _finish(self) -> None:
+        if self.rows_written == 0:
+            empty = pd.DataFrame(columns=self.columns)
+            if self.path.suffix.lower() != ".parquet":
+                empty.to_csv(self._tmp)
+                return
+            self._append_parquet(empty)
+
+        if self._parquet is not None:
+            self._parquet.close()
+
+    def _stop(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_DONE)
+            self._thread.join()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+def _parquet_schema(df: pd.DataFrame) -> "pa.Schema":
+    """
+    Return the schema of every frame written to one Parquet file.
+
+    Statement columns get fixed types, so a column that happens to be all
+    missing in the first frame is not typed ``null`` (which no later value
+    could be cast to). Other columns keep the type inferred from *df*.
+    """
+    pa, _ = _import_pyarrow()
+    fields = []
+    for field in pa.Schema.from_pandas(df, preserve_index=False):
+        if field.name in DATE_COLUMNS:
+            kind = pa.timestamp("ns")
+        elif field.name in NUMERIC_COLUMNS:
+            kind = pa.float64()
+        elif field.name in set(Col) or pa.types.is_null(field.type):
+            kind = pa.string()
+        else:
+            kind = field.type
+        fields.append(pa.field(field.name, kind))
+    return pa.schema(fields)
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa  # noqa: PLC0415 - optional dependency
+        import pyarrow.parquet as pq  # noqa: PLC0415
+    except ImportError as exc:
+        msg = 'Writing Parquet output requires the optional "pyarrow" package.'
+        raise ImportError(msg) from exc
+    return pa, pq
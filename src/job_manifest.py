@@ -0,0 +1,173 @@
+"""
+Shared state of a ``--manifest`` batch run.
+
+Many jobs - one per cardholder - run in a single process.
+:class:`SharedParser` sends their documents through one worker pool and
+parses a document that several cards appear on only once: each page is
+laid out a single time and every card reads its table from it. The
+results wait in a cache until the last job that needs them has taken
+them. :class:`JobReport` is the per-job status line.
+"""
+
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, replace
+
+from cli_args_parser import CLIArgs
+from metrics import Metrics
+from page_store import PageStore
+from pdf_processor import ParsedDocument, try_parse_statement
+from pdf_source import PDFSource, source_id
+from table_extractor import TableExtractor
+
+type Card = tuple[str, str]
+
+
+@dataclass(slots=True)
+class JobReport:
+    """Outcome of one manifest job."""
+
+    job: str
+    status: str = "ok"  # "ok", "failed" or "invalid"
+    documents: int = 0
+    failed: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    out: str | None = None
+
+
+class SharedParser:
+    """
+    Parse the documents of several jobs once, through one optional pool.
+
+    Results are cached per ``(document, card)`` and handed out as many
+    times as the jobs listed that pair, then dropped.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[CLIArgs],
+        pool: Executor | None = None,
+        metrics: Metrics | None = None,
+        page_store: PageStore | None = None,
+        threads: int = 1,
+    ) -> None:
+        """
+        Plan which cards need which document.
+
+        Args:
+            jobs (Sequence[CLIArgs]): Every valid job of the manifest.
+            pool (Executor | None): Worker pool shared by all jobs; ``None``
+                parses in the calling process.
+            metrics (Metrics | None): Also counts cache hits here.
+            page_store (PageStore | None): Store of already extracted pages,
+                shared by all jobs.
+            threads (int): Threads laying out the pages of each document.
+        """
+        self.pool = pool
+        self.metrics = metrics
+        self.page_store = page_store
+        self.threads = threads
+        self.parsed = 0  # documents opened and laid out
+        self.cache_hits = 0  # results served without parsing again
+        self._cards: dict[str, list[Card]] = {}
+        self._uses: Counter[tuple[str, Card]] = Counter()
+        self._results: dict[tuple[str, Card], ParsedDocument] = {}
+
+        for job in jobs:
+            card = (job.card_first_digits, job.card_last_digits)
+            for doc in job.docs:
+                doc_id = source_id(doc)
+                cards = self._cards.setdefault(doc_id, [])
+                if card not in cards:
+                    cards.append(card)
+                self._uses[doc_id, card] += 1
+
+    def iter_pdfs(
+        self,
+        extractor: TableExtractor,
+        sources: Sequence[PDFSource],
+    ) -> Iterator[ParsedDocument]:
+        """
+        Yield one result per source for the card of *extractor*, in order.
+
+        Documents not parsed by an earlier job are submitted to the pool
+        together, for every card that needs them.
+        """
+        card = (extractor.card_first_digits, extractor.card_last_digits)
+        pending: dict[str, tuple[list[Card], Future[list[ParsedDocument]] | None]] = {}
+        for doc in sources:
+            doc_id = source_id(doc)
+            if (doc_id, card) in self._results or doc_id in pending:
+                continue
+            # cards whose jobs resumed the document need no result
+            cards = [c for c in self._cards.get(doc_id, []) if self._uses[doc_id, c]]
+            if card not in cards:
+                cards = [*cards, card]  # not planned, e.g. added by a resume
+            future = (
+                self.pool.submit(
+                    try_parse_statement,
+                    doc,
+                    _extractors(cards),
+                    self.page_store,
+                    self.threads,
+                )
+                if self.pool is not None
+                else None
+            )
+            pending[doc_id] = (cards, future)
+
+        for doc in sources:
+            doc_id = source_id(doc)
+            if doc_id in pending:
+                cards, future = pending.pop(doc_id)
+                results = (
+                    future.result()
+                    if future is not None
+                    else try_parse_statement(
+                        doc,
+                        _extractors(cards),
+                        self.page_store,
+                        self.threads,
+                    )
+                )
+                self.parsed += 1
+                self._results.update(
+                    {(doc_id, c): r for c, r in zip(cards, results, strict=True)},
+                )
+            else:
+                self.cache_hits += 1
+                if self.metrics is not None:
+                    self.metrics.cache_hits += 1
+            yield self._take(doc_id, card)
+
+    def release(self, extractor: TableExtractor, doc_id: str) -> None:
+        """
+        Give up one planned use of *doc_id* by the card of *extractor*.
+
+        Called for a document a job resumes from its checkpoint instead of
+        taking it here, so a cached result is not kept until the end.
+        """
+        key = (doc_id, (extractor.card_first_digits, extractor.card_last_digits))
+        self._uses[key] -= 1
+        if self._uses[key] <= 0:
+            del self._uses[key]
+            self._results.pop(key, None)
+
+    def _take(self, doc_id: str, card: Card) -> ParsedDocument:
+        """Return a cached result, dropping it after its last planned use."""
+        key = (doc_id, card)
+        self._uses[key] -= 1
+        if self._uses[key] > 0:
+            # jobs post-process their rows in place, so earlier users get a
+            # copy - without the parse stats, which only the last use reports
+            result = self._results[key]
+            frame = result.frame.copy() if result.frame is not None else None
+            return replace(result, frame=frame, stats=None)
+        del self._uses[key]
+        return self._results.pop(key)
+
+
+def _extractors(cards: list[Card]) -> list[TableExtractor]:
+    return [TableExtractor(first, last) for first, last in cards]
@@ -4,26 +4,461 @@ Main entry point for the CIBC statements parser.
 This script processes one or more PDF statement files and combines the results.
 """
 
+import json
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, replace
+from datetime import date
+
 import pandas as pd
+from rich import print as rprint
+from rich.table import Table
 
-from cli_args_parser import CLIArgs
-from pdf_processor import PDFProcessor
+from checkpoint import Checkpoint
+from cli_args_parser import (
+    CLIArgs,
+    InspectArgs,
+    ManifestArgs,
+    SummaryArgs,
+    is_manifest_run,
+)
+from constants.table_headers import OUTPUT_COLUMNS, Col
+from dedupe import KEY_COLUMNS, TransactionIndex
+from frame_writer import FrameWriter
+from job_manifest import JobReport, SharedParser
+from merchant_dictionary import MerchantDictionary
+from metrics import Metrics
+from page_store import PageStore
+from pdf_processor import PDFProcessor, StatementSummary, read_statement_date
+from pdf_source import PDFSource, source_id
+from preflight import Plan, inspect_documents
+from spend_summary import GROUP_COLUMNS, SpendSummary
 
-if __name__ == "__main__":
-    args = CLIArgs.from_argv()
 
+def main(argv: list[str] | None = None) -> None:
+    """Parse the documents given on the command line and write the CSV."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["summary"]:
+        _show_summary(SummaryArgs.from_argv(argv[1:]))
+        return
+    if argv[:1] == ["inspect"]:
+        _inspect(InspectArgs.from_argv(argv[1:]))
+        return
+    if is_manifest_run(argv):
+        _run_manifest(ManifestArgs.from_argv(argv))
+        return
+
+    if _run(_prune(CLIArgs.from_argv(argv))).failed:
+        raise SystemExit(1)
+
+
+def _run(
+    args: CLIArgs,
+    shared: SharedParser | None = None,
+    metrics: Metrics | None = None,
+) -> JobReport:
+    """
+    Parse, post-process and write every document of *args*.
+
+    Documents are parsed through *shared* when given (``--manifest`` runs),
+    otherwise by a pool of ``args.workers`` processes owned by this run.
+    Progress and throughput go to *metrics* (by default a new one
+    exporting to ``args.metrics``).
+    """
+    started = time.perf_counter()
+    metrics = metrics if metrics is not None else Metrics(args.metrics)
     processor = PDFProcessor(
         args.card_first_digits,
         args.card_last_digits,
+        MerchantDictionary(args.merchants) if args.merchants else None,
+        page_store=PageStore(args.page_cache) if args.page_cache else None,
+        threads=args.threads,
+        columns=_needed_columns(args),
+    )
+    columns = list(args.columns or OUTPUT_COLUMNS)
+
+    checkpoint = Checkpoint(args.checkpoint, processor.extractor.columns)
+    failures: list[tuple[str, str]] = []
+    index = TransactionIndex(args.dedupe_index) if args.dedupe_index else None
+    parsed_any = False
+    statements: list[dict[str, object]] = []
+
+    with ExitStack() as stack:
+        stack.enter_context(metrics.live(len(args.docs), args.out_csv.name))
+        summary = (
+            stack.enter_context(SpendSummary(args.summary_db))
+            if args.summary_db
+            else None
+        )
+        # serialization runs on a background thread while parsing continues
+        writer = stack.enter_context(
+            FrameWriter(args.out_csv, columns=[c.value for c in columns]),
+        )
+
+        for doc, raw, statement in _iter_documents(
+            processor,
+            args,
+            checkpoint,
+            failures,
+            metrics,
+            shared=shared,
+        ):
+            parsed_any = True
+            # every statement is dated on its own: a batch can span years
+            statement_date = _statement_date(doc, statement)
+            year = str(statement_date.year) if statement_date else args.default_year
+            month = statement_date.month if statement_date else None
+            if statement is not None:
+                statements.append(_check_statement(source_id(doc), statement))
+
+            with metrics.timed("process"):
+                df = processor.process_dataframe(raw, year, month)
+                df = _store_rows(df, source_id(doc), args, index, summary)
+                if args.columns is not None:
+                    df = df.reindex(columns=columns)
+            with metrics.timed("write"):
+                writer.write(df)
+            metrics.document_finished(rows=len(df))
+
+        _write_error_report(args, failures)
+        if args.statements_csv is not None:
+            pd.DataFrame(statements).to_csv(args.statements_csv, index=False)
+        if not parsed_any and args.docs:
+            rprint("[red]❌ No document could be parsed[/red]")
+            raise SystemExit(1)
+
+    # with failures keep the checkpoint: a rerun only retries those documents.
+    # It writes the recorded ones again, so their keys must not be saved yet.
+    if not failures:
+        if index is not None:
+            index.save()
+        checkpoint.clear()
+    return JobReport(
+        job=str(args.out_csv),
+        status="failed" if failures else "ok",
+        documents=len(args.docs),
+        failed=len(failures),
+        rows=writer.rows_written,
+        seconds=round(time.perf_counter() - started, 3),
+        out=str(args.out_csv),
     )
 
-    parsed_docs: list[pd.DataFrame] = [processor.process_pdf(x) for x in args.docs]
 
-    data = pd.concat(parsed_docs, ignore_index=True)
-    year = processor.get_year_from_first_page(args.docs[0])
-    data = processor.process_dataframe(
-        data,
-        year if year is not None else args.default_year,
+def _run_manifest(args: ManifestArgs) -> None:
+    """Run every job of a manifest through one shared pool and parse cache."""
+    jobs = [
+        replace(job, args=_prune(job.args)) if job.args is not None else job
+        for job in args.jobs
+    ]
+    valid = [job.args for job in jobs if job.args is not None]
+    reports: list[JobReport] = []
+    metrics = Metrics(args.metrics)
+
+    with ExitStack() as stack:
+        pool = (
+            stack.enter_context(ProcessPoolExecutor(max_workers=args.workers))
+            if args.workers > 1
+            else None
+        )
+        shared = SharedParser(
+            valid,
+            pool,
+            metrics,
+            PageStore(args.page_cache) if args.page_cache else None,
+            args.threads,
+        )
+
+        for job in jobs:
+            if job.args is None:
+                reports.append(JobReport(job=job.name, status="invalid"))
+                continue
+            rprint(f"[cyan]▶ {job.name}[/cyan]")
+            try:
+                report = _run(job.args, shared, metrics)
+            except SystemExit:
+                # e.g. no document of this job could be parsed
+                report = JobReport(
+                    job=job.name,
+                    status="failed",
+                    documents=len(job.args.docs),
+                    failed=len(job.args.docs),
+                )
+            report.job = job.name
+            reports.append(report)
+
+    _report_jobs(args, reports, shared)
+    if any(report.status != "ok" for report in reports):
+        raise SystemExit(1)
+
+
+def _needed_columns(args: CLIArgs) -> set[Col] | None:
+    """
+    Return the columns to compute for ``--columns``: the requested ones
+    plus those that ``--from``/``--to``, ``--dedupe`` and ``--summary`` read.
+    """
+    if args.columns is None:
+        return None
+    # amounts are cheap and the per-statement totals are built from them
+    needed = {*args.columns, Col.AMOUNT}
+    if args.period is not None:
+        needed.add(Col.TRANS_DATE)
+    if args.dedupe_index is not None:
+        needed.update(KEY_COLUMNS)
+    if args.summary_db is not None:
+        needed.update((Col.TRANS_DATE, *GROUP_COLUMNS))
+    return needed
+
+
+def _prune(args: CLIArgs) -> CLIArgs:
+    """
+    Drop the documents that cannot hold rows of ``args.period``.
+
+    Only the statement date on each first page is read - in ``args.workers``
+    processes - so skipped statements never reach table extraction.
+    """
+    if args.period is None:
+        return args
+
+    if args.workers > 1 and len(args.docs) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            dates = list(pool.map(read_statement_date, args.docs))
+    else:
+        dates = [read_statement_date(doc) for doc in args.docs]
+    docs = [
+        doc
+        for doc, day in zip(args.docs, dates, strict=True)
+        if args.period.may_contain(day)
+    ]
+
+    if len(docs) < len(args.docs):
+        rprint(
+            f"[cyan]⏭ Skipping {len(args.docs) - len(docs)} statement(s) "
+            f"outside {args.period}[/cyan]",
+        )
+    if not docs:
+        rprint(f"[yellow]⚠ No statement can hold rows of {args.period}[/yellow]")
+    return replace(args, docs=docs)
+
+
+def _iter_documents(  # noqa: PLR0913
+    processor: PDFProcessor,
+    args: CLIArgs,
+    checkpoint: Checkpoint,
+    failures: list[tuple[str, str]],
+    metrics: Metrics,
+    *,
+    shared: SharedParser | None = None,
+) -> Iterator[tuple[PDFSource, pd.DataFrame, StatementSummary | None]]:
+    """
+    Yield ``(document, raw rows, summary)`` in input order as documents finish.
+
+    Documents already in *checkpoint* are served from it; the others are
+    parsed (and recorded). Failed documents are appended to *failures*
+    as ``(document, error)`` pairs and skipped. Parse work, cache hits and
+    failures are counted in *metrics*.
+    """
+    # positions served from the checkpoint: its rows are handed out once,
+    # so a document listed twice is parsed again for the later occurrence
+    first_seen: dict[str, int] = {}
+    for i, doc in enumerate(args.docs):
+        if source_id(doc) in checkpoint:
+            first_seen.setdefault(source_id(doc), i)
+    resumed = set(first_seen.values())
+    pending = [x for i, x in enumerate(args.docs) if i not in resumed]
+    if resumed:
+        rprint(f"[cyan]↻ Resuming: {len(resumed)} document(s) already done[/cyan]")
+    if shared is not None:
+        for i in resumed:
+            shared.release(processor.extractor, source_id(args.docs[i]))
+
+    parsed_docs = (
+        shared.iter_pdfs(processor.extractor, pending)
+        if shared is not None
+        else processor.iter_pdfs(pending, workers=args.workers)
     )
+    for i, doc in enumerate(args.docs):
+        if i in resumed:
+            metrics.cache_hits += 1
+            yield doc, *checkpoint.take(source_id(doc))
+            continue
 
-    data.to_csv(args.out_csv)
+        parsed = next(parsed_docs)
+        if parsed.stats is not None:
+            metrics.record_parse(parsed.stats)
+        if parsed.frame is None:
+            rprint(f"[red]❌ {source_id(doc)}: {parsed.error}[/red]")
+            failures.append((source_id(doc), str(parsed.error)))
+            metrics.document_finished(failed=True)
+        else:
+            checkpoint.record(source_id(doc), parsed.frame, parsed.summary)
+            yield doc, parsed.frame, parsed.summary
+
+
+def _statement_date(doc: PDFSource, statement: StatementSummary | None) -> date | None:
+    """Statement date of *doc*, preferring the one read in the same pass as the rows."""
+    day: date | None = (
+        statement.parsed_date
+        if statement is not None and statement.statement_date
+        else read_statement_date(doc)
+    )
+    return day
+
+
+def _store_rows(
+    df: pd.DataFrame,
+    doc_id: str,
+    args: CLIArgs,
+    index: TransactionIndex | None,
+    summary: SpendSummary | None,
+) -> pd.DataFrame:
+    """
+    Apply ``--summary``, ``--from``/``--to`` and ``--dedupe`` to the
+    processed rows of one document; return the rows to write.
+    """
+    card = f"{args.card_first_digits}{args.card_last_digits}"
+    if summary is not None:
+        # the summary marks the document as counted, so it gets every row,
+        # not just those in --from/--to; rows already indexed are left out
+        summary.add(doc_id, df if index is None else df[index.unseen(df, card)])
+    if args.period is not None:
+        df = args.period.filter_rows(df)
+    if index is not None:
+        # de-duplicate document by document so repeated rows *within*
+        # one statement (legitimate identical purchases) are kept
+        df = index.drop_duplicates(df, card)
+    return df
+
+
+def _check_statement(doc_id: str, statement: StatementSummary) -> dict[str, object]:
+    """Warn when rows do not add up to the footer; return the table row."""
+    if statement.reconciled is False:
+        rprint(
+            f"[yellow]⚠ {doc_id}: transactions add up to "
+            f"{statement.transactions_total:,.2f} but the statement total is "
+            f"{statement.card_total:,.2f}[/yellow]",
+        )
+    return {
+        "document": doc_id,
+        **asdict(statement),
+        "reconciled": statement.reconciled,
+    }
+
+
+def _write_error_report(args: CLIArgs, failures: list[tuple[str, str]]) -> None:
+    """Write ``<out>.errors.csv`` for failed documents (or remove a stale one)."""
+    report = args.out_csv.with_suffix(".errors.csv")
+    report.unlink(missing_ok=True)  # stale report of an earlier run
+    if failures:
+        pd.DataFrame(failures, columns=["document", "error"]).to_csv(
+            report,
+            index=False,
+        )
+        rprint(f"[yellow]⚠ {len(failures)} document(s) failed, see {report}[/yellow]")
+
+
+def _report_jobs(
+    args: ManifestArgs,
+    reports: list[JobReport],
+    shared: SharedParser,
+) -> None:
+    """Print the per-job status table and optionally write it as JSON."""
+    table = Table(
+        "job",
+        "status",
+        "documents",
+        "failed",
+        "rows",
+        "seconds",
+        title=(
+            f"{args.manifest}: {shared.parsed} document(s) parsed, "
+            f"{shared.cache_hits} served from the shared cache"
+        ),
+    )
+    colors = {"ok": "green", "failed": "red", "invalid": "red"}
+    for r in reports:
+        table.add_row(
+            r.job,
+            f"[{colors[r.status]}]{r.status}[/{colors[r.status]}]",
+            str(r.documents),
+            str(r.failed),
+            str(r.rows),
+            f"{r.seconds:.2f}",
+        )
+    rprint(table)
+
+    if args.status_json is not None:
+        args.status_json.write_text(
+            json.dumps([asdict(r) for r in reports], indent=2),
+            encoding="utf-8",
+        )
+
+
+def _show_summary(args: SummaryArgs) -> None:
+    """Print (or write) monthly totals from a ``--summary`` store."""
+    with SpendSummary(args.summary_db) as summary:
+        totals = summary.monthly(args.by)
+
+    if args.out_csv is not None:
+        totals.to_csv(args.out_csv, index=False)
+        return
+
+    table = Table(*totals.columns, title=f"Monthly spend - {args.summary_db}")
+    for row in totals.itertuples(index=False):
+        table.add_row(*(f"{x:,.2f}" if isinstance(x, float) else str(x) for x in row))
+    rprint(table)
+
+
+def _inspect(args: InspectArgs) -> None:
+    """Check every document cheaply, print the report and the parse plan."""
+    checks = inspect_documents(args.docs, args.card, args.workers)
+    plan = Plan.from_checks(checks)
+
+    table = Table(
+        "document",
+        "pages",
+        "producer",
+        "statement date",
+        "est. seconds",
+        "status",
+        title=f"Preflight of {len(checks)} document(s)",
+    )
+    colors = {"ok": "green", "warning": "yellow", "rejected": "red"}
+    for c in checks:
+        color = colors[c.status]
+        table.add_row(
+            c.document,
+            str(c.pages),
+            c.producer or "",
+            c.statement_date.isoformat() if c.statement_date else "",
+            f"{c.estimated_seconds:.2f}",
+            f"[{color}]{c.problem or c.warning or c.status}[/{color}]",
+        )
+    rprint(table)
+    rprint(
+        f"[bold]Plan:[/bold] parse {plan.documents} document(s), "
+        f"{plan.pages} page(s), about {plan.seconds:.1f} s serially "
+        f"({plan.seconds / args.workers:.1f} s with --workers {args.workers}); "
+        f"{plan.rejected} rejected",
+    )
+
+    if args.out_csv is not None:
+        pd.DataFrame(
+            [
+                {
+                    **asdict(c),
+                    "status": c.status,
+                    "problem": c.problem or c.warning,
+                    "estimated_seconds": round(c.estimated_seconds, 3),
+                }
+                for c in checks
+            ],
+        ).to_csv(args.out_csv, index=False)
+    if plan.rejected:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+Canonical merchant names for the raw ``store_name`` column.
+
+Statements spell the same merchant in many ways - store numbers,
+truncated names, ``"AMZN Mktp"`` next to ``"AMAZON.CA"``. A merchant
+dictionary is a two-column CSV (``alias,merchant``) that
+:class:`MerchantDictionary` compiles once into a binary index: aliases
+sorted for prefix lookups plus a trigram index for fuzzy matches. The
+index is memory-mapped on first use, so opening a large dictionary costs
+nothing until a name is looked up, and every distinct name is resolved
+only once.
+"""
+
+import bisect
+import csv
+import mmap
+import re
+import struct
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Any, Final
+
+import numpy as np
+import pandas as pd
+
+INDEX_SUFFIX: Final = ".mdx"
+MIN_PREFIX: Final = 4  # shortest truncated name matched against longer aliases
+MIN_SCORE: Final = 0.6  # trigram Dice similarity needed for a fuzzy match
+
+_MAGIC: Final = b"MDX1"
+_HEADER: Final[struct.Struct] = struct.Struct("<4sIIII")
+_ALIAS: Final[struct.Struct] = struct.Struct("<IHHI")  # offset, len, grams, id
+_MERCHANT: Final[struct.Struct] = struct.Struct("<IH")  # offset, len
+_GRAM: Final[struct.Struct] = struct.Struct("<3sII")  # gram, first posting, count
+_POSTING: Final[struct.Struct] = struct.Struct("<I")  # alias number
+_PREFIX_SCAN: Final = 64  # aliases inspected for a truncated name
+_NON_ALNUM_RE: Final[re.Pattern[str]] = re.compile(r"[^0-9A-Z]+")
+
+
+class MerchantDictionary:
+    """
+    Lazily memory-mapped ``alias -> merchant`` index.
+
+    A name is resolved in three steps: the longest alias that is a
+    word-prefix of the name (``"AMZN MKTP CA"`` -> ``"AMZN MKTP"``), then a
+    single merchant among aliases that start with a truncated name
+    (``"TIM HORTO"``), then the alias sharing the most trigrams.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        min_score: float = MIN_SCORE,
+        *,
+        write_index: bool = True,
+    ) -> None:
+        """
+        Initialize the dictionary without reading *path* yet.
+
+        Args:
+            path (Path): ``alias,merchant`` CSV (compiled to a sibling
+                ``*.mdx`` file when that is missing or older) or an index
+                built by :func:`build_index`.
+            min_score (float): Trigram similarity in ``[0, 1]`` required for
+                a fuzzy match.
+            write_index (bool): ``False`` compiles a CSV without an
+                up-to-date ``*.mdx`` in memory instead of writing the file.
+        """
+        self.path = path
+        self.min_score = min_score
+        self.write_index = write_index
+        self._map: mmap.mmap | None = None
+        self._cache: dict[str, str | None] = {}
+        self._counts = (0, 0, 0)
+        self._offsets = (0, 0, 0, 0, 0)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle only the settings; worker processes map the index again."""
+        return {
+            "path": self.path,
+            "min_score": self.min_score,
+            "write_index": self.write_index,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a dictionary pickled by :meth:`__getstate__`."""
+        self.__init__(  # type: ignore[misc]
+            state["path"],
+            state["min_score"],
+            write_index=state["write_index"],
+        )
+
+    def lookup(self, name: str) -> str | None:
+        """
+        Return the canonical merchant for *name*, or ``None`` if unknown.
+
+        Results are memoized, so repeated names cost one dictionary hit.
+        """
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        key = normalize_name(name)
+        merchant = self._resolve(key) if key else None
+        self._cache[name] = merchant
+        return merchant
+
+    def canonicalize(self, names: pd.Series) -> pd.Series:
+        """
+        Replace every known name in *names* by its canonical merchant.
+
+        Each distinct value is looked up once; unknown names are kept.
+        """
+        codes, uniques = pd.factorize(names)
+        if not len(uniques):
+            return names
+        resolved = np.array(
+            [self.lookup(str(name)) or name for name in uniques],
+            dtype=object,
+        )
+        return pd.Series(
+            np.where(codes >= 0, resolved[codes], names.to_numpy()),
+            index=names.index,
+        )
+
+    def close(self) -> None:
+        """Unmap the index; the next lookup maps it again."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    # ------------------------------------------------------------------ #
+    # Index access                                                       #
+    # ------------------------------------------------------------------ #
+    def _open(self) -> mmap.mmap:
+        if self._map is not None:
+            return self._map
+
+        index = self.path
+        if self.path.suffix.lower() == ".csv":
+            index = self.path.with_suffix(INDEX_SUFFIX)
+            if not index.is_file() or index.stat().st_mtime < self.path.stat().st_mtime:
+                if not self.write_index:
+                    return self._attach(_in_memory(compile_index(self.path)), index)
+                build_index(self.path, index)
+
+        with index.open("rb") as fp:
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._attach(data, index)
+
+    def _attach(self, data: mmap.mmap, index: Path) -> mmap.mmap:
+        magic, aliases, merchants, grams, postings = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            data.close()
+            msg = f"{index} is not a merchant dictionary index."
+            raise ValueError(msg)
+
+        alias_at = _HEADER.size
+        merchant_at = alias_at + aliases * _ALIAS.size
+        gram_at = merchant_at + merchants * _MERCHANT.size
+        posting_at = gram_at + grams * _GRAM.size
+        text_at = posting_at + postings * _POSTING.size
+        self._counts = (aliases, merchants, grams)
+        self._offsets = (alias_at, merchant_at, gram_at, posting_at, text_at)
+        self._map = data
+        return data
+
+    def _record(self, record: struct.Struct, section: int, i: int) -> tuple[Any, ...]:
+        return record.unpack_from(
+            self._open(),
+            self._offsets[section] + i * record.size,
+        )
+
+    def _bytes(self, start: int, length: int) -> bytes:
+        return self._open()[start : start + length]
+
+    def _alias(self, i: int) -> tuple[bytes, int, int]:
+        offset, length, grams, merchant = self._record(_ALIAS, 0, i)
+        return self._bytes(self._offsets[4] + offset, length), grams, merchant
+
+    def _alias_text(self, i: int) -> bytes:
+        return self._alias(i)[0]
+
+    def _merchant(self, merchant: int) -> str:
+        offset, length = self._record(_MERCHANT, 1, merchant)
+        return self._bytes(self._offsets[4] + offset, length).decode()
+
+    def _gram_text(self, i: int) -> bytes:
+        gram: bytes = self._record(_GRAM, 2, i)[0]
+        return gram
+
+    def _postings(self, gram: bytes) -> list[int]:
+        count = self._counts[2]
+        i = bisect.bisect_left(range(count), gram, key=self._gram_text)
+        if i == count or self._gram_text(i) != gram:
+            return []
+        _, first, n = self._record(_GRAM, 2, i)
+        data = self._bytes(self._offsets[3] + first * _POSTING.size, n * _POSTING.size)
+        return [alias for (alias,) in _POSTING.iter_unpack(data)]
+
+    # ------------------------------------------------------------------ #
+    # Matching                                                           #
+    # ------------------------------------------------------------------ #
+    def _resolve(self, key: str) -> str | None:
+        self._open()
+        merchant = self._by_prefix(key.encode())
+        if merchant is None:
+            merchant = self._by_trigrams(key)
+        return None if merchant is None else self._merchant(merchant)
+
+    def _by_prefix(self, key: bytes) -> int | None:
+        aliases = self._counts[0]
+
+        # longest alias that is a whole-word prefix of the name
+        words = key.split(b" ")
+        for n in range(len(words), 0, -1):
+            prefix = b" ".join(words[:n])
+            i = bisect.bisect_left(range(aliases), prefix, key=self._alias_text)
+            if i < aliases and self._alias_text(i) == prefix:
+                return self._alias(i)[2]
+
+        # a truncated name: every alias starting with it names one merchant
+        if len(key) < MIN_PREFIX:
+            return None
+        i = bisect.bisect_left(range(aliases), key, key=self._alias_text)
+        found: set[int] = set()
+        for j in range(i, min(i + _PREFIX_SCAN, aliases)):
+            text, _, merchant = self._alias(j)
+            if not text.startswith(key):
+                break
+            found.add(merchant)
+        return found.pop() if len(found) == 1 else None
+
+    def _by_trigrams(self, key: str) -> int | None:
+        grams = _trigrams(key)
+        hits: Counter[int] = Counter()
+        for gram in grams:
+            hits.update(self._postings(gram))
+
+        best, best_score = None, self.min_score
+        for alias, shared in hits.items():
+            _, alias_grams, merchant = self._alias(alias)
+            score = 2 * shared / (len(grams) + alias_grams)
+            if score >= best_score:
+                best, best_score = merchant, score
+        return best
+
+
+def normalize_name(name: str) -> str:
+    """Fold *name* to upper-case ASCII words: ``"Amazon.ca"`` -> ``"AMAZON CA"``."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore")
+    return _NON_ALNUM_RE.sub(" ", ascii_name.decode().upper()).strip()
+
+
+def build_index(source: Path, target: Path) -> None:
+    """
+    Compile the ``alias,merchant`` CSV *source* into the index *target*.
+
+    The file is written atomically.
+
+    Raises:
+        ValueError: When one alias names two different merchants.
+    """
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(compile_index(source))
+    tmp.replace(target)
+
+
+def compile_index(source: Path) -> bytes:
+    """
+    Return the index of the ``alias,merchant`` CSV *source*.
+
+    Every merchant is also an alias of itself.
+
+    Raises:
+        ValueError: When one alias names two different merchants.
+    """
+    aliases: dict[bytes, str] = {}
+    with source.open(encoding="utf-8", newline="") as fp:
+        for row in csv.DictReader(fp):
+            merchant = row["merchant"].strip()
+            for name in (row["alias"], merchant):
+                key = normalize_name(name).encode()
+                if not key:
+                    continue
+                if aliases.setdefault(key, merchant) != merchant:
+                    msg = (
+                        f"{source}: alias {name!r} maps to both "
+                        f"{aliases[key]!r} and {merchant!r}."
+                    )
+                    raise ValueError(msg)
+
+    merchants = sorted(set(aliases.values()))
+    merchant_ids = {name: i for i, name in enumerate(merchants)}
+    keys = sorted(aliases)
+
+    text = bytearray()
+    alias_records: list[bytes] = []
+    postings: dict[bytes, list[int]] = {}
+    for i, key in enumerate(keys):
+        grams = _trigrams(key.decode())
+        for gram in grams:
+            postings.setdefault(gram, []).append(i)
+        alias_records.append(
+            _ALIAS.pack(len(text), len(key), len(grams), merchant_ids[aliases[key]]),
+        )
+        text += key
+
+    merchant_records = []
+    for name in merchants:
+        encoded = name.encode()
+        merchant_records.append(_MERCHANT.pack(len(text), len(encoded)))
+        text += encoded
+
+    gram_records: list[bytes] = []
+    posting_records: list[bytes] = []
+    for gram in sorted(postings):
+        gram_records.append(
+            _GRAM.pack(gram, len(posting_records), len(postings[gram])),
+        )
+        posting_records.extend(_POSTING.pack(i) for i in postings[gram])
+
+    header = _HEADER.pack(
+        _MAGIC,
+        len(alias_records),
+        len(merchant_records),
+        len(gram_records),
+        len(posting_records),
+    )
+    return b"".join(
+        [
+            header,
+            *alias_records,
+            *merchant_records,
+            *gram_records,
+            *posting_records,
+            text,
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _in_memory(data: bytes) -> mmap.mmap:
+    """Copy *data* into an anonymous map, so lookups read it like an index file."""
+    mapped = mmap.mmap(-1, len(data))
+    mapped.write(data)
+    return mapped
+
+
+def _trigrams(key: str) -> set[bytes]:
+    """Distinct 3-byte grams of *key*, padded so short words still match."""
+    padded = f" {key} ".encode()
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
@@ -0,0 +1,276 @@
+"""
+Live progress and exportable throughput metrics for long batches.
+
+:class:`Metrics` counts documents, pages, rows, cache hits and anchor
+failures, and keeps a latency histogram per pipeline stage. While a run
+is in progress it drives a ``rich`` progress bar (documents, pages,
+rows per second and ETA) and periodically rewrites a metrics file - a
+Prometheus textfile (for node_exporter's textfile collector) or JSON -
+that a scheduler can alert on.
+"""
+
+import json
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from rich import get_console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    ProgressColumn,
+    Task,
+    TaskID,
+    TextColumn,
+    TimeRemainingColumn,
+)
+from rich.text import Text
+
+from pdf_processor import ParseStats
+
+PREFIX: Final = "cibc_parser"
+STAGES: Final[tuple[str, ...]] = ("parse", "extract", "process", "write")
+BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_COUNTERS: Final[dict[str, str]] = {
+    "documents_done": "Documents finished, parsed or failed",
+    "documents_failed": "Documents that could not be parsed",
+    "pages_parsed": "Pages searched for transaction tables",
+    "pages_skipped": "Pages not searched for transaction tables",
+    "cache_hits": "Documents served without parsing them again",
+    "page_cache_hits": "Pages served from the page store without layout",
+    "anchor_failures": "Pages with a transactions header but no table for a card",
+    "rows": "Transaction rows written",
+}
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus style."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * len(BUCKETS))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, seconds: float) -> None:
+        """Add one observation of *seconds*."""
+        i = bisect_left(BUCKETS, seconds)
+        if i < len(BUCKETS):
+            self.counts[i] += 1
+        self.total += seconds
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return ``(le, count)`` pairs including ``+Inf``."""
+        pairs, running = [], 0
+        for bound, n in zip(BUCKETS, self.counts, strict=True):
+            running += n
+            pairs.append((f"{bound:g}", running))
+        return [*pairs, ("+Inf", self.count)]
+
+
+class Metrics:
+    """
+    Counters and stage histograms of one process, plus their live view.
+
+    Counter attributes are plain integers; call :meth:`document_finished`
+    once per document so the progress bar and the metrics file follow.
+    """
+
+    def __init__(self, path: Path | None = None, interval: float = 5.0) -> None:
+        """
+        Initialize empty metrics.
+
+        Args:
+            path (Path | None): Export file - ``*.json`` for JSON, anything
+                else (e.g. ``*.prom``) for the Prometheus text format.
+            interval (float): Minimum seconds between two exports while the
+                run is in progress.
+        """
+        self.path = path
+        self.interval = interval
+        self.documents = 0  # documents planned
+        self.documents_done = 0
+        self.documents_failed = 0
+        self.pages_parsed = 0
+        self.pages_skipped = 0
+        self.cache_hits = 0
+        self.page_cache_hits = 0
+        self.anchor_failures = 0
+        self.rows = 0
+        self.stages = {stage: Histogram() for stage in STAGES}
+        self.started = time.time()
+        self._exported: float | None = None  # monotonic time of last export
+        self._progress: Progress | None = None
+        self._task: TaskID | None = None
+        self._base = (0, 0)  # pages and rows before the live view started
+
+    # ------------------------------------------------------------------ #
+    # Recording                                                          #
+    # ------------------------------------------------------------------ #
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record one latency sample of *stage*."""
+        self.stages[stage].observe(seconds)
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Time the ``with`` body as one sample of *stage*."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def record_parse(self, stats: ParseStats) -> None:
+        """Fold the work reported by one document parse into the totals."""
+        self.pages_parsed += stats.pages_parsed
+        self.pages_skipped += stats.pages_skipped
+        self.page_cache_hits += stats.page_cache_hits
+        self.anchor_failures += stats.anchor_failures
+        self.observe("parse", stats.parse_seconds)
+        for seconds in stats.page_seconds:
+            self.observe("extract", seconds)
+
+    def document_finished(self, *, rows: int = 0, failed: bool = False) -> None:
+        """Count one finished document, refresh the display and the export."""
+        self.documents_done += 1
+        self.documents_failed += failed
+        self.rows += rows
+        if self._progress is not None and self._task is not None:
+            self._progress.update(
+                self._task,
+                advance=1,
+                pages=self.pages_parsed - self._base[0],
+                rows=self.rows - self._base[1],
+            )
+        if self._exported is None or time.monotonic() - self._exported >= self.interval:
+            self.export()
+
+    # ------------------------------------------------------------------ #
+    # Live view                                                          #
+    # ------------------------------------------------------------------ #
+    @contextmanager
+    def live(self, documents: int, description: str = "Parsing") -> Iterator[None]:
+        """
+        Show a progress bar for *documents* more documents while in the body.
+
+        The bar is only drawn on a terminal; the metrics file is written
+        when the body ends, however it ends.
+        """
+        self.documents += documents
+        progress = Progress(
+            TextColumn("[bold]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("docs · {task.fields[pages]} pages ·"),
+            _RowRateColumn(),
+            TimeRemainingColumn(),
+            disable=not get_console().is_terminal,
+        )
+        self._progress = progress
+        self._base = (self.pages_parsed, self.rows)
+        self._task = progress.add_task(description, total=documents, pages=0, rows=0)
+        try:
+            with progress:
+                yield
+        finally:
+            self._progress = self._task = None
+            self.export()
+
+    # ------------------------------------------------------------------ #
+    # Export                                                             #
+    # ------------------------------------------------------------------ #
+    def as_dict(self) -> dict[str, Any]:
+        """Return every counter, the throughput and the stage histograms."""
+        elapsed = max(time.time() - self.started, 1e-9)
+        return {
+            "documents": self.documents,
+            **{name: getattr(self, name) for name in _COUNTERS},
+            "rows_per_second": round(self.rows / elapsed, 3),
+            "elapsed_seconds": round(elapsed, 3),
+            "updated": round(time.time(), 3),
+            "stages": {
+                stage: {
+                    "count": h.count,
+                    "sum": round(h.total, 6),
+                    "buckets": dict(h.cumulative()),
+                }
+                for stage, h in self.stages.items()
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        data = self.as_dict()
+        lines = [
+            f"# HELP {PREFIX}_documents Documents planned for this run",
+            f"# TYPE {PREFIX}_documents gauge",
+            f"{PREFIX}_documents {data['documents']}",
+        ]
+        for name, text in _COUNTERS.items():
+            lines += [
+                f"# HELP {PREFIX}_{name}_total {text}",
+                f"# TYPE {PREFIX}_{name}_total counter",
+                f"{PREFIX}_{name}_total {data[name]}",
+            ]
+        lines += [
+            f"# HELP {PREFIX}_rows_per_second Rows written per second since start",
+            f"# TYPE {PREFIX}_rows_per_second gauge",
+            f"{PREFIX}_rows_per_second {data['rows_per_second']}",
+            f"# HELP {PREFIX}_last_update_seconds Unix time of this export",
+            f"# TYPE {PREFIX}_last_update_seconds gauge",
+            f"{PREFIX}_last_update_seconds {data['updated']}",
+            f"# HELP {PREFIX}_stage_seconds Latency of each pipeline stage",
+            f"# TYPE {PREFIX}_stage_seconds histogram",
+        ]
+        for stage, h in self.stages.items():
+            lines += [
+                f'{PREFIX}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {n}'
+                for le, n in h.cumulative()
+            ]
+            lines += [
+                f'{PREFIX}_stage_seconds_sum{{stage="{stage}"}} {h.total:.6f}',
+                f'{PREFIX}_stage_seconds_count{{stage="{stage}"}} {h.count}',
+            ]
+        return "\n".join(lines) + "\n"
+
+    def export(self) -> None:
+        """Atomically rewrite :attr:`path` (no-op without one)."""
+        self._exported = time.monotonic()
+        if self.path is None:
+            return
+        text = (
+            json.dumps(self.as_dict(), indent=2)
+            if self.path.suffix.lower() == ".json"
+            else self.to_prometheus()
+        )
+        # collectors must never read a half-written file
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(self.path)
+
+
+class _RowRateColumn(ProgressColumn):
+    """Rows written per second of the task."""
+
+    def render(self, task: Task) -> Text:
+        elapsed = task.elapsed or 0.0
+        rate = task.fields["rows"] / elapsed if elapsed else 0.0
+        return Text(f"{rate:,.0f} rows/s", style="progress.data.speed")
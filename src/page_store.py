@@ -0,0 +1,190 @@
+"""
+Persistent store of extracted rows keyed by page content.
+
+Corrected or re-issued statements repeat most pages byte for byte.
+:func:`page_fingerprint` hashes a page's raw content streams (plus its
+size, fonts and form XObjects) *before* any layout work, and :class:`PageStore` maps
+``(fingerprint, card)`` to the table and footer total extracted from it,
+so an identical page - in the same batch or a later run - is served from
+the store instead of being laid out and parsed again.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Final
+
+import pandas as pd
+from pdfminer.pdftypes import PDFObjRef, PDFStream, resolve1
+from pdfplumber.page import Page
+
+from constants.table_headers import Col
+
+_SCHEMA: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS pages (
+    fingerprint BLOB NOT NULL,
+    card        TEXT NOT NULL,
+    columns     TEXT NOT NULL,
+    rows        TEXT NOT NULL,
+    total       REAL,
+    PRIMARY KEY (fingerprint, card)
+);
+"""
+
+
+def page_fingerprint(page: Page) -> bytes:
+    """
+    Return a 16-byte digest of what *page* draws, without laying it out.
+
+    The digest covers the decoded content streams, the media box and
+    everything the page's resources reach: font names and, recursively,
+    the streams and resources of the XObjects (forms) the page draws with
+    ``Do`` - everything word extraction depends on.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(page.mediabox).encode())
+    _hash_resources(digest, page.page_obj.resources, set())
+    for stream in page.page_obj.contents:
+        _hash_bytes(digest, resolve1(stream).get_data())
+    return digest.digest()
+
+
+def _hash_resources(
+    digest: "hashlib.blake2b",
+    resources: object,
+    seen: set[int],
+) -> None:
+    """Feed the fonts and XObjects of a resource dictionary into *digest*."""
+    resources = resolve1(resources) or {}
+    fonts = resolve1(resources.get("Font")) or {}
+    for name in sorted(fonts):
+        base_font = resolve1(fonts[name]).get("BaseFont")
+        digest.update(f"font {name}={base_font}\n".encode())
+
+    xobjects = resolve1(resources.get("XObject")) or {}
+    for name in sorted(xobjects):
+        ref = xobjects[name]
+        digest.update(f"xobject {name}\n".encode())
+        if isinstance(ref, PDFObjRef):
+            if ref.objid in seen:  # drawn again, or a reference cycle
+                digest.update(f"ref {ref.objid}\n".encode())
+                continue
+            seen.add(ref.objid)
+        xobject = resolve1(ref)
+        if not isinstance(xobject, PDFStream):
+            continue
+        for key in ("Subtype", "BBox", "Matrix", "Width", "Height"):
+            digest.update(f"{key}={resolve1(xobject.get(key))}\n".encode())
+        _hash_bytes(digest, xobject.get_data())
+        _hash_resources(digest, xobject.get("Resources"), seen)
+
+
+def _hash_bytes(digest: "hashlib.blake2b", data: bytes) -> None:
+    digest.update(len(data).to_bytes(8, "little"))
+    digest.update(data)
+
+
+class PageStore:
+    """
+    SQLite-backed ``(fingerprint, card) -> (rows, total)`` store.
+
+    Safe to share between worker processes and threads: each thread of
+    each process opens its own connection on first use, and every new page
+    is committed right away.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the store without opening *path* yet.
+
+        Args:
+            path (Path): SQLite file, e.g. ``statements_data.pages.sqlite``.
+        """
+        self.path = path
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle only the path; connections are opened per process."""
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a store pickled by :meth:`__getstate__`."""
+        self.__init__(state["path"])  # type: ignore[misc]
+
+    def get(
+        self,
+        fingerprint: bytes,
+        card: str,
+    ) -> tuple[pd.DataFrame, float | None] | None:
+        """Return the rows and footer total stored for the page, or ``None``."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT columns, rows, total FROM pages "
+                "WHERE fingerprint = ? AND card = ?",
+                (fingerprint, card),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        columns, rows, total = row
+        frame = pd.DataFrame(
+            json.loads(rows),
+            columns=[Col(c) for c in json.loads(columns)],
+        )
+        return frame, total
+
+    def put(
+        self,
+        fingerprint: bytes,
+        card: str,
+        frame: pd.DataFrame,
+        total: float | None,
+    ) -> None:
+        """Remember what was extracted from the page for *card*."""
+        values = frame.astype(object).where(frame.notna(), None)
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (
+                    fingerprint,
+                    card,
+                    json.dumps([str(Col(c).value) for c in frame.columns]),
+                    json.dumps(values.to_numpy().tolist()),
+                    total,
+                ),
+            )
+
+    def __len__(self) -> int:
+        """Return the number of stored ``(page, card)`` entries."""
+        (count,) = self._connect().execute("SELECT COUNT(*) FROM pages").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close this process's connections; the next call reopens one."""
+        with self._lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+            self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            # closed by close(), possibly from another thread
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            # readers in other workers never block on a writer
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
@@ -5,15 +5,125 @@ This script processes PDF statement file
 with one or multiple statement tables and combines the results.
 """
 
+import time
+from collections.abc import Collection, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pdfplumber
+from pdfplumber.page import Page
 
+from archive_reader import ArchiveMember
 from constants.keywords import UNKNOWN
 from constants.provinces import PROVINCES
-from constants.regexps import ASCII_WORD_RE, STATEMENT_DATE_RE, STORE_NAME_RE
-from constants.table_headers import Col
+from constants.regexps import (
+    ASCII_WORD_RE,
+    PAYMENTS_RE,
+    PREVIOUS_BALANCE_RE,
+    STATEMENT_DATE_RE,
+    STORE_NAME_RE,
+)
+from constants.table_headers import (
+    DERIVED_COLUMNS,
+    DERIVED_INPUTS,
+    OUTPUT_COLUMNS,
+    RAW_COLUMNS,
+    Col,
+)
+from date_range import parse_statement_date
+from merchant_dictionary import MerchantDictionary
+from page_store import PageStore, page_fingerprint
+from pdf_source import PDFSource, as_stream
 from table_extractor import TableExtractor
+from utils import parse_amount
+
+# amounts closer than half a cent are considered equal
+RECONCILE_TOLERANCE = 0.005
+
+
+@dataclass(slots=True, frozen=True)
+class StatementSummary:
+    """
+    Statement-level figures read in the same pass as the transactions.
+
+    ``statement_date``, ``previous_balance`` and ``payments`` come from the
+    first page, ``card_total`` from the ``Total for <card>`` table footer.
+    Fields are ``None`` when not printed on the statement.
+    """
+
+    statement_date: str | None = None
+    previous_balance: float | None = None
+    payments: float | None = None
+    card_total: float | None = None
+    transactions_total: float = 0.0
+    rows: int = 0
+
+    @property
+    def parsed_date(self) -> date | None:
+        """The statement date, or ``None`` when missing or unreadable."""
+        return (
+            parse_statement_date(self.statement_date) if self.statement_date else None
+        )
+
+    @property
+    def reconciled(self) -> bool | None:
+        """Whether parsed amounts add up to the footer total (``None``: no footer)."""
+        if self.card_total is None:
+            return None
+        return abs(self.transactions_total - self.card_total) < RECONCILE_TOLERANCE
+
+
+@dataclass(slots=True)
+class ParseStats:
+    """
+    Work done while parsing one document, for progress and metrics.
+
+    ``anchor_failures`` counts pages that have the transactions column
+    headers but no table for a card, whose anchors did not match; pages
+    without a table, such as the cover or the legal notes, are not failures.
+    ``page_seconds`` holds the extraction time of
+    every parsed page. Pages served whole from a :class:`PageStore` count
+    as ``page_cache_hits`` instead of ``pages_parsed``.
+    """
+
+    pages_parsed: int = 0
+    pages_skipped: int = 0
+    page_cache_hits: int = 0
+    anchor_failures: int = 0
+    parse_seconds: float = 0.0
+    page_seconds: list[float] = field(default_factory=list)
+
+    def add_page(self, page: "_PageResult") -> None:
+        """Count one page after every card has read its table from it."""
+        if page.table_header:
+            self.anchor_failures += sum(df.columns.empty for df in page.frames)
+        if page.laid_out:
+            self.pages_parsed += 1
+            self.page_seconds.append(page.seconds)
+        else:
+            self.page_cache_hits += 1
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedDocument:
+    """
+    Outcome of parsing a single document.
+
+    Exactly one of :attr:`frame` (raw statement rows) and :attr:`error`
+    (``"<ExceptionType>: <message>"``) is set; :attr:`summary` accompanies
+    a successfully parsed frame. :attr:`stats` is attached to the first
+    card's result only, so a document shared by several cards is counted
+    once.
+    """
+
+    frame: pd.DataFrame | None = None
+    error: str | None = None
+    summary: StatementSummary | None = None
+    stats: ParseStats | None = None
 
 
 class PDFProcessor:
@@ -23,50 +133,130 @@ class PDFProcessor:
     Get statements data from one or more pages.
     """
 
-    def __init__(self, card_first_four: str, card_last_four: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        card_first_four: str,
+        card_last_four: str,
+        merchants: MerchantDictionary | None = None,
+        *,
+        page_store: PageStore | None = None,
+        threads: int = 1,
+        columns: Collection[Col] | None = None,
+    ) -> None:
         """
         Initialize the PDFProcessor.
 
         Args:
             card_first_four (str): First four digits of the card number.
             card_last_four (str): Last four digits of the card number.
+            merchants (MerchantDictionary | None): Optional dictionary that
+                maps raw store names to canonical merchants.
+            page_store (PageStore | None): Optional store that serves pages
+                already extracted, in this run or an earlier one.
+            threads (int): Lay out the pages of each document in this many
+                threads (``1``: serially). Pays off on free-threaded builds.
+            columns (Collection[Col] | None): Columns to produce; ``None``
+                for all. Raw columns are only assembled, and derived ones
+                only computed, when they or a derived column need them.
         """
-        self.extractor = TableExtractor(card_first_four, card_last_four)
+        self.columns: tuple[Col, ...] | None = (
+            None
+            if columns is None
+            else tuple(c for c in OUTPUT_COLUMNS if c in columns)
+        )
+        self.extractor = TableExtractor(
+            card_first_four,
+            card_last_four,
+            _raw_columns(self.columns),
+        )
+        self.merchants = merchants
+        self.page_store = page_store
+        self.threads = threads
 
-    def process_pdf(self, pdf_path: str) -> pd.DataFrame:
+    def process_pdf(self, pdf_path: PDFSource) -> pd.DataFrame:
         """
         Process the PDF file and extract statements data.
 
         Args:
-            pdf_path (str): Path to the PDF file.
+            pdf_path (PDFSource): Path to the PDF file, its bytes, a binary
+                file-like object or an ``mmap``.
 
         Returns:
             pd.DataFrame: DataFrame containing the extracted statement data.
         """
-        frames: list[pd.DataFrame] = []
-        from_page: int = 1  # statements data usually starts from page 2 (index 1)
+        return self.process_statement(pdf_path)[0]
+
+    def process_statement(
+        self,
+        pdf_path: PDFSource,
+    ) -> tuple[pd.DataFrame, StatementSummary]:
+        """
+        Extract transactions *and* statement summary in a single pass.
 
-        with pdfplumber.open(pdf_path) as pdf:
+        Args:
+            pdf_path (PDFSource): Path to the PDF file, its bytes, a binary
+                file-like object or an ``mmap``.
 
-            for page in pdf.pages[from_page:]:
-                df = self.extractor.extract_table_data(page)
-                frames.append(df)
+        Returns:
+            tuple[pd.DataFrame, StatementSummary]: Raw transaction rows (as
+            :meth:`process_pdf`) and the statement-level figures.
+        """
+        return parse_statement(
+            pdf_path,
+            [self.extractor],
+            store=self.page_store,
+            threads=self.threads,
+        )[0]
+
+    def iter_pdfs(
+        self,
+        sources: Sequence[PDFSource],
+        workers: int = 1,
+    ) -> Iterator[ParsedDocument]:
+        """
+        Parse *sources* one by one, isolating failures per document.
+
+        A malformed PDF yields a :class:`ParsedDocument` with ``error`` set
+        instead of aborting the whole batch.
 
-        return pd.concat(frames, ignore_index=True)
+        Args:
+            sources (Sequence[PDFSource]): Documents to parse.
+            workers (int): Number of worker processes; ``1`` parses serially.
 
-    def get_year_from_first_page(self, pdf_path: str) -> str:
+        Yields:
+            ParsedDocument: One result per source, in input order, as soon
+            as it (and every document before it) is finished.
+        """
+        if workers <= 1 or len(sources) <= 1:
+            yield from map(self.try_process_pdf, sources)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(sources))) as pool:
+            yield from pool.map(self.try_process_pdf, map(_picklable, sources))
+
+    def try_process_pdf(self, pdf_path: PDFSource) -> ParsedDocument:
+        """Run :meth:`process_statement`, capturing any exception as an error."""
+        return try_parse_statement(
+            pdf_path,
+            [self.extractor],
+            self.page_store,
+            self.threads,
+        )[0]
+
+    def get_year_from_first_page(self, pdf_path: PDFSource) -> str:
         """
         Extract the year from the first page of the PDF.
 
         Args:
-            pdf_path (str): Path to the PDF file.
+            pdf_path (PDFSource): Path to the PDF file, its bytes, a binary
+                file-like object or an ``mmap``.
 
         Returns:
             str: Year extracted from the first page.
         """
         # TODO @mignatko: get default year from command line args
         year = "2000"  # default year
-        with pdfplumber.open(pdf_path) as pdf:
+        with pdfplumber.open(as_stream(pdf_path)) as pdf:
             if not pdf.pages:
                 return year
 
@@ -78,7 +268,12 @@ class PDFProcessor:
 
         return year
 
-    def process_dataframe(self, df: pd.DataFrame, year: str) -> pd.DataFrame:
+    def process_dataframe(
+        self,
+        df: pd.DataFrame,
+        year: str,
+        statement_month: int | None = None,
+    ) -> pd.DataFrame:
         """
         Clean amounts, parse dates, and delegate to the “description” enricher.
 
@@ -87,7 +282,11 @@ class PDFProcessor:
         df : pd.DataFrame
             Raw statement rows.
         year : str
-            Calendar year that belongs to every *string* date in `df`.
+            Year of the statement the *string* dates in `df` come from.
+        statement_month : int | None
+            Month of the statement date. Rows of a later month belong to
+            the year before (a January statement lists December purchases);
+            ``None`` dates every row in `year`.
 
         Returns
         -------
@@ -96,13 +295,18 @@ class PDFProcessor:
         """
         if df.empty:
             return df
+        if self.extractor.columns is not None:
+            # e.g. rows parsed once for several jobs carry every raw column
+            df = df[[c for c in df.columns if c in self.extractor.columns]]
 
-        df[Col.AMOUNT] = pd.to_numeric(df[Col.AMOUNT], errors="coerce")
+        if Col.AMOUNT in df.columns:
+            df[Col.AMOUNT] = pd.to_numeric(df[Col.AMOUNT], errors="coerce")
 
-        _parse_dates(df, Col.TRANS_DATE, year)
-        _parse_dates(df, Col.POST_DATE, year)
+        for col in (Col.TRANS_DATE, Col.POST_DATE):
+            if col in df.columns:
+                _parse_dates(df, col, year, statement_month)
 
-        _clean_text(df, [Col.DESCRIPTION, Col.CATEGORY])
+        _clean_text(df, [c for c in (Col.DESCRIPTION, Col.CATEGORY) if c in df.columns])
 
         return self.process_dataframe_description(df)
 
@@ -111,50 +315,183 @@ class PDFProcessor:
         Add **province**, **city**, and **store_name** columns.
 
         The rules are the same as in the original implementation but executed
-        in a single vectorised step for readability and speed.
+        in a single vectorised step for readability and speed. With a
+        merchant dictionary, known store names are replaced by the canonical
+        merchant. Only the derived columns in :attr:`columns` are computed.
         """
-        if df.empty:
+        wanted = [
+            c for c in DERIVED_COLUMNS if self.columns is None or c in self.columns
+        ]
+        if df.empty or not wanted:
             return df
 
         descr = df[Col.DESCRIPTION].astype(str).str.strip()
 
         has_at = descr.str.contains("@", na=False)
         is_refund = df[Col.AMOUNT] < 0.0
-        is_prime = descr.str.contains("Prime Member", na=False)
-
-        prov_extracted = descr.str[-2:]
-        province = np.where(
-            has_at | is_refund | is_prime,
-            UNKNOWN,
-            np.where(prov_extracted.isin(PROVINCES), prov_extracted, UNKNOWN),
+        derived: dict[Col, object] = {}
+
+        if Col.PROVINCE in wanted or Col.CITY in wanted:
+            is_prime = descr.str.contains("Prime Member", na=False)
+            prov_extracted = descr.str[-2:]
+            province = np.where(
+                has_at | is_refund | is_prime,
+                UNKNOWN,
+                np.where(prov_extracted.isin(PROVINCES), prov_extracted, UNKNOWN),
+            )
+            derived[Col.PROVINCE] = province
+
+            if Col.CITY in wanted:
+                second_last_token = descr.str.split().str[-2]
+                token_is_word = second_last_token.str.match(ASCII_WORD_RE, na=False)
+                derived[Col.CITY] = np.where(
+                    province != UNKNOWN,
+                    np.where(token_is_word, second_last_token, UNKNOWN),
+                    UNKNOWN,
+                )
+
+        if Col.STORE_NAME in wanted:
+            derived[Col.STORE_NAME] = self._store_names(descr, has_at, is_refund)
+
+        df[wanted] = pd.DataFrame(
+            {col: derived[col] for col in wanted},
+            index=df.index,
         )
 
-        second_last_token = descr.str.split().str[-2]
-        token_is_word = second_last_token.str.match(ASCII_WORD_RE, na=False)
-
-        city = np.where(
-            province != UNKNOWN,
-            np.where(token_is_word, second_last_token, UNKNOWN),
-            UNKNOWN,
-        )
+        return df
 
+    def _store_names(
+        self,
+        descr: pd.Series,
+        has_at: pd.Series,
+        is_refund: pd.Series,
+    ) -> pd.Series:
+        """Return the store name of every description (``UNKNOWN`` for refunds)."""
         store_name_base = descr.str.extract(STORE_NAME_RE, expand=False).str.strip()
-        store_name = np.select(
-            [has_at, is_refund],
-            [store_name_base, UNKNOWN],
-            default=store_name_base,
+        store_name = pd.Series(
+            np.select(
+                [has_at, is_refund],
+                [store_name_base, UNKNOWN],
+                default=store_name_base,
+            ),
+            index=descr.index,
         )
-
-        df[[Col.PROVINCE, Col.CITY, Col.STORE_NAME]] = pd.DataFrame(
-            {
-                Col.PROVINCE: province,
-                Col.CITY: city,
-                Col.STORE_NAME: store_name,
-            },
-            index=df.index,
+        if self.merchants is not None:
+            # one dictionary lookup per distinct store name, not per row
+            known = store_name.notna() & store_name.ne(UNKNOWN)
+            store_name[known] = self.merchants.canonicalize(store_name[known])
+        return store_name
+
+
+def parse_statement(
+    pdf_path: PDFSource,
+    extractors: Sequence[TableExtractor],
+    stats: ParseStats | None = None,
+    store: PageStore | None = None,
+    threads: int = 1,
+) -> list[tuple[pd.DataFrame, StatementSummary]]:
+    """
+    Extract the rows and statement summary of every card in *extractors*.
+
+    Each page is laid out once; all cards read their tables from the same
+    page before it is released, so a statement shared by several cards
+    costs one parse.
+
+    Args:
+        pdf_path (PDFSource): Path to the PDF file, its bytes, a binary
+            file-like object or an ``mmap``.
+        extractors (Sequence[TableExtractor]): One extractor per card.
+        stats (ParseStats | None): Filled with the pages and time spent.
+        store (PageStore | None): Pages whose content fingerprint is in the
+            store are not laid out; newly extracted pages are added.
+        threads (int): Lay out the pages in this many threads, each with
+            its own handle on the document; ``1`` parses serially.
+
+    Returns:
+        list[tuple[pd.DataFrame, StatementSummary]]: Raw rows and summary
+        per extractor, in the same order.
+    """
+    from_page: int = 1  # statements data usually starts from page 2 (index 1)
+    first_page: dict[str, str] = {}
+    pages: list[_PageResult] | None = None
+    stats = stats if stats is not None else ParseStats()
+    started = time.perf_counter()
+
+    with pdfplumber.open(as_stream(pdf_path)) as pdf:
+        page_count = len(pdf.pages)
+        if pdf.pages:
+            first_page = _read_first_page(pdf.pages[0])
+            pdf.pages[0].close()
+            stats.pages_skipped += 1  # the cover page holds no transactions
+        if threads <= 1 or page_count - from_page < 2:  # noqa: PLR2004
+            pages = [
+                _parse_page(page, extractors, store) for page in pdf.pages[from_page:]
+            ]
+    if pages is None:
+        pages = _parse_pages_in_threads(
+            _shareable(pdf_path),
+            range(from_page, page_count),
+            extractors,
+            store,
+            threads,
         )
 
-        return df
+    frames: list[list[pd.DataFrame]] = [[] for _ in extractors]
+    card_totals: list[float | None] = [None for _ in extractors]
+    for page in pages:
+        for i, (df, total) in enumerate(zip(page.frames, page.totals, strict=True)):
+            frames[i].append(df)
+            if total is not None:
+                card_totals[i] = total
+        stats.add_page(page)
+    stats.parse_seconds = time.perf_counter() - started
+
+    return [
+        _statement_result(card_frames, first_page, card_total)
+        for card_frames, card_total in zip(frames, card_totals, strict=True)
+    ]
+
+
+def try_parse_statement(
+    pdf_path: PDFSource,
+    extractors: Sequence[TableExtractor],
+    store: PageStore | None = None,
+    threads: int = 1,
+) -> list[ParsedDocument]:
+    """Run :func:`parse_statement`, capturing any exception as an error."""
+    stats = ParseStats()
+    try:
+        return [
+            ParsedDocument(
+                frame=frame,
+                summary=summary,
+                stats=stats if i == 0 else None,
+            )
+            for i, (frame, summary) in enumerate(
+                parse_statement(pdf_path, extractors, stats, store, threads),
+            )
+        ]
+    except Exception as exc:  # noqa: BLE001 - isolate *any* broken document
+        return [ParsedDocument(error=f"{type(exc).__name__}: {exc}")] * len(extractors)
+
+
+def read_statement_date(pdf_path: PDFSource) -> date | None:
+    """
+    Return the statement date printed on the first page, reading nothing else.
+
+    Cheap enough to run on every document of an archive before deciding
+    which ones to parse; ``None`` when the date is missing or the document
+    cannot be opened (it then fails, and is reported, when parsed).
+    """
+    try:
+        with pdfplumber.open(as_stream(pdf_path)) as pdf:
+            if not pdf.pages:
+                return None
+            # the same search get_year_from_first_page runs
+            matches = pdf.pages[0].search(STATEMENT_DATE_RE)
+    except Exception:  # noqa: BLE001 - parsing reports broken documents
+        return None
+    return parse_statement_date(matches[0]["groups"][0]) if matches else None
 
 
 # ---------------------------------------------------------------------------
@@ -162,15 +499,187 @@ class PDFProcessor:
 # ---------------------------------------------------------------------------
 
 
-def _parse_dates(df: pd.DataFrame, col: str, year_str: str) -> None:
+@dataclass(slots=True, frozen=True)
+class _PageResult:
+    """Tables and footer totals of one page, one entry per card."""
+
+    frames: list[pd.DataFrame]
+    totals: list[float | None]
+    laid_out: bool  # False when every card was served from the page store
+    table_header: bool  # the column headers were seen while laying it out
+    seconds: float
+
+
+def _parse_page(
+    page: Page,
+    extractors: Sequence[TableExtractor],
+    store: PageStore | None,
+) -> _PageResult:
+    """Extract every card's table from *page*, then release the page."""
+    started = time.perf_counter()
+    # hashed from the raw content streams, before any layout work
+    fingerprint = page_fingerprint(page) if store is not None else None
+    frames: list[pd.DataFrame] = []
+    totals: list[float | None] = []
+    laid_out = table_header = False
+    for extractor in extractors:
+        df, total, header = _extract_page(page, extractor, store, fingerprint)
+        frames.append(df)
+        totals.append(total)
+        laid_out |= header is not None
+        table_header |= bool(header)
+    # drop the page's cached layout objects right away, otherwise
+    # memory grows with the page count until the document closes
+    page.close()
+    seconds = time.perf_counter() - started
+    return _PageResult(frames, totals, laid_out, table_header, seconds)
+
+
+def _parse_pages_in_threads(
+    source: PDFSource,
+    page_numbers: range,
+    extractors: Sequence[TableExtractor],
+    store: PageStore | None,
+    threads: int,
+) -> list[_PageResult]:
+    """Split *page_numbers* into contiguous runs and parse each in a thread."""
+    size = -(-len(page_numbers) // threads)  # ceiling division
+    runs = [page_numbers[i : i + size] for i in range(0, len(page_numbers), size)]
+
+    def parse_run(run: range) -> list[_PageResult]:
+        # pdfminer's parser, caches and stream position belong to one
+        # document handle and are not thread-safe: each thread opens its own
+        with pdfplumber.open(as_stream(source)) as pdf:
+            return [_parse_page(pdf.pages[i], extractors, store) for i in run]
+
+    with ThreadPoolExecutor(max_workers=len(runs)) as pool:
+        return [page for run in pool.map(parse_run, runs) for page in run]
+
+
+def _shareable(source: PDFSource) -> PDFSource:
+    """Return *source* in a form several threads can open at the same time."""
+    if isinstance(source, str | Path | bytes | bytearray | memoryview):
+        return source  # as_stream gives every caller its own reader
+    # streams and mmaps share one position; archive members are read once
+    return as_stream(source).read()
+
+
+def _picklable(source: PDFSource) -> PDFSource:
     """
-    In-place: `"Jan 1"` + `" 2024"`  →  `pd.Timestamp("2024-01-01")`
+    Return *source* in a form that can be sent to a worker process.
+
+    File objects and mmaps cannot be pickled and are read into ``bytes``;
+    an archive member travels as a reference and is read by the worker.
+    """
+    if isinstance(source, ArchiveMember):
+        return source
+    return _shareable(source)
+
+
+def _extract_page(
+    page: Page,
+    extractor: TableExtractor,
+    store: PageStore | None,
+    fingerprint: bytes | None,
+) -> tuple[pd.DataFrame, float | None, bool | None]:
     """
-    df[col] = pd.to_datetime(
-        df[col] + " " + year_str,
-        format="%b %d %Y",
-        errors="coerce",
+    Return the table and total of *page*, and whether it has column headers.
+
+    The last item is ``None`` when the page was served from the store
+    without being laid out, so whether it has the headers is not known.
+    """
+    table_header: bool
+    if store is None or fingerprint is None:
+        df, total, table_header = extractor.extract_page(page)
+        return df, total, table_header
+
+    card = f"{extractor.card_first_digits}{extractor.card_last_digits}"
+    if extractor.columns is not None:
+        # a projected table must not be served to a run that wants more
+        card += ":" + ",".join(c.value for c in extractor.columns)
+    cached = store.get(fingerprint, card)
+    if cached is not None:
+        return (*cached, None)
+
+    df, total, table_header = extractor.extract_page(page)
+    store.put(fingerprint, card, df, total)
+    return df, total, table_header
+
+
+def _statement_result(
+    frames: list[pd.DataFrame],
+    first_page: dict[str, str],
+    card_total: float | None,
+) -> tuple[pd.DataFrame, StatementSummary]:
+    """Concatenate the page tables of one card and summarise them."""
+    data = pd.concat(frames, ignore_index=True)
+    amounts = (
+        pd.to_numeric(data[Col.AMOUNT], errors="coerce")
+        if Col.AMOUNT in data.columns
+        else pd.Series(dtype=float)
     )
+    summary = StatementSummary(
+        statement_date=first_page.get("statement_date"),
+        previous_balance=_optional_amount(first_page.get("previous_balance")),
+        payments=_optional_amount(first_page.get("payments")),
+        card_total=card_total,
+        transactions_total=round(float(amounts.sum()), 2),
+        rows=len(data),
+    )
+    return data, summary
+
+
+def _read_first_page(page: Page) -> dict[str, str]:
+    """Return the raw statement date / balance / payments text of page 1."""
+    fields: dict[str, str] = {}
+    for name, regexp in (
+        ("statement_date", STATEMENT_DATE_RE),
+        ("previous_balance", PREVIOUS_BALANCE_RE),
+        ("payments", PAYMENTS_RE),
+    ):
+        matches = page.search(regexp)
+        if len(matches) > 0:
+            fields[name] = matches[0]["groups"][0].strip()
+    return fields
+
+
+def _raw_columns(columns: Collection[Col] | None) -> set[Col] | None:
+    """Return the raw columns *columns* are read or derived from."""
+    if columns is None:
+        return None
+    raw = {c for c in columns if c in RAW_COLUMNS}
+    if any(c in DERIVED_COLUMNS for c in columns):
+        raw.update(DERIVED_INPUTS)
+    return raw
+
+
+def _optional_amount(text: str | None) -> float | None:
+    return parse_amount(text) if text else None
+
+
+def _parse_dates(
+    df: pd.DataFrame,
+    col: str,
+    year_str: str,
+    statement_month: int | None = None,
+) -> None:
+    """
+    In-place: `"Jan 1"` + `" 2024"`  →  `pd.Timestamp("2024-01-01")`
+
+    With *statement_month*, dates of a later month go to the year before
+    (`"Dec 28"` on a January 2025 statement → 2024-12-28).
+    """
+    dates = pd.to_datetime(df[col] + " " + year_str, format="%b %d %Y", errors="coerce")
+    if statement_month is not None:
+        late = dates.dt.month > statement_month
+        if late.any():
+            previous = str(int(year_str) - 1)
+            dates[late] = pd.to_datetime(
+                df.loc[late, col] + " " + previous,
+                format="%b %d %Y",
+                errors="coerce",
+            )
+    df[col] = dates
 
 
 def _clean_text(df: pd.DataFrame, columns: list[str]) -> None:
@@ -0,0 +1,58 @@
+"""
+Input sources accepted by the CIBC statements parser.
+
+A statement may be given as a filesystem path, raw ``bytes``, a binary
+file-like object, an ``mmap`` or a member of a zip/tar archive -
+everything is handed to ``pdfplumber.open`` without writing temporary
+files.
+"""
+
+import hashlib
+import mmap
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+from archive_reader import ArchiveMember
+
+type PDFSource = (
+    str | Path | bytes | bytearray | memoryview | mmap.mmap | BinaryIO | ArchiveMember
+)
+
+
+def as_stream(source: PDFSource) -> str | Path | BinaryIO | mmap.mmap:
+    """
+    Return *source* in a form ``pdfplumber.open`` accepts.
+
+    Bytes-like objects are wrapped in :class:`io.BytesIO` (for ``bytes``
+    the buffer is shared, not copied). Paths, streams and ``mmap``
+    objects (seekable and readable) are passed through unchanged.
+    Streams are rewound so the same object can be opened more than once.
+    Archive members are decompressed now, into a new stream on every call.
+    """
+    if isinstance(source, bytes | bytearray | memoryview):
+        return BytesIO(source)
+    if isinstance(source, ArchiveMember):
+        return BytesIO(source.read_bytes())
+    if isinstance(source, str | Path):
+        return source
+    source.seek(0)
+    return source
+
+
+def source_id(source: PDFSource) -> str:
+    """
+    Return a stable, human-readable identifier of *source*.
+
+    Paths and named streams (e.g. archive members) are identified by
+    their name, anonymous in-memory documents by a digest of their bytes.
+    """
+    if isinstance(source, str | Path):
+        return str(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return name
+    if isinstance(source, bytes | bytearray | memoryview | mmap.mmap):
+        digest = hashlib.blake2b(source, digest_size=8).hexdigest()
+        return f"<{type(source).__name__} {digest}>"
+    return f"<{type(source).__name__} {id(source):x}>"
@@ -0,0 +1,174 @@
+"""
+Cheap preflight checks of a batch before the expensive parse (``inspect``).
+
+Opening a PDF and laying out one page costs a fraction of a full parse,
+yet tells whether a document can be parsed at all. :func:`inspect_document`
+reads the page count, producer and statement date, and looks for the
+column headers (and optionally the card header) on the first table page,
+without extracting any table. :class:`Plan` turns the checks of a batch
+into pages to parse and an expected cost, timed from those single pages.
+"""
+
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+
+import pdfplumber
+
+from constants.regexps import STATEMENT_DATE_RE
+from date_range import parse_statement_date
+from pdf_source import PDFSource, as_stream, source_id
+from utils import get_column_header_index, get_first_table_word_index
+
+type Card = tuple[str, str]
+
+TABLE_PAGE = 1  # transactions start on page 2 (index 1); page 1 is the cover
+
+
+@dataclass(slots=True, frozen=True)
+class DocumentCheck:
+    """
+    What :func:`inspect_document` found out about one document.
+
+    ``card_header`` is ``None`` when no card was given; ``page_seconds``
+    is the layout time of the first table page.
+    """
+
+    document: str
+    pages: int = 0
+    producer: str | None = None
+    statement_date: date | None = None
+    column_headers: bool = False
+    card_header: bool | None = None
+    page_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def problem(self) -> str | None:
+        """Why the document cannot be parsed, or ``None`` when it can."""
+        if self.error is not None:
+            return self.error
+        if self.pages <= TABLE_PAGE:
+            return "no transaction pages"
+        if not self.column_headers:
+            return f"no table column headers on page {TABLE_PAGE + 1}"
+        return None
+
+    @property
+    def warning(self) -> str | None:
+        """Something that will not stop the parse but may lose rows."""
+        if self.problem is None and self.card_header is False:
+            return f"card header not on page {TABLE_PAGE + 1}"
+        if self.problem is None and self.statement_date is None:
+            return "no statement date on page 1"
+        return None
+
+    @property
+    def status(self) -> str:
+        """``"rejected"``, ``"warning"`` or ``"ok"``."""
+        if self.problem is not None:
+            return "rejected"
+        return "warning" if self.warning is not None else "ok"
+
+    @property
+    def estimated_seconds(self) -> float:
+        """Expected parse time: every table page costs as much as the first."""
+        return self.page_seconds * max(self.pages - TABLE_PAGE, 0)
+
+
+@dataclass(slots=True, frozen=True)
+class Plan:
+    """What parsing the accepted documents of a batch is expected to cost."""
+
+    documents: int
+    rejected: int
+    pages: int  # table pages to lay out
+    seconds: float  # estimated serial parse time
+
+    @classmethod
+    def from_checks(cls, checks: Sequence[DocumentCheck]) -> "Plan":
+        """Sum up the documents that are not rejected."""
+        accepted = [c for c in checks if c.problem is None]
+        return cls(
+            documents=len(accepted),
+            rejected=len(checks) - len(accepted),
+            pages=sum(c.pages - TABLE_PAGE for c in accepted),
+            seconds=sum(c.estimated_seconds for c in accepted),
+        )
+
+
+def inspect_document(source: PDFSource, card: Card | None = None) -> DocumentCheck:
+    """
+    Check one document without extracting its tables.
+
+    Only the first table page is laid out. Never raises: a document that
+    cannot be opened comes back with ``error`` set.
+
+    Args:
+        source (PDFSource): Document to check.
+        card (Card | None): ``(first, last)`` four digits to look for in the
+            card header; ``None`` skips that check.
+    """
+    document = source_id(source)
+    try:
+        with pdfplumber.open(as_stream(source)) as pdf:
+            pages = len(pdf.pages)
+            producer = pdf.metadata.get("Producer")
+            if not pages:
+                return DocumentCheck(document, producer=_text(producer))
+
+            matches = pdf.pages[0].search(STATEMENT_DATE_RE)
+            statement_date = (
+                parse_statement_date(matches[0]["groups"][0]) if matches else None
+            )
+            if pages <= TABLE_PAGE:
+                return DocumentCheck(
+                    document,
+                    pages,
+                    _text(producer),
+                    statement_date,
+                )
+
+            started = time.perf_counter()
+            words = pdf.pages[TABLE_PAGE].extract_words()
+            page_seconds = time.perf_counter() - started
+    except Exception as exc:  # noqa: BLE001 - report *any* broken document
+        return DocumentCheck(document, error=f"{type(exc).__name__}: {exc}")
+
+    return DocumentCheck(
+        document,
+        pages,
+        _text(producer),
+        statement_date,
+        column_headers=get_column_header_index(words) >= 0,
+        card_header=(
+            get_first_table_word_index(words, *card) >= 0 if card is not None else None
+        ),
+        page_seconds=page_seconds,
+    )
+
+
+def inspect_documents(
+    sources: Sequence[PDFSource],
+    card: Card | None = None,
+    workers: int = 1,
+) -> list[DocumentCheck]:
+    """Run :func:`inspect_document` on every source, in *workers* processes."""
+    check = partial(inspect_document, card=card)
+    if workers <= 1 or len(sources) <= 1:
+        return [check(x) for x in sources]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(sources))) as pool:
+        return list(pool.map(check, sources))
+
+
+def _text(value: object) -> str | None:
+    """Return PDF metadata as text (it may be bytes or a PDF name)."""
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value.decode("latin-1")
+    return str(value)
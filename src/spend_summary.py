@@ -0,0 +1,145 @@
+"""
+Monthly spend aggregates kept next to the main CSV output.
+
+:class:`SpendSummary` stores totals per month, category, store and
+province in a small SQLite file. Every parsed statement is folded in
+once, so dashboards can read the aggregates in O(months) instead of
+re-grouping the full transaction history.
+"""
+
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Final, Self
+
+import pandas as pd
+
+from constants.table_headers import Col
+
+GROUP_COLUMNS: Final[tuple[Col, ...]] = (Col.CATEGORY, Col.STORE_NAME, Col.PROVINCE)
+
+_SCHEMA: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS monthly_spend (
+    month       TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    store_name  TEXT NOT NULL,
+    province    TEXT NOT NULL,
+    total       REAL NOT NULL,
+    count       INTEGER NOT NULL,
+    PRIMARY KEY (month, category, store_name, province)
+);
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY
+);
+"""
+
+_UPSERT: Final[
+    str
+] = """
+INSERT INTO monthly_spend (month, category, store_name, province, total, count)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (month, category, store_name, province) DO UPDATE SET
+    total = total + excluded.total,
+    count = count + excluded.count
+"""
+
+
+class SpendSummary:
+    """
+    Incrementally maintained monthly totals backed by SQLite.
+
+    Use as a context manager: changes are committed on a clean exit and
+    rolled back if parsing fails half-way.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open (or create) the aggregate store at *path*.
+
+        Args:
+            path (Path): SQLite file, e.g. ``statements_data.summary.sqlite``.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        """Return the store itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Commit on success, roll back on error and close the connection."""
+        if exc_type is None:
+            self._conn.commit()
+        else:
+            self._conn.rollback()
+        self._conn.close()
+
+    def add(self, doc_id: str, df: pd.DataFrame) -> bool:
+        """
+        Fold the processed rows of one statement into the totals.
+
+        Args:
+            doc_id (str): Document identifier; a document is counted once.
+            df (pd.DataFrame): Output of ``PDFProcessor.process_dataframe``.
+
+        Returns:
+            bool: ``False`` when *doc_id* had already been aggregated.
+        """
+        cur = self._conn.execute(
+            "INSERT OR IGNORE INTO documents VALUES (?)",
+            (doc_id,),
+        )
+        if cur.rowcount == 0:
+            return False
+        if df.empty:
+            return True
+
+        grouped = (
+            df.assign(month=df[Col.TRANS_DATE].dt.strftime("%Y-%m"))
+            .fillna(dict.fromkeys(GROUP_COLUMNS, ""))
+            .groupby(["month", *GROUP_COLUMNS], dropna=False)[Col.AMOUNT]
+            .agg(["sum", "count"])
+        )
+        self._conn.executemany(
+            _UPSERT,
+            (
+                (*key, float(total), int(count))
+                for key, (total, count) in zip(
+                    grouped.index,
+                    grouped.to_numpy(),
+                    strict=True,
+                )
+                if isinstance(key[0], str)  # skip rows without a parsable date
+            ),
+        )
+        return True
+
+    def monthly(self, by: Col | None = None) -> pd.DataFrame:
+        """
+        Return monthly totals, optionally broken down by one column.
+
+        Args:
+            by (Col | None): One of :data:`GROUP_COLUMNS`; ``None`` returns
+                one row per month.
+
+        Returns:
+            pd.DataFrame: ``month[, <by>], total, count`` sorted by month.
+        """
+        if by is not None and Col(by) not in GROUP_COLUMNS:
+            msg = f"Cannot summarise by {by!r}."
+            raise ValueError(msg)
+        keys = ["month"] if by is None else ["month", Col(by).value]
+
+        query = (
+            f"SELECT {', '.join(keys)}, SUM(total) AS total, SUM(count) AS count "  # noqa: S608
+            f"FROM monthly_spend GROUP BY {', '.join(keys)} ORDER BY {', '.join(keys)}"
+        )
+        return pd.read_sql_query(query, self._conn)
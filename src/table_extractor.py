@@ -1,13 +1,16 @@
 """PDF processing module for extracting statement tables from CIBC PDFs."""
 
 from collections import defaultdict
+from collections.abc import Collection
 from typing import Any
 
 import pandas as pd
 from pdfplumber.page import Page
 
-from constants.table_headers import Col
+from constants.table_headers import RAW_COLUMNS, Col
 from utils import (
+    get_card_total,
+    get_column_header_index,
     get_column_positions,
     get_first_table_word_index,
     get_last_table_word_index,
@@ -18,16 +21,27 @@ from utils import (
 class TableExtractor:
     """Responsible for extraction data from a PDF, convertion it to ``pd.DataFrame``."""
 
-    def __init__(self, card_first_digits: str, card_last_digits: str) -> None:
+    def __init__(
+        self,
+        card_first_digits: str,
+        card_last_digits: str,
+        columns: Collection[Col] | None = None,
+    ) -> None:
         """
         Initialize a TableExtractor with first and last 4 card digits.
 
         Args:
             card_first_digits (str): The first 4 digits of the credit card.
             card_last_digits (str): The last 4 digits of the credit card.
+            columns (Collection[Col] | None): Raw columns to assemble;
+                ``None`` assembles all of them. Rows are found the same way
+                either way.
         """
         self.card_first_digits = card_first_digits
         self.card_last_digits = card_last_digits
+        self.columns: tuple[Col, ...] | None = (
+            None if columns is None else tuple(c for c in RAW_COLUMNS if c in columns)
+        )
 
     def extract_table_data(self, page: Page) -> pd.DataFrame:
         """
@@ -40,7 +54,42 @@ class TableExtractor:
             A ``pandas.DataFrame`` containing the extracted table data.
             An empty DataFrame is returned if extraction fails.
         """
+        return self.extract_table_and_total(page)[0]
+
+    def extract_table_and_total(self, page: Page) -> tuple[pd.DataFrame, float | None]:
+        """
+        Extract the statement table and the card's footer total in one pass.
+
+        Args:
+            page (pdfplumber.pdf.Page): The PDF page to extract data from.
+
+        Returns:
+            The table (see :meth:`extract_table_data`) and the amount of the
+            ``Total for <card>`` footer, or ``None`` when the page has none.
+        """
+        df, total, _ = self.extract_page(page)
+        return df, total
+
+    def extract_page(self, page: Page) -> tuple[pd.DataFrame, float | None, bool]:
+        """
+        Extract the table and footer total, and tell whether the page has one.
+
+        Args:
+            page (pdfplumber.pdf.Page): The PDF page to extract data from.
+
+        Returns:
+            The table and total (see :meth:`extract_table_and_total`) and
+            whether the page has the transactions column headers - when it
+            does but the table is empty, this card's anchors did not match.
+        """
         words: list[dict[str, Any]] = page.extract_words()
+        total = get_card_total(words, self.card_first_digits)
+        df = self._table_from_words(words)
+        table_header = not df.columns.empty or get_column_header_index(words) >= 0
+        return df, total, table_header
+
+    def _table_from_words(self, words: list[dict[str, Any]]) -> pd.DataFrame:
+        """Build the statement table from the words of one page."""
         first_word_index = get_first_table_word_index(
             words,
             self.card_first_digits,
@@ -58,6 +107,8 @@ class TableExtractor:
         rows: defaultdict[int, defaultdict[str, str]] = defaultdict(
             lambda: defaultdict(str),
         )
+        # words of unrequested columns still delimit rows but are not joined
+        wanted = set(self.columns if self.columns is not None else RAW_COLUMNS)
         current_row = int(words[0]["top"])
         for i in range(first_word_index, last_word_index + 1):
             if words[i]["text"] == "Ý":
@@ -65,17 +116,23 @@ class TableExtractor:
 
             for key, (start, end) in column_positions.items():
                 if abs(int(words[i]["top"]) - current_row) <= 1:
-                    if words[i]["x0"] > start and words[i]["x1"] <= end:
+                    if (
+                        key in wanted
+                        and words[i]["x0"] > start
+                        and words[i]["x1"] <= end
+                    ):
                         rows[current_row][key] += f"{words[i]['text']} "
                 elif words[i]["x0"] > column_positions[Col.TRANS_DATE][1]:
                     # TODO @mignatko: refactor:
                     # without skipping other columns we'll duplicate the same word
                     # and past to description len(columns_positions - 1) times
-                    if key != Col.DESCRIPTION.value:
+                    if key != Col.DESCRIPTION.value or key not in wanted:
                         continue
                     rows[current_row][Col.DESCRIPTION] += f"{words[i]['text']} "
                 else:
                     current_row = int(words[i]["top"])
-                    rows[current_row][Col.TRANS_DATE] += f"{words[i]['text']} "
+                    row = rows[current_row]  # a new row, even if its date is unused
+                    if Col.TRANS_DATE in wanted:
+                        row[Col.TRANS_DATE] += f"{words[i]['text']} "
 
         return pd.DataFrame.from_dict(rows, orient="index")
@@ -6,6 +6,7 @@ Contains small, reusable functions used across the project.
 
 from typing import Any
 
+from constants.regexps import AMOUNT_RE
 from constants.table_headers import Col
 
 
@@ -91,6 +92,41 @@ def get_last_table_word_index(
     )
 
 
+def get_card_total(
+    words: list[dict[str, Any]],
+    card_first_four_numbers: str,
+) -> float | None:
+    """
+    Return the amount printed in the ``Total for <card>`` table footer.
+
+    Args:
+        words: Sequence returned by ``pdfplumber.Page.extract_words()``.
+        card_first_four_numbers: First four digits of the card number.
+
+    Returns:
+        The footer amount (e.g. ``1234.56`` for ``$1,234.56``), or ``None``
+        if the page has no footer for this card.
+    """
+    index = find_word_adjacent_to_the_sequence(
+        (("Total", "for", card_first_four_numbers),),
+        words,
+        adjacent_left=False,
+    )
+    if index < 0:
+        return None
+
+    # "Total for 1234 XXXX XXXX 5678 $1,234.56" - the amount follows the card
+    for word in words[index : index + 6]:
+        if AMOUNT_RE.match(word["text"]):
+            return parse_amount(word["text"])
+    return None
+
+
+def parse_amount(text: str) -> float:
+    """Convert ``"$1,234.56"`` / ``"-$7.00"`` style text to a float."""
+    return float(text.replace("$", "").replace(",", ""))
+
+
 def find_word_adjacent_to_the_sequence(
     sequences: tuple[tuple[str, ...], ...],
     words: list[dict[str, Any]],
@@ -127,25 +163,22 @@ def find_word_adjacent_to_the_sequence(
             else:
                 pointer = 0
 
-    if index >= 0 and words[index]["text"] == "Ý":
+    if 0 <= index < len(words) and words[index]["text"] == "Ý":
         index = index - 1 if adjacent_left else index + 1
 
     return index
 
 
-def get_column_positions(
-    table_coords: tuple[float, float, float, float],
-    words: list[dict[str, Any]],
-) -> dict[str, tuple[float, float]]:
+def get_column_header_index(words: list[dict[str, Any]]) -> int:
     """
-    Return positions of table headers.
+    Return the index of the word just before the table column headers.
 
     Args:
-        table_coords: (top, left, bottom, right) of the table rectangle.
-        words: List of pdfplumber ``extract_words`` dicts.
+        words: Sequence returned by ``pdfplumber.Page.extract_words()``.
 
     Returns:
-        Mapping header → (x0, x1) positions.
+        Zero-based index of the word preceding ``date date Description
+        Spend Categories Amount($)``, or ``-1`` if the headers are missing.
     """
     top_sequence = (
         "date",
@@ -155,12 +188,29 @@ def get_column_positions(
         "Categories",
         "Amount($)",
     )
-    index = find_word_adjacent_to_the_sequence(
+    return find_word_adjacent_to_the_sequence(
         (top_sequence,),
         words,
         adjacent_left=True,
     )
 
+
+def get_column_positions(
+    table_coords: tuple[float, float, float, float],
+    words: list[dict[str, Any]],
+) -> dict[str, tuple[float, float]]:
+    """
+    Return positions of table headers.
+
+    Args:
+        table_coords: (top, left, bottom, right) of the table rectangle.
+        words: List of pdfplumber ``extract_words`` dicts.
+
+    Returns:
+        Mapping header → (x0, x1) positions.
+    """
+    index = get_column_header_index(words)
+
     if index < 0:
         msg = "Table headers were not found."
         raise ValueError(msg)
@@ -0,0 +1,153 @@
+"""Unit tests for api.py."""
+
+import mmap
+import re
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import pandas as pd
+import pytest
+
+from src.api import StatementParseError, parse_statements
+from tests.table_extractor_test import DummyPage as TablePage
+
+
+class DummyPage(TablePage):
+    def search(self, regexp: re.Pattern) -> list[dict[str, list[str]]]:
+        if "Statement" in regexp.pattern:
+            return [{"groups": ["July 15, 2024"]}]
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class DummyPDF:
+    def __init__(self) -> None:
+        self.pages = [DummyPage(), DummyPage()]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        pass
+
+
+def _open(source: object) -> DummyPDF:
+    if source == "broken.pdf":
+        msg = "No /Root object! - Is this really a PDF?"
+        raise ValueError(msg)
+    return DummyPDF()
+
+
+@pytest.fixture(autouse=True)
+def fake_pdfplumber(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.pdf_processor.pdfplumber.open", _open)
+
+
+def test_parse_statements_returns_dataframe() -> None:
+    df = parse_statements(["a.pdf", b"%PDF-1.3\n%%EOF\n"], ("1234", "5678"))
+
+    assert isinstance(df, pd.DataFrame)
+    assert df.columns.tolist() == [
+        "transaction_date",
+        "post_date",
+        "description",
+        "category",
+        "amount",
+        "province",
+        "city",
+        "store_name",
+    ]
+    expected_rows_count = 2
+    assert len(df) == expected_rows_count
+    assert df["transaction_date"].dt.year.unique().tolist() == [2024]
+
+
+def test_parse_statements_explicit_year_and_several_cards() -> None:
+    df = parse_statements("a.pdf", [("1234", "5678"), ("1234", "0000")], "2023")
+
+    assert df["card"].tolist() == ["12345678"]
+    assert df["post_date"].dt.year.tolist() == [2023]
+
+
+def test_parse_statements_records_are_lazy() -> None:
+    records = parse_statements(
+        ["a.pdf", "broken.pdf"],
+        ("1234", "5678"),
+        output="records",
+    )
+
+    first = next(records)
+    assert first["amount"] == pytest.approx(73.66)
+    with pytest.raises(StatementParseError, match="broken.pdf"):
+        next(records)
+
+
+def test_parse_statements_skip_errors() -> None:
+    df = parse_statements(["broken.pdf", "a.pdf"], ("1234", "5678"), errors="skip")
+    assert len(df) == 1
+
+
+def test_parse_statements_no_documents() -> None:
+    df = parse_statements([], ("1234", "5678"))
+    assert df.empty
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"output": "polars"}, "Unknown output"),
+        ({"errors": "ignore"}, "Unknown errors"),
+        ({"cards": []}, "card pair is required"),
+    ],
+)
+def test_parse_statements_rejects_bad_options_before_parsing(
+    monkeypatch: pytest.MonkeyPatch,
+    options: dict[str, object],
+    message: str,
+) -> None:
+    opened: list[object] = []
+    monkeypatch.setattr("src.pdf_processor.pdfplumber.open", opened.append)
+    kwargs = {"cards": ("1234", "5678"), **options}
+
+    with pytest.raises(ValueError, match=message):
+        parse_statements(["a.pdf"], **kwargs)  # type: ignore[call-overload]
+    assert not opened
+
+
+def test_parse_statements_arrow() -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = parse_statements("a.pdf", ("1234", "5678"), output="arrow")
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 1
+
+
+def test_parse_statements_sends_streams_and_mmaps_to_workers(tmp_path: Path) -> None:
+    for name in ("a.pdf", "b.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF-1.3\n%%EOF\n")
+
+    with (
+        (tmp_path / "a.pdf").open("rb") as stream,
+        (tmp_path / "b.pdf").open("rb") as fp,
+        mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        df = parse_statements([stream, mapped], ("1234", "5678"), workers=2)
+
+    assert len(df) == 2  # noqa: PLR2004
+
+
+def test_parse_statements_merchants_leave_no_files_behind(tmp_path: Path) -> None:
+    merchants = tmp_path / "merchants.csv"
+    merchants.write_text("alias,merchant\nSOME RESTAURANT,Resto\n", encoding="utf-8")
+
+    df = parse_statements("a.pdf", ("1234", "5678"), merchants=merchants)
+
+    assert len(df) == 1
+    assert list(tmp_path.iterdir()) == [merchants]
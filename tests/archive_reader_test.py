@@ -0,0 +1,71 @@
+"""Unit tests for archive_reader.py."""
+
+import pickle
+import tarfile
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from src.archive_reader import is_archive, list_archive_pdfs
+
+PDF_BYTES = b"%PDF-1.3\n%%EOF\n"
+
+
+def test_read_zip_members_sorted(tmp_path: Path) -> None:
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("b.pdf", PDF_BYTES + b"b")
+        zf.writestr("notes.txt", b"skip me")
+        zf.writestr("a.PDF", PDF_BYTES + b"a")
+
+    members = list_archive_pdfs(archive)
+
+    assert [m.name for m in members] == [f"{archive}:a.PDF", f"{archive}:b.pdf"]
+    assert members[0].read_bytes().endswith(b"a")
+
+
+@pytest.mark.parametrize("mode", ["w", "w:gz", "w:xz"])
+def test_read_tar_members_sorted(tmp_path: Path, mode: str) -> None:
+    archive = tmp_path / "bundle.tar"
+    with tarfile.open(archive, mode) as tf:  # type: ignore[call-overload]
+        for name in ("may.pdf", "readme.md", "jun.pdf"):
+            data = PDF_BYTES + name.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, BytesIO(data))
+
+    members = list_archive_pdfs(archive)
+
+    assert [m.member for m in members] == ["jun.pdf", "may.pdf"]
+    assert [m.read_bytes() for m in members] == [
+        PDF_BYTES + b"jun.pdf",
+        PDF_BYTES + b"may.pdf",
+    ]
+
+
+def test_members_are_read_on_demand(tmp_path: Path) -> None:
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.pdf", PDF_BYTES)
+
+    (member,) = list_archive_pdfs(archive)
+    clone = pickle.loads(pickle.dumps(member))  # noqa: S301 - a path and a name
+
+    assert clone.name == member.name
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.pdf", PDF_BYTES + b"changed")
+    assert clone.read_bytes().endswith(b"changed")
+
+
+def test_is_archive(tmp_path: Path) -> None:
+    plain = tmp_path / "a.pdf"
+    plain.write_bytes(PDF_BYTES)
+    archive = tmp_path / "a.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.pdf", PDF_BYTES)
+
+    assert is_archive(archive)
+    assert not is_archive(plain)
+    assert not is_archive(tmp_path / "missing.zip")
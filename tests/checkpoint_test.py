@@ -0,0 +1,98 @@
+"""Unit tests for checkpoint.py."""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pandas as pd
+
+from src.checkpoint import Checkpoint
+from src.constants.table_headers import Col
+from src.pdf_processor import StatementSummary
+
+
+def _raw_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            Col.TRANS_DATE: ["Jul 24 "],
+            Col.POST_DATE: ["Jul 26 "],
+            Col.DESCRIPTION: ["Some Restaurant TORONTO ON "],
+            Col.CATEGORY: [None],
+            Col.AMOUNT: ["73.66 "],
+        },
+    )
+
+
+def test_checkpoint_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "run.checkpoint"
+    first_run = Checkpoint(path)
+    summary = StatementSummary("July 15, 2024", card_total=73.66, rows=1)
+    first_run.record("a.pdf", _raw_frame(), summary)
+
+    resumed = Checkpoint(path)
+
+    assert "a.pdf" in resumed
+    assert "b.pdf" not in resumed
+    frame = resumed.frames["a.pdf"]
+    assert frame[Col.AMOUNT].tolist() == ["73.66 "]
+    assert frame[Col.CATEGORY].isna().all()
+    assert asdict(resumed.summaries["a.pdf"]) == asdict(summary)
+
+
+def test_checkpoint_ignores_truncated_last_line(tmp_path: Path) -> None:
+    path = tmp_path / "run.checkpoint"
+    Checkpoint(path).record("a.pdf", _raw_frame())
+    with path.open("a", encoding="utf-8") as fp:
+        fp.write('{"id": "b.pdf", "colu')
+
+    resumed = Checkpoint(path)
+
+    assert list(resumed.frames) == ["a.pdf"]
+
+
+def test_checkpoint_clear_removes_file(tmp_path: Path) -> None:
+    path = tmp_path / "run.checkpoint"
+    checkpoint = Checkpoint(path)
+    checkpoint.record("a.pdf", _raw_frame())
+
+    checkpoint.clear()
+
+    assert not path.exists()
+    assert "a.pdf" not in checkpoint
+
+
+def test_take_serves_resumed_rows_once(tmp_path: Path) -> None:
+    path = tmp_path / "run.checkpoint"
+    Checkpoint(path).record("a.pdf", _raw_frame(), StatementSummary("July 15, 2024"))
+    resumed = Checkpoint(path)
+
+    frame, summary = resumed.take("a.pdf")
+
+    assert frame[Col.AMOUNT].tolist() == ["73.66 "]
+    assert summary is not None
+    assert summary.statement_date == "July 15, 2024"
+    assert "a.pdf" not in resumed
+    assert not resumed.frames
+    assert not resumed.summaries
+
+
+def test_recorded_rows_are_not_kept_in_memory(tmp_path: Path) -> None:
+    on_disk = Checkpoint(tmp_path / "run.checkpoint")
+    in_memory = Checkpoint()
+
+    for checkpoint in (on_disk, in_memory):
+        checkpoint.record("a.pdf", _raw_frame(), StatementSummary("July 15, 2024"))
+        assert "a.pdf" not in checkpoint
+        assert not checkpoint.frames
+        assert not checkpoint.summaries
+
+
+def test_rows_parsed_with_fewer_columns_are_not_resumed(tmp_path: Path) -> None:
+    path = tmp_path / "run.checkpoint"
+    Checkpoint(path, [Col.AMOUNT]).record("lean.pdf", _raw_frame()[[Col.AMOUNT]])
+    Checkpoint(path).record("full.pdf", _raw_frame())
+
+    assert "lean.pdf" in Checkpoint(path, [Col.AMOUNT])
+    assert "full.pdf" in Checkpoint(path, [Col.AMOUNT])
+    assert "lean.pdf" not in Checkpoint(path, [Col.AMOUNT, Col.DESCRIPTION])
+    assert "lean.pdf" not in Checkpoint(path)
+    assert "full.pdf" in Checkpoint(path)
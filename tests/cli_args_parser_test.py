@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import json
+import zipfile
+from datetime import date
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
 
 import pytest
 
-from src.cli_args_parser import CLIArgs
+from src.cli_args_parser import (
+    CLIArgs,
+    InspectArgs,
+    ManifestArgs,
+    SummaryArgs,
+    is_manifest_run,
+)
+from src.constants.table_headers import Col
 
 
 def test_files_mode(tmp_path: Path) -> None:
@@ -34,6 +45,8 @@ def test_files_mode(tmp_path: Path) -> None:
     assert args.docs == [p1, p2]
     assert args.out_csv.name == "out.csv"
     assert args.default_year == "1999"
+    assert args.workers == 1
+    assert args.dedupe_index is None
 
 
 def test_folder_mode(tmp_path: Path) -> None:
@@ -97,6 +110,267 @@ def test_input_validation_errors(tmp_path: Path, argv: list[str]) -> None:
     assert exc.value.code == 1
 
 
+def test_archive_mode(tmp_path: Path) -> None:
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("jun.pdf", b"%PDF-1.3\n%%EOF\n")
+        zf.writestr("may.pdf", b"%PDF-1.3\n%%EOF\n")
+    workers = 2
+
+    argv = [
+        "--first-digits",
+        "0000",
+        "--last-digits",
+        "9999",
+        "--archive",
+        str(archive),
+        "-j",
+        str(workers),
+    ]
+    args = CLIArgs.from_argv(argv)
+
+    assert [d.name for d in args.docs] == [f"{archive}:jun.pdf", f"{archive}:may.pdf"]
+    assert args.workers == workers
+
+
+@pytest.mark.parametrize("content", [b"not an archive", None])
+def test_archive_mode_validation_errors(tmp_path: Path, content: bytes | None) -> None:
+    archive = tmp_path / "bundle.zip"
+    if content is not None:
+        archive.write_bytes(content)
+    else:
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("notes.txt", b"no pdfs here")
+
+    with pytest.raises(SystemExit) as exc:
+        CLIArgs.from_argv(
+            ["--first-digits", "1", "--last-digits", "2", "--archive", str(archive)],
+        )
+
+    assert exc.value.code == 1
+
+
+@pytest.mark.parametrize(
+    ("flag", "expected"),
+    [
+        (["--dedupe"], Path("statements_data.dedupe")),
+        (["--dedupe", "seen.idx"], Path("seen.idx")),
+    ],
+)
+def test_dedupe_index_option(tmp_path: Path, flag: list[str], expected: Path) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+
+    args = CLIArgs.from_argv(
+        ["--first-digits", "1", "--last-digits", "2", "--files", str(pdf), *flag],
+    )
+
+    assert args.dedupe_index == expected
+
+
+@pytest.mark.parametrize(
+    ("flag", "expected"),
+    [
+        ([], None),
+        (["--summary"], "out.summary.sqlite"),
+        (["--summary", "dash.sqlite"], "dash.sqlite"),
+    ],
+)
+def test_summary_option(tmp_path: Path, flag: list[str], expected: str | None) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+
+    args = CLIArgs.from_argv(
+        ["-fd", "1", "-ld", "2", "--files", str(pdf), "-o", "out.csv", *flag],
+    )
+
+    assert args.summary_db == (Path(expected) if expected else None)
+
+
+def test_summary_subcommand_args(tmp_path: Path) -> None:
+    db = tmp_path / "s.sqlite"
+    db.touch()
+
+    args = SummaryArgs.from_argv([str(db), "--by", "province"])
+
+    assert args.summary_db == db
+    assert args.by == "province"
+    assert args.out_csv is None
+
+    with pytest.raises(SystemExit) as exc:
+        SummaryArgs.from_argv([str(tmp_path / "missing.sqlite")])
+    assert exc.value.code == 1
+
+
+def test_merchants_option(tmp_path: Path) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+    merchants = tmp_path / "merchants.csv"
+    merchants.write_text("alias,merchant\n", encoding="utf-8")
+    base = ["-fd", "1", "-ld", "2", "--files", str(pdf)]
+
+    assert CLIArgs.from_argv(base).merchants is None
+    assert CLIArgs.from_argv([*base, "--merchants", str(merchants)]).merchants == (
+        merchants
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        CLIArgs.from_argv([*base, "--merchants", str(tmp_path / "missing.csv")])
+    assert exc.value.code == 1
+
+
+def test_manifest_args(tmp_path: Path) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+    manifest = tmp_path / "jobs.json"
+    job = {"first_digits": "1111", "last_digits": "2222", "files": [str(pdf)]}
+    manifest.write_text(
+        json.dumps(
+            {
+                "jobs": [
+                    {**job, "name": "alice", "default_year": "2023", "dedupe": True},
+                    {**job, "out": str(tmp_path / "b.csv"), "summary": False},
+                    {**job, "files": [str(tmp_path / "missing.pdf")]},
+                    {**job, "stdin": True},
+                ],
+            },
+        ),
+        encoding="utf-8",
+    )
+    argv = ["--manifest", str(manifest), "-j", "3"]
+
+    assert is_manifest_run(argv)
+    args = ManifestArgs.from_argv(argv)
+
+    assert args.workers == 3  # noqa: PLR2004
+    assert [job.name for job in args.jobs] == ["alice", "job-2", "job-3", "job-4"]
+    alice, second, missing, stdin = (job.args for job in args.jobs)
+    assert alice is not None
+    assert alice.default_year == "2023"
+    assert alice.dedupe_index == Path("statements_data.dedupe")
+    assert second is not None
+    assert second.out_csv == tmp_path / "b.csv"
+    assert second.summary_db is None
+    assert missing is None
+    assert stdin is None
+
+
+@pytest.mark.parametrize("content", ["not json", '{"jobs": []}', '{"tasks": []}'])
+def test_manifest_args_rejects_bad_manifest(tmp_path: Path, content: str) -> None:
+    manifest = tmp_path / "jobs.json"
+    manifest.write_text(content, encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exc:
+        ManifestArgs.from_argv(["--manifest", str(manifest)])
+    assert exc.value.code == 1
+
+
 def _make_fake_pdf(path: Path) -> None:
     """Write a minimal PDF header so path.is_file() == True."""
     path.write_bytes(b"%PDF-1.3\n%%EOF\n")
+
+
+def test_stdin_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = b"%PDF-1.3\n%%EOF\n"
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(payload)))
+
+    args = CLIArgs.from_argv(
+        ["--first-digits", "1111", "--last-digits", "2222", "--stdin"],
+    )
+
+    assert args.docs == [payload]
+
+
+def test_stdin_mode_rejects_non_pdf(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(b"not a pdf")))
+
+    with pytest.raises(SystemExit) as exc:
+        CLIArgs.from_argv(
+            ["--first-digits", "1111", "--last-digits", "2222", "--stdin"],
+        )
+
+    assert exc.value.code == 1
+
+
+@pytest.mark.parametrize(
+    ("flag", "expected"),
+    [
+        ([], None),
+        (["--page-cache"], Path("statements_data.pages.sqlite")),
+        (["--page-cache", "pages.db"], Path("pages.db")),
+    ],
+)
+def test_page_cache_option(
+    tmp_path: Path,
+    flag: list[str],
+    expected: Path | None,
+) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+
+    args = CLIArgs.from_argv(
+        ["-fd", "1111", "-ld", "2222", "--files", str(pdf), *flag],
+    )
+
+    assert args.page_cache == expected
+
+
+def test_date_range_options(tmp_path: Path) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+    base = ["-fd", "1111", "-ld", "2222", "--files", str(pdf)]
+
+    assert CLIArgs.from_argv(base).period is None
+    period = CLIArgs.from_argv([*base, "--from", "2024-01-01"]).period
+    assert period is not None
+    assert (period.start, period.end) == (date(2024, 1, 1), None)
+
+    with pytest.raises(SystemExit) as exc:
+        CLIArgs.from_argv([*base, "--from", "2024-02-01", "--to", "2024-01-01"])
+    assert exc.value.code == 1
+    with pytest.raises(SystemExit) as exc:
+        CLIArgs.from_argv([*base, "--to", "31/01/2024"])
+    assert exc.value.code == 2  # noqa: PLR2004
+
+
+def test_threads_option(tmp_path: Path) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+    base = ["-fd", "1111", "-ld", "2222", "--files", str(pdf)]
+
+    assert CLIArgs.from_argv(base).threads == 1
+    assert CLIArgs.from_argv([*base, "--threads", "4"]).threads == 4  # noqa: PLR2004
+    with pytest.raises(SystemExit) as exc:
+        CLIArgs.from_argv([*base, "--threads", "0"])
+    assert exc.value.code == 1
+
+
+def test_inspect_args(tmp_path: Path) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+
+    args = InspectArgs.from_argv(["--files", str(pdf), "-j", "1"])
+    assert args.docs == [pdf]
+    assert args.card is None
+    assert args.workers == 1
+    card = InspectArgs.from_argv(["--folder", str(tmp_path), "-fd", "1", "-ld", "2"])
+    assert card.card == ("1", "2")
+
+    with pytest.raises(SystemExit) as exc:
+        InspectArgs.from_argv(["--files", str(pdf), "-fd", "1234"])
+    assert exc.value.code == 1
+
+
+def test_columns_option(tmp_path: Path) -> None:
+    pdf = tmp_path / "a.pdf"
+    _make_fake_pdf(pdf)
+    base = ["-fd", "1111", "-ld", "2222", "--files", str(pdf)]
+
+    assert CLIArgs.from_argv(base).columns is None
+    args = CLIArgs.from_argv([*base, "--columns", "amount, transaction_date"])
+    assert args.columns == (Col.AMOUNT, Col.TRANS_DATE)
+
+    for bad in ("amount,amount", "amount,balance", ","):
+        with pytest.raises(SystemExit) as exc:
+            CLIArgs.from_argv([*base, "--columns", bad])
+        assert exc.value.code == 2  # noqa: PLR2004
@@ -0,0 +1,51 @@
+"""Unit tests for date_range.py."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.constants.table_headers import Col
+from src.date_range import STATEMENT_SPAN, DateRange, parse_statement_date
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("July 15, 2024", date(2024, 7, 15)),
+        ("Jan 3, 2023", date(2023, 1, 3)),
+        ("Sep. 5, 2022", date(2022, 9, 5)),
+        ("  March  1,   2021 ", date(2021, 3, 1)),
+        ("not a date", None),
+    ],
+)
+def test_parse_statement_date(text: str, expected: date | None) -> None:
+    assert parse_statement_date(text) == expected
+
+
+def test_may_contain_prunes_by_statement_date() -> None:
+    q1 = DateRange(date(2024, 1, 1), date(2024, 3, 31))
+
+    assert not q1.may_contain(date(2023, 12, 15))  # closed before the range
+    assert q1.may_contain(date(2024, 1, 15))
+    assert q1.may_contain(date(2024, 3, 31) + STATEMENT_SPAN)
+    assert not q1.may_contain(date(2024, 4, 1) + STATEMENT_SPAN)
+    assert q1.may_contain(None)  # unknown dates are parsed, never skipped
+    assert DateRange(end=date(2024, 3, 31)).may_contain(date(2001, 1, 1))
+    assert DateRange(start=date(2024, 1, 1)).may_contain(date(2030, 1, 1))
+
+
+def test_filter_rows_is_inclusive() -> None:
+    df = pd.DataFrame(
+        {
+            Col.TRANS_DATE: pd.to_datetime(
+                ["2023-12-31", "2024-01-01", "2024-03-31", "2024-04-01", None],
+            ),
+            Col.AMOUNT: [1.0, 2.0, 3.0, 4.0, 5.0],
+        },
+    )
+
+    kept = DateRange(date(2024, 1, 1), date(2024, 3, 31)).filter_rows(df)
+
+    assert kept[Col.AMOUNT].tolist() == [2.0, 3.0]
+    assert str(DateRange(start=date(2024, 1, 1))) == "2024-01-01 to ..."
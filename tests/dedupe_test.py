@@ -0,0 +1,87 @@
+"""Unit tests for dedupe.py."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from src.constants.table_headers import Col
+from src.dedupe import TransactionIndex
+
+
+def _statement(*rows: tuple[str, float, str]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            Col.TRANS_DATE: pd.to_datetime([r[0] for r in rows]),
+            Col.POST_DATE: pd.to_datetime([r[0] for r in rows]),
+            Col.DESCRIPTION: [r[2] for r in rows],
+            Col.CATEGORY: ["Cat"] * len(rows),
+            Col.AMOUNT: [r[1] for r in rows],
+        },
+    )
+
+
+def test_identical_rows_within_statement_are_kept() -> None:
+    index = TransactionIndex()
+    df = _statement(
+        ("2024-07-02", 3.5, "COFFEE TORONTO ON"),
+        ("2024-07-02", 3.5, "COFFEE TORONTO ON"),
+    )
+    assert len(index.drop_duplicates(df, "12345678")) == len(df)
+
+
+def test_overlapping_statement_keeps_only_new_rows() -> None:
+    index = TransactionIndex()
+    first = _statement(
+        ("2024-07-02", 3.5, "COFFEE TORONTO ON"),
+        ("2024-07-02", 3.5, "COFFEE TORONTO ON"),
+        ("2024-07-03", 10.0, "BOOKS TORONTO ON"),
+    )
+    index.drop_duplicates(first, "12345678")
+
+    second = _statement(
+        ("2024-07-02", 3.5, "coffee  toronto on"),  # same row, other spacing/case
+        ("2024-07-02", 3.5, "COFFEE TORONTO ON"),
+        ("2024-07-02", 3.5, "COFFEE TORONTO ON"),  # third cup is new
+        ("2024-07-04", 7.0, "LUNCH TORONTO ON"),
+    )
+    result = index.drop_duplicates(second, "12345678")
+
+    assert result.index.tolist() == [2, 3]
+
+
+def test_card_is_part_of_the_key() -> None:
+    index = TransactionIndex()
+    df = _statement(("2024-07-02", 3.5, "COFFEE TORONTO ON"))
+    index.drop_duplicates(df, "11112222")
+    assert len(index.drop_duplicates(df, "33334444")) == 1
+
+
+def test_index_persists_between_runs(tmp_path: Path) -> None:
+    path = tmp_path / "statements.dedupe"
+    df = _statement(
+        ("2024-07-02", 3.5, "COFFEE TORONTO ON"),
+        ("2024-07-03", 10.0, "BOOKS TORONTO ON"),
+    )
+    first_run = TransactionIndex(path)
+    first_run.drop_duplicates(df, "12345678")
+    first_run.save()
+
+    second_run = TransactionIndex(path)
+    assert len(second_run) == len(df)
+    assert second_run.drop_duplicates(df, "12345678").empty
+
+
+def test_empty_frame_passes_through() -> None:
+    index = TransactionIndex()
+    assert index.drop_duplicates(pd.DataFrame(), "12345678").empty
+
+
+def test_unseen_does_not_record() -> None:
+    index = TransactionIndex()
+    seen = ("2024-07-02", 3.5, "COFFEE TORONTO ON")
+    index.drop_duplicates(_statement(seen), "12345678")
+    df = _statement(seen, seen, ("2024-07-03", 9.0, "BOOKS TORONTO ON"))
+
+    assert index.unseen(df, "12345678") == [False, True, True]
+    assert index.unseen(df, "12345678") == [False, True, True]
+    assert len(index) == 1
@@ -0,0 +1 @@
+"""Shared test fixtures (synthetic statement PDFs)."""
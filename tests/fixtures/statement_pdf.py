@@ -0,0 +1,163 @@
+"""
+Synthetic CIBC-like statement PDFs for tests.
+
+The layout mimics a real e-statement closely enough for the table
+anchors ("Card number ...", column headers, "Total for ...") and the
+statement date on page 1 to be found by the parser.
+"""
+
+from __future__ import annotations
+
+_HEADER = (
+    (36, 620, "Trans"),
+    (78, 620, "Post"),
+    (36, 612, "date"),
+    (78, 612, "date"),
+    (122, 612, "Description"),
+    (325, 612, "Spend"),
+    (352, 612, "Categories"),
+    (504, 612, "Amount($)"),
+)
+
+
+def build_statement(
+    pages: int = 2,
+    rows_per_page: int = 5,
+    *,
+    first: str = "1234",
+    last: str = "5678",
+    statement_date: str = "July 15, 2024",
+    month: str = "Jul",
+    seed: int = 0,
+) -> bytes:
+    """
+    Return the bytes of a statement with *pages* pages.
+
+    Page 1 holds the statement date and summary, every following page a
+    transaction table with *rows_per_page* rows. The last table page ends
+    with ``Total for <first> XXXX XXXX <last> $<sum of amounts>``.
+    *seed* varies descriptions/amounts between otherwise equal statements.
+    """
+    contents = [
+        _text(
+            [
+                (36, 750, "Statement Date"),
+                (36, 738, statement_date),
+                (36, 700, "Previous balance $100.00"),
+            ],
+        ),
+    ]
+
+    total = 0.0
+    for p in range(1, pages):
+        items = [*_HEADER, (36, 600, f"Card number {first} XXXX XXXX {last}")]
+        y = 585
+        for r in range(rows_per_page):
+            amount = 10 + r + p / 100 + seed
+            total += amount
+            day = 1 + (p + r) % 28
+            items += [
+                (36, y, f"{month} {day}"),
+                (78, y, f"{month} {day}"),
+                (122, y, f"STORE{r} #{seed}{p}{r} TORONTO ON"),
+                (341, y, "Restaurants"),
+                (524, y, f"{amount:.2f}"),
+            ]
+            y -= 12
+        if p == pages - 1:
+            items.append(
+                (36, y - 10, f"Total for {first} XXXX XXXX {last} ${total:.2f}")
+            )
+        items.append((481, 40, f"Page {p + 1} of {pages}"))
+        contents.append(_text(items))
+
+    return _assemble(contents)
+
+
+def _text(items: list[tuple[int, int, str]]) -> bytes:
+    ops = []
+    for x, y, s in items:
+        escaped = s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        ops.append(f"BT /F1 8 Tf {x} {y} Td ({escaped}) Tj ET")
+    return "\n".join(ops).encode("latin-1")
+
+
+def _assemble(contents: list[bytes]) -> bytes:
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for content in contents:
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % len(objects),
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids),
+        len(kids),
+    )
+
+    return _serialize(objects)
+
+
+def build_form_pages(texts: list[str]) -> bytes:
+    """
+    Return a PDF whose pages all have the content ``q /Fm0 Do Q``.
+
+    Page *i* draws *texts[i]* through its own Form XObject named ``Fm0``,
+    so the pages differ only inside their XObjects.
+    """
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    page_content = b"q /Fm0 Do Q"
+    for text in texts:
+        form = _text([(36, 700, text)])
+        objects.append(
+            b"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Length %d >>\n"
+            b"stream\n%s\nendstream" % (len(form), form),
+        )
+        form_ref = len(objects)
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream"
+            % (len(page_content), page_content),
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /XObject << /Fm0 %d 0 R >> >> /Contents %d 0 R >>"
+            % (form_ref, len(objects)),
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids),
+        len(kids),
+    )
+    return _serialize(objects)
+
+
+def _serialize(objects: list[bytes]) -> bytes:
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(out)
@@ -0,0 +1,173 @@
+"""Unit tests for frame_writer.py."""
+
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.frame_writer import FrameWriter
+
+
+def _frame(start: int, rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"description": [f"row {i}" for i in range(start, start + rows)]},
+        index=[100 + i for i in range(rows)],  # writer renumbers the index
+    )
+
+
+def test_frames_are_written_in_order_with_running_index(tmp_path: Path) -> None:
+    out = tmp_path / "out.csv"
+    with FrameWriter(out, max_pending=1) as writer:
+        for start in range(0, 30, 3):
+            writer.write(_frame(start, 3))
+        writer.write(pd.DataFrame())  # documents without rows are skipped
+
+    data = pd.read_csv(out, index_col=0)
+    assert data.index.tolist() == list(range(30))
+    assert data["description"].tolist() == [f"row {i}" for i in range(30)]
+    assert not (tmp_path / "out.csv.part").exists()
+
+
+def test_later_frames_follow_the_first_header(tmp_path: Path) -> None:
+    out = tmp_path / "out.csv"
+    with FrameWriter(out) as writer:
+        writer.write(pd.DataFrame({"a": [1], "b": [2]}))
+        writer.write(pd.DataFrame({"b": [4], "a": [3]}))
+
+    assert pd.read_csv(out, index_col=0).to_dict("list") == {"a": [1, 3], "b": [2, 4]}
+
+
+def test_frames_follow_the_given_columns(tmp_path: Path) -> None:
+    out = tmp_path / "out.csv"
+    with FrameWriter(out, columns=["a", "b", "c"]) as writer:
+        writer.write(pd.DataFrame({"a": [1], "c": [3]}))  # no "b" in the first
+        writer.write(pd.DataFrame({"c": [6], "b": [5], "a": [4], "d": [0]}))
+
+    assert pd.read_csv(out, index_col=0).fillna(0).to_dict("list") == {
+        "a": [1, 4],
+        "b": [0, 5],
+        "c": [3, 6],
+    }
+
+
+def test_empty_output_still_has_a_header(tmp_path: Path) -> None:
+    out = tmp_path / "out.csv"
+    with FrameWriter(out, columns=["amount", "category"]):
+        pass
+
+    assert out.read_text().splitlines() == [",amount,category"]
+
+
+def test_writer_errors_propagate(tmp_path: Path) -> None:
+    out = tmp_path / "missing" / "out.csv"  # parent directory does not exist
+    writer = FrameWriter(out)
+    writer.write(_frame(0, 1))
+
+    # the failure happens on the writer thread and surfaces on a later call
+    with pytest.raises(OSError, match="non-existent directory"):
+        writer.close()
+
+
+def test_stale_partial_output_is_replaced(tmp_path: Path) -> None:
+    out = tmp_path / "out.csv"
+    (tmp_path / "out.csv.part").write_text(",description\n0,stale\n")
+
+    with FrameWriter(out) as writer:
+        writer.write(_frame(0, 1))
+
+    assert out.read_text().splitlines() == [",description", "0,row 0"]
+
+
+def test_writer_error_discards_partial_output(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    out = tmp_path / "out.csv"
+    writer = FrameWriter(out)
+    writer.write(_frame(0, 1))
+
+    def failing_finish() -> None:
+        msg = "disk full"
+        raise OSError(msg)
+
+    monkeypatch.setattr(writer, "_finish", failing_finish)
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+
+    assert not out.exists()
+    assert not (tmp_path / "out.csv.part").exists()
+
+
+def test_failed_body_discards_partial_output(tmp_path: Path) -> None:
+    out = tmp_path / "out.csv"
+    with pytest.raises(RuntimeError), FrameWriter(out) as writer:  # noqa: PT012
+        writer.write(_frame(0, 1))
+        msg = "parsing failed"
+        raise RuntimeError(msg)
+
+    assert not out.exists()
+    assert not (tmp_path / "out.csv.part").exists()
+
+
+def test_writing_happens_off_the_calling_thread(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    threads: list[str] = []
+    to_csv = pd.DataFrame.to_csv
+
+    def recording_to_csv(self: pd.DataFrame, *args: object, **kwargs: object) -> None:
+        threads.append(threading.current_thread().name)
+        to_csv(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", recording_to_csv)
+    with FrameWriter(tmp_path / "out.csv") as writer:
+        writer.write(_frame(0, 1))
+
+    assert threads == ["writer-out.csv"]
+
+
+def test_parquet_output(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    out = tmp_path / "out.parquet"
+    with FrameWriter(out) as writer:
+        writer.write(_frame(0, 2))
+        writer.write(_frame(2, 2))
+
+    assert pd.read_parquet(out)["description"].tolist() == [
+        f"row {i}" for i in range(4)
+    ]
+
+
+def test_parquet_schema_does_not_depend_on_the_first_frame(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    out = tmp_path / "out.parquet"
+    columns = ["transaction_date", "description", "amount", "store_name"]
+    with FrameWriter(out, columns=columns) as writer:
+        writer.write(
+            pd.DataFrame(
+                {
+                    "transaction_date": pd.to_datetime(["2024-07-01"]),
+                    "description": ["7-ELEVEN #1 TORONTO ON"],
+                    "amount": [1.5],
+                    "store_name": [float("nan")],  # no store name found
+                },
+            ),
+        )
+        writer.write(
+            pd.DataFrame(
+                {
+                    "transaction_date": pd.to_datetime(["2024-07-02"]),
+                    "description": ["STORE0 #2 TORONTO ON"],
+                    "amount": [2],
+                    "store_name": ["STORE"],
+                },
+            ),
+        )
+
+    data = pd.read_parquet(out)
+    assert data["store_name"].isna().tolist() == [True, False]
+    assert data["store_name"].iloc[1] == "STORE"
+    assert data["amount"].tolist() == [1.5, 2.0]
+    assert str(data["transaction_date"].dtype).startswith("datetime64")
@@ -0,0 +1,114 @@
+"""Unit tests for job_manifest.py."""
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.cli_args_parser import CLIArgs
+from src.constants.table_headers import Col
+from src.job_manifest import SharedParser
+from src.metrics import Metrics
+from src.pdf_processor import ParsedDocument, ParseStats
+from src.table_extractor import TableExtractor
+
+
+def _job(first: str, *docs: str) -> CLIArgs:
+    return CLIArgs(
+        card_first_digits=first,
+        card_last_digits="0000",
+        docs=[Path(d) for d in docs],
+        out_csv=Path(f"{first}.csv"),
+        default_year="2024",
+    )
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, list[str]]]:
+    """Record ``(document, cards)`` of every parse instead of opening PDFs."""
+    recorded: list[tuple[str, list[str]]] = []
+
+    def fake_parse(
+        doc: Path,
+        extractors: Sequence[TableExtractor],
+        *_options: object,  # page store, threads
+    ) -> list[ParsedDocument]:
+        cards = [e.card_first_digits for e in extractors]
+        recorded.append((str(doc), cards))
+        return [
+            ParsedDocument(
+                frame=pd.DataFrame({Col.DESCRIPTION: [f"{doc}:{card}"]}),
+                stats=ParseStats(pages_parsed=4) if i == 0 else None,
+            )
+            for i, card in enumerate(cards)
+        ]
+
+    monkeypatch.setattr("src.job_manifest.try_parse_statement", fake_parse)
+    return recorded
+
+
+def _descriptions(results: list[ParsedDocument]) -> list[str]:
+    return [str(r.frame.iloc[0, 0]) for r in results if r.frame is not None]
+
+
+def test_shared_document_is_parsed_once_for_all_cards(
+    calls: list[tuple[str, list[str]]],
+) -> None:
+    jobs = [_job("1111", "joint.pdf", "a.pdf"), _job("2222", "joint.pdf")]
+    shared = SharedParser(jobs)
+
+    first = list(shared.iter_pdfs(TableExtractor("1111", "0000"), jobs[0].docs))
+    second = list(shared.iter_pdfs(TableExtractor("2222", "0000"), jobs[1].docs))
+
+    assert calls == [("joint.pdf", ["1111", "2222"]), ("a.pdf", ["1111"])]
+    assert _descriptions(first) == ["joint.pdf:1111", "a.pdf:1111"]
+    assert _descriptions(second) == ["joint.pdf:2222"]
+    assert (shared.parsed, shared.cache_hits) == (2, 1)
+
+
+def test_repeated_use_gets_private_copy(calls: list[tuple[str, list[str]]]) -> None:
+    jobs = [_job("1111", "a.pdf"), _job("1111", "a.pdf")]
+    shared = SharedParser(jobs, ThreadPoolExecutor(max_workers=2))
+    extractor = TableExtractor("1111", "0000")
+
+    (first,) = shared.iter_pdfs(extractor, jobs[0].docs)
+    assert first.frame is not None
+    first.frame.iloc[0, 0] = "mutated by the first job"
+    (second,) = shared.iter_pdfs(extractor, jobs[1].docs)
+
+    metrics = Metrics()
+    for result in (first, second):
+        if result.stats is not None:
+            metrics.record_parse(result.stats)
+
+    assert len(calls) == 1
+    assert metrics.pages_parsed == 4  # noqa: PLR2004 - reported by one job only
+    assert _descriptions([second]) == ["a.pdf:1111"]
+    assert not shared._results  # noqa: SLF001 - released after the last use
+
+
+def test_unplanned_document_is_still_parsed(
+    calls: list[tuple[str, list[str]]],
+) -> None:
+    shared = SharedParser([])
+    results = list(shared.iter_pdfs(TableExtractor("1111", "0000"), [Path("x.pdf")]))
+
+    assert calls == [("x.pdf", ["1111"])]
+    assert _descriptions(results) == ["x.pdf:1111"]
+
+
+def test_released_document_is_dropped(calls: list[tuple[str, list[str]]]) -> None:
+    jobs = [_job("1111", "joint.pdf"), _job("2222", "joint.pdf", "b.pdf")]
+    shared = SharedParser(jobs)
+    resumed = TableExtractor("2222", "0000")
+
+    list(shared.iter_pdfs(TableExtractor("1111", "0000"), jobs[0].docs))
+    shared.release(resumed, "joint.pdf")  # the second job had it checkpointed
+    assert not shared._results  # noqa: SLF001
+    shared.release(resumed, "b.pdf")
+    list(shared.iter_pdfs(TableExtractor("1111", "0000"), [Path("b.pdf")]))
+
+    assert calls == [("joint.pdf", ["1111", "2222"]), ("b.pdf", ["1111"])]
+    assert not shared._results  # noqa: SLF001
@@ -0,0 +1,110 @@
+"""End-to-end tests for main.py on synthetic statements."""
+
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.main import main
+from tests.fixtures.statement_pdf import build_statement
+
+
+def _write(path: Path, statement_date: str, month: str) -> Path:
+    path.write_bytes(build_statement(statement_date=statement_date, month=month))
+    return path
+
+
+def test_every_statement_is_dated_in_its_own_year(tmp_path: Path) -> None:
+    docs = [
+        _write(tmp_path / "a.pdf", "July 15, 2023", "Jul"),
+        _write(tmp_path / "b.pdf", "July 15, 2024", "Jul"),
+        # December purchases on a January statement belong to the year before
+        _write(tmp_path / "c.pdf", "January 15, 2025", "Dec"),
+    ]
+    out = tmp_path / "out.csv"
+
+    main(["-fd", "1234", "-ld", "5678", "--files", *map(str, docs), "-o", str(out)])
+
+    dates = pd.read_csv(out, parse_dates=["transaction_date"])["transaction_date"]
+    assert dates.dt.strftime("%Y-%m").unique().tolist() == [
+        "2023-07",
+        "2024-07",
+        "2024-12",
+    ]
+
+
+def test_date_range_uses_each_statement_year(tmp_path: Path) -> None:
+    docs = [
+        _write(tmp_path / "a.pdf", "July 15, 2023", "Jul"),
+        _write(tmp_path / "b.pdf", "July 15, 2024", "Jul"),
+    ]
+    out = tmp_path / "out.csv"
+
+    main(
+        [
+            *("-fd", "1234", "-ld", "5678", "-o", str(out)),
+            *("--from", "2023-06-01", "--to", "2024-06-30"),
+            *("--files", *map(str, docs)),
+        ],
+    )
+
+    dates = pd.read_csv(out, parse_dates=["transaction_date"])["transaction_date"]
+    assert len(dates) == 5  # noqa: PLR2004 - a.pdf's rows only
+    assert dates.dt.year.unique().tolist() == [2023]
+
+
+def test_rerun_after_failure_keeps_deduplicated_rows(tmp_path: Path) -> None:
+    good = _write(tmp_path / "a.pdf", "July 15, 2024", "Jul")
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    out = tmp_path / "out.csv"
+    argv = [
+        *("-fd", "1234", "-ld", "5678", "-o", str(out)),
+        *("--dedupe", str(tmp_path / "idx"), "--checkpoint", str(tmp_path / "ck")),
+        *("--files", str(good), str(bad)),
+    ]
+
+    with pytest.raises(SystemExit):
+        main(argv)
+    bad.write_bytes(build_statement(statement_date="August 15, 2024", month="Aug"))
+    main(argv)
+
+    months = pd.read_csv(out, parse_dates=["transaction_date"])["transaction_date"]
+    assert months.dt.month.value_counts().to_dict() == {7: 5, 8: 5}
+
+
+def test_resume_with_wider_columns_parses_again(tmp_path: Path) -> None:
+    good = _write(tmp_path / "a.pdf", "July 15, 2024", "Jul")
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    out = tmp_path / "out.csv"
+    argv = [
+        *("-fd", "1234", "-ld", "5678", "-o", str(out)),
+        *("--checkpoint", str(tmp_path / "ck"), "--files", str(good), str(bad)),
+    ]
+
+    with pytest.raises(SystemExit):
+        main([*argv, "--columns", "amount"])
+    bad.write_bytes(build_statement(statement_date="August 15, 2024", month="Aug"))
+    main(argv)
+
+    data = pd.read_csv(out)
+    assert len(data) == 10  # noqa: PLR2004
+    assert data["description"].notna().all()
+
+
+def test_summary_counts_whole_statements_under_a_date_range(tmp_path: Path) -> None:
+    doc = _write(tmp_path / "a.pdf", "July 15, 2024", "Jul")
+    summary = tmp_path / "summary.sqlite"
+    argv = [
+        *("-fd", "1234", "-ld", "5678", "-o", str(tmp_path / "out.csv")),
+        *("--summary", str(summary), "--files", str(doc)),
+    ]
+
+    main([*argv, "--from", "2024-07-04"])
+    with sqlite3.connect(summary) as conn:
+        counted = conn.execute("SELECT SUM(count) FROM monthly_spend").fetchone()[0]
+    written = len(pd.read_csv(tmp_path / "out.csv"))
+
+    assert (written, counted) == (3, 5)  # only day 4..6 written, all rows counted
@@ -0,0 +1,170 @@
+"""Unit tests for merchant_dictionary.py."""
+
+import os
+import pickle
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.constants.keywords import UNKNOWN
+from src.constants.table_headers import Col
+from src.merchant_dictionary import MerchantDictionary, build_index, normalize_name
+from src.pdf_processor import PDFProcessor
+
+ALIASES = """alias,merchant
+AMZN Mktp,Amazon
+AMAZON.CA,Amazon
+TIM HORTONS,Tim Hortons
+STARBUCKS COFFEE,Starbucks
+UBER EATS,Uber Eats
+UBER TRIP,Uber
+"""
+
+
+@pytest.fixture
+def merchants_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "merchants.csv"
+    path.write_text(ALIASES, encoding="utf-8")
+    return path
+
+
+def test_normalize_name() -> None:
+    assert normalize_name("  Amazon.ca ") == "AMAZON CA"
+    assert normalize_name("Café Dépôt #12") == "CAFE DEPOT 12"
+
+
+@pytest.mark.parametrize(
+    ("name", "merchant"),
+    [
+        ("AMZN Mktp CA", "Amazon"),  # longest alias that is a word-prefix
+        ("Amazon.ca", "Amazon"),
+        ("TIM HORTO", "Tim Hortons"),  # truncated name
+        ("STARBUKS COFFE", "Starbucks"),  # trigram match
+        ("UBER EATS TORONTO", "Uber Eats"),
+        ("Uber", "Uber"),  # merchants are aliases of themselves
+        ("UBE", None),  # too short to be a truncated name
+        ("WALMART", None),
+        ("", None),
+    ],
+)
+def test_lookup(merchants_csv: Path, name: str, merchant: str | None) -> None:
+    assert MerchantDictionary(merchants_csv).lookup(name) == merchant
+
+
+def test_index_is_built_lazily_and_rebuilt_when_stale(merchants_csv: Path) -> None:
+    index = merchants_csv.with_suffix(".mdx")
+    dictionary = MerchantDictionary(merchants_csv)
+    assert not index.exists()
+
+    assert dictionary.lookup("AMAZON.CA") == "Amazon"
+    assert index.is_file()
+
+    merchants_csv.write_text(ALIASES + "WALMART,Walmart\n", encoding="utf-8")
+    stamp = index.stat().st_mtime + 1
+    os.utime(merchants_csv, (stamp, stamp))
+    assert MerchantDictionary(merchants_csv).lookup("WALMART") == "Walmart"
+
+
+def test_csv_compiled_in_memory_without_writing_an_index(
+    merchants_csv: Path,
+) -> None:
+    dictionary = MerchantDictionary(merchants_csv, write_index=False)
+
+    assert dictionary.lookup("STARBUKS COFFE") == "Starbucks"
+    clone = pickle.loads(pickle.dumps(dictionary))  # noqa: S301
+    assert clone.lookup("AMZN Mktp CA") == "Amazon"
+    assert list(merchants_csv.parent.iterdir()) == [merchants_csv]
+
+
+def test_prebuilt_index_and_pickling(merchants_csv: Path, tmp_path: Path) -> None:
+    index = tmp_path / "prebuilt.mdx"
+    build_index(merchants_csv, index)
+    dictionary = MerchantDictionary(index)
+    assert dictionary.lookup("AMZN Mktp") == "Amazon"
+
+    clone = pickle.loads(pickle.dumps(dictionary))  # noqa: S301
+    assert clone.lookup("TIM HORTONS #123") == "Tim Hortons"
+
+
+def test_conflicting_alias_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "merchants.csv"
+    path.write_text("alias,merchant\nUBER,Uber\nUBER,Uber Eats\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="maps to both"):
+        build_index(path, tmp_path / "merchants.mdx")
+
+
+def test_not_an_index(tmp_path: Path) -> None:
+    path = tmp_path / "bogus.mdx"
+    path.write_bytes(b"\0" * 32)
+    with pytest.raises(ValueError, match="not a merchant dictionary"):
+        MerchantDictionary(path).lookup("AMAZON")
+
+
+def test_process_dataframe_description_uses_dictionary(merchants_csv: Path) -> None:
+    proc = PDFProcessor("1234", "5678", MerchantDictionary(merchants_csv))
+    df = pd.DataFrame(
+        {
+            Col.DESCRIPTION: [
+                "AMZN Mktp CA*2K3 WWW.AMAZON.CAON",
+                "TIM HORTONS #4021 TORONTO ON",
+                "LOCAL SHOP TORONTO ON",
+                "AMAZON.CA REFUND",
+            ],
+            Col.AMOUNT: [10.0, 2.5, 3.0, -10.0],
+        },
+    )
+
+    result = proc.process_dataframe_description(df)
+    assert result[Col.STORE_NAME].tolist() == [
+        "Amazon",
+        "Tim Hortons",
+        "LOCAL SHOP TORONTO ON",
+        UNKNOWN,  # refunds keep the UNKNOWN marker
+    ]
+
+
+def test_canonicalize_resolves_each_distinct_name_once(merchants_csv: Path) -> None:
+    names = pd.Series(["AMZN Mktp CA", "SHOP 1", "AMZN Mktp CA", "SHOP 1"] * 50)
+    dictionary = MerchantDictionary(merchants_csv)
+
+    result = dictionary.canonicalize(names)
+
+    assert set(dictionary._cache) == {"AMZN Mktp CA", "SHOP 1"}  # noqa: SLF001
+    assert result.tolist() == ["Amazon", "SHOP 1", "Amazon", "SHOP 1"] * 50
+
+
+@pytest.mark.benchmark
+def test_canonicalize_one_million_rows(
+    merchants_csv: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    distinct = np.array(
+        [f"AMZN Mktp CA{i}" if i % 2 else f"SHOP {i}" for i in range(2_000)],
+        dtype=object,
+    )
+    rows = 1_000_000
+    names = pd.Series(distinct[np.random.default_rng(0).integers(0, 2_000, rows)])
+
+    dictionary = MerchantDictionary(merchants_csv)
+    resolved: list[str] = []
+    resolve = dictionary._resolve  # noqa: SLF001
+
+    def counting_resolve(key: str) -> str | None:
+        resolved.append(key)
+        return resolve(key)
+
+    monkeypatch.setattr(dictionary, "_resolve", counting_resolve)
+
+    start = time.perf_counter()
+    result = dictionary.canonicalize(names)
+    elapsed = time.perf_counter() - start
+
+    # memoized: one index lookup per distinct name, not per row
+    assert len(resolved) == names.nunique()
+    assert (result[names.str.startswith("AMZN")] == "Amazon").all()
+    others = ~names.str.startswith("AMZN")
+    assert result[others].tolist() == names[others].tolist()
+    print(f"canonicalize: {rows / elapsed:,.0f} rows/s")  # noqa: T201
@@ -0,0 +1,80 @@
+"""Unit tests for metrics.py."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.metrics import BUCKETS, Histogram, Metrics
+from src.pdf_processor import ParseStats
+
+
+def test_histogram_is_cumulative() -> None:
+    histogram = Histogram()
+    for seconds in (0.001, 0.02, 0.02, 30.0):
+        histogram.observe(seconds)
+
+    buckets = dict(histogram.cumulative())
+
+    assert buckets["0.005"] == 1
+    assert buckets["0.025"] == 3  # noqa: PLR2004
+    assert buckets[f"{BUCKETS[-1]:g}"] == 3  # noqa: PLR2004 - 30 s is above all bounds
+    assert buckets["+Inf"] == histogram.count == 4  # noqa: PLR2004
+    assert histogram.total == pytest.approx(30.041)
+
+
+def test_counters_follow_parse_stats_and_documents() -> None:
+    metrics = Metrics()
+    metrics.record_parse(
+        ParseStats(
+            pages_parsed=3,
+            pages_skipped=1,
+            anchor_failures=1,
+            parse_seconds=0.3,
+            page_seconds=[0.1, 0.1, 0.1],
+        ),
+    )
+    metrics.document_finished(rows=12)
+    metrics.document_finished(failed=True)
+    with metrics.timed("write"):
+        pass
+
+    data = metrics.as_dict()
+    assert data["pages_parsed"] == 3  # noqa: PLR2004
+    assert data["pages_skipped"] == 1
+    assert data["anchor_failures"] == 1
+    assert data["documents_done"] == 2  # noqa: PLR2004
+    assert data["documents_failed"] == 1
+    assert data["rows"] == 12  # noqa: PLR2004
+    assert data["stages"]["extract"]["count"] == 3  # noqa: PLR2004
+    assert data["stages"]["parse"]["count"] == 1
+    assert data["stages"]["write"]["count"] == 1
+
+
+def test_prometheus_textfile(tmp_path: Path) -> None:
+    path = tmp_path / "parser.prom"
+    metrics = Metrics(path)
+    with metrics.live(documents=2):
+        metrics.record_parse(ParseStats(pages_parsed=4, page_seconds=[0.01] * 4))
+        metrics.document_finished(rows=7)
+
+    text = path.read_text(encoding="utf-8")
+    assert "# TYPE cibc_parser_pages_parsed_total counter" in text
+    assert "cibc_parser_documents 2\n" in text
+    assert "cibc_parser_pages_parsed_total 4\n" in text
+    assert "cibc_parser_rows_total 7\n" in text
+    assert 'cibc_parser_stage_seconds_bucket{stage="extract",le="+Inf"} 4\n' in text
+    assert 'cibc_parser_stage_seconds_count{stage="parse"} 1\n' in text
+    assert not path.with_name("parser.prom.tmp").exists()
+
+
+def test_json_export_is_throttled(tmp_path: Path) -> None:
+    path = tmp_path / "metrics.json"
+    metrics = Metrics(path, interval=3600)
+
+    metrics.document_finished(rows=1)  # first document exports right away
+    metrics.document_finished(rows=1)
+    assert json.loads(path.read_text(encoding="utf-8"))["rows"] == 1
+
+    metrics.export()
+    assert json.loads(path.read_text(encoding="utf-8"))["rows"] == 2  # noqa: PLR2004
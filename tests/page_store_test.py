@@ -0,0 +1,91 @@
+"""Unit tests for page_store.py."""
+
+import io
+import pickle
+from pathlib import Path
+
+import pandas as pd
+import pdfplumber
+import pytest
+
+from src.constants.table_headers import Col
+from src.page_store import PageStore, page_fingerprint
+from src.pdf_processor import ParseStats, parse_statement
+from src.table_extractor import TableExtractor
+from tests.fixtures.statement_pdf import build_form_pages, build_statement
+
+
+def _fingerprints(pdf: bytes) -> list[bytes]:
+    with pdfplumber.open(io.BytesIO(pdf)) as doc:
+        return [page_fingerprint(page) for page in doc.pages]
+
+
+def test_fingerprint_follows_page_content() -> None:
+    original = _fingerprints(build_statement(pages=3, rows_per_page=2))
+    reissued = _fingerprints(
+        build_statement(pages=3, rows_per_page=2, statement_date="July 16, 2024"),
+    )
+    other = _fingerprints(build_statement(pages=3, rows_per_page=2, seed=1))
+
+    assert original[1:] == reissued[1:]  # only the cover page changed
+    assert original[0] != reissued[0]
+    assert original[1] != original[2]
+    assert not set(original[1:]) & set(other[1:])
+
+
+def test_fingerprint_covers_form_xobjects() -> None:
+    pdf = build_form_pages(["Jul 1 STORE A 10.00", "Jul 2 STORE B 99.00"])
+
+    with pdfplumber.open(io.BytesIO(pdf)) as doc:
+        words = [[w["text"] for w in p.extract_words()] for p in doc.pages]
+    first, second = _fingerprints(pdf)
+
+    assert words[1] == ["Jul", "2", "STORE", "B", "99.00"]  # drawn by the form
+    assert first != second  # same "q /Fm0 Do Q" content, different forms
+    assert _fingerprints(pdf) == [first, second]
+
+
+def test_store_round_trip(tmp_path: Path) -> None:
+    store = PageStore(tmp_path / "pages.sqlite")
+    frame = pd.DataFrame(
+        {Col.TRANS_DATE: ["Jul 01"], Col.DESCRIPTION: ["COFFEE"], Col.AMOUNT: [None]},
+    )
+
+    assert store.get(b"page", "1234") is None
+    store.put(b"page", "1234", frame, 12.5)
+
+    restored = pickle.loads(pickle.dumps(store))  # noqa: S301 - our own bytes
+    got = restored.get(b"page", "1234")
+    assert got is not None
+    assert got[0].to_numpy().tolist() == [["Jul 01", "COFFEE", None]]
+    assert list(got[0].columns) == [Col.TRANS_DATE, Col.DESCRIPTION, Col.AMOUNT]
+    assert got[1] == pytest.approx(12.5)
+    assert restored.get(b"page", "9999") is None
+    assert len(restored) == 1
+    store.close()
+    restored.close()
+
+
+def test_identical_pages_are_not_laid_out_again(tmp_path: Path) -> None:
+    pdf = build_statement(pages=4, rows_per_page=3)
+    extractors = [TableExtractor("1234", "5678")]
+    store = PageStore(tmp_path / "pages.sqlite")
+
+    first_stats, second_stats = ParseStats(), ParseStats()
+    ((first, first_summary),) = parse_statement(pdf, extractors, first_stats, store)
+    ((second, second_summary),) = parse_statement(
+        pdf,
+        extractors,
+        second_stats,
+        PageStore(store.path),  # a later run
+    )
+
+    assert (first_stats.pages_parsed, first_stats.page_cache_hits) == (3, 0)
+    assert (second_stats.pages_parsed, second_stats.page_cache_hits) == (0, 3)
+    assert not second_stats.page_seconds
+    assert len(store) == 3  # noqa: PLR2004
+    pd.testing.assert_frame_equal(
+        first.astype(object).reset_index(drop=True),
+        second.astype(object).reset_index(drop=True),
+    )
+    assert second_summary.card_total == pytest.approx(first_summary.card_total)
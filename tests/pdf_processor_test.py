@@ -1,6 +1,12 @@
 """Unit tests for pdf_processor.py."""
 
 import re
+import sys
+import time
+import tracemalloc
+from datetime import date
+from io import BytesIO
+from pathlib import Path
 from types import TracebackType
 from typing import Self
 
@@ -9,13 +15,29 @@ import pytest
 
 from src.constants.keywords import UNKNOWN
 from src.constants.table_headers import Col
-from src.pdf_processor import PDFProcessor
+from src.page_store import PageStore
+from src.pdf_processor import (
+    ParsedDocument,
+    ParseStats,
+    PDFProcessor,
+    StatementSummary,
+    parse_statement,
+    read_statement_date,
+    try_parse_statement,
+)
+from src.table_extractor import TableExtractor
+from tests.fixtures.statement_pdf import build_form_pages, build_statement
 
 
 class DummyPage:
+    closed = False
+
     def extract_words(self) -> list:
         return []
 
+    def close(self) -> None:
+        self.closed = True
+
     def search(self, regexp: re.Pattern) -> list[dict[str, list[str]]]:
         # Simulate a match for "Statement Date"
         if "Statement" in regexp.pattern:
@@ -41,6 +63,9 @@ class DummyPDF:
 
 
 class DummyExtractor:
+    def extract_page(self, page: DummyPage) -> tuple[pd.DataFrame, float, bool]:
+        return self.extract_table_data(page), -12.34, True
+
     def extract_table_data(self, _page: DummyPage) -> pd.DataFrame:
         # Return a simple DataFrame for testing
         return pd.DataFrame(
@@ -68,6 +93,105 @@ def test_process_pdf_returns_dataframe(processor: PDFProcessor) -> None:
     assert Col.TRANS_DATE.value in df.columns
 
 
+def test_iter_pdfs_serial_keeps_order(processor: PDFProcessor) -> None:
+    results = list(processor.iter_pdfs(["a.pdf", "b.pdf", "c.pdf"]))
+    expected_frames_count = 3
+    assert len(results) == expected_frames_count
+    assert all(r.frame is not None and not r.frame.empty for r in results)
+
+
+def test_iter_pdfs_isolates_failures(processor: PDFProcessor) -> None:
+    class FailingExtractor(DummyExtractor):
+        fail = False
+
+        def extract_table_data(self, page: DummyPage) -> pd.DataFrame:
+            if self.fail:
+                msg = "Table headers were not found."
+                raise ValueError(msg)
+            return super().extract_table_data(page)
+
+    extractor = FailingExtractor()
+    processor.extractor = extractor
+
+    results: list[ParsedDocument] = []
+    for fail in (False, True, False):
+        extractor.fail = fail
+        results.extend(processor.iter_pdfs(["doc.pdf"]))
+
+    assert [r.error is None for r in results] == [True, False, True]
+    assert results[1].frame is None
+    assert results[1].error == "ValueError: Table headers were not found."
+
+
+def test_process_pdf_releases_page_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    proc = PDFProcessor("1234", "5678")
+    proc.extractor = DummyExtractor()
+    pdf = DummyPDF()
+    monkeypatch.setattr("src.pdf_processor.pdfplumber.open", lambda _: pdf)
+
+    proc.process_pdf("dummy.pdf")
+
+    assert [page.closed for page in pdf.pages] == [True, True]
+
+
+def test_process_pdf_memory_is_bounded_by_page_not_document() -> None:
+    proc = PDFProcessor("1234", "5678")
+
+    def peak_memory(pages: int) -> int:
+        pdf = build_statement(pages)
+        tracemalloc.start()
+        try:
+            proc.process_pdf(pdf)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak_memory(10), peak_memory(80)
+
+    # 8x the pages; without releasing page caches the peak grows ~8x too
+    assert large < 3 * small
+
+
+def test_process_statement_reads_summary_in_same_pass(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    proc = PDFProcessor("1234", "5678")
+    proc.extractor = DummyExtractor()
+    opened: list[object] = []
+
+    def fake_open(stream: object) -> DummyPDF:
+        opened.append(stream)
+        return DummyPDF()
+
+    monkeypatch.setattr("src.pdf_processor.pdfplumber.open", fake_open)
+    df, summary = proc.process_statement("dummy.pdf")
+
+    assert len(opened) == 1
+    assert len(df) == summary.rows == 1
+    assert summary.statement_date == "Jan 15, 2024"
+    assert summary.previous_balance is None
+    assert summary.card_total == pytest.approx(-12.34)
+    assert summary.reconciled is True
+
+
+def test_statement_summary_reconciliation() -> None:
+    assert StatementSummary(card_total=10.0, transactions_total=10.0).reconciled
+    assert not StatementSummary(card_total=10.0, transactions_total=9.0).reconciled
+    assert StatementSummary(transactions_total=9.0).reconciled is None
+
+
+def test_process_statement_on_generated_pdf() -> None:
+    proc = PDFProcessor("1234", "5678")
+    df, summary = proc.process_statement(build_statement(pages=3, rows_per_page=4))
+
+    expected_rows_count = 8
+    assert len(df) == expected_rows_count
+    assert summary.statement_date == "July 15, 2024"
+    assert summary.previous_balance == pytest.approx(100.0)
+    assert summary.card_total == pytest.approx(summary.transactions_total)
+    assert summary.reconciled
+
+
 def test_get_year_from_first_page_found(monkeypatch: pytest.MonkeyPatch) -> None:
     proc = PDFProcessor("1234", "5678")
     monkeypatch.setattr("src.pdf_processor.pdfplumber.open", lambda _: DummyPDF())
@@ -106,6 +230,43 @@ def test_process_dataframe_and_description_full() -> None:
     assert "store_name" in result.columns
 
 
+def test_process_dataframe_computes_requested_columns_only() -> None:
+    proc = PDFProcessor("1234", "5678", columns=[Col.CITY, Col.CATEGORY])
+    df = pd.DataFrame(
+        {
+            Col.TRANS_DATE: ["Jan 1"],
+            Col.POST_DATE: ["Jan 2"],
+            Col.DESCRIPTION: ["WALMART TORONTO ON"],
+            Col.CATEGORY: [" Groceries "],
+            Col.AMOUNT: ["12.34"],
+        },
+    )
+
+    result = proc.process_dataframe(df, "2024")
+
+    # the city is derived from the description and amount, nothing else
+    assert result.columns.tolist() == [
+        Col.DESCRIPTION,
+        Col.CATEGORY,
+        Col.AMOUNT,
+        Col.CITY,
+    ]
+    assert result.loc[0, Col.CITY] == "TORONTO"
+    assert result.loc[0, Col.CATEGORY] == "Groceries"
+
+
+def test_projected_pages_are_stored_apart(tmp_path: Path) -> None:
+    pdf = build_statement(pages=2, rows_per_page=3)
+    store = PageStore(tmp_path / "pages.sqlite")
+    lean = PDFProcessor("1234", "5678", page_store=store, columns=[Col.AMOUNT])
+    full = PDFProcessor("1234", "5678", page_store=store)
+
+    assert lean.process_pdf(pdf).columns.tolist() == [Col.AMOUNT]
+    assert len(full.process_pdf(pdf).columns) == 5  # noqa: PLR2004
+    assert len(store) == 2  # noqa: PLR2004 - one entry per projection
+    store.close()
+
+
 def test_process_dataframe_empty() -> None:
     proc = PDFProcessor("1234", "5678")
     df = pd.DataFrame()
@@ -138,3 +299,135 @@ def test_process_dataframe_description_various_cases() -> None:
     # Check UNKNOWN assignment
     assert result.loc[0, "province"] == UNKNOWN
     assert result.loc[1, "province"] == UNKNOWN
+
+
+def test_process_pdf_accepts_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    proc = PDFProcessor("1234", "5678")
+    proc.extractor = DummyExtractor()
+    opened: list[object] = []
+
+    def fake_open(stream: object) -> DummyPDF:
+        opened.append(stream)
+        return DummyPDF()
+
+    monkeypatch.setattr("src.pdf_processor.pdfplumber.open", fake_open)
+    df = proc.process_pdf(b"%PDF-1.3\n%%EOF\n")
+
+    assert not df.empty
+    assert isinstance(opened[0], BytesIO)
+
+
+def test_try_parse_statement_reports_stats_once() -> None:
+    pdf = build_statement(pages=3, rows_per_page=2)
+    results = try_parse_statement(
+        pdf,
+        [TableExtractor("1234", "5678"), TableExtractor("9999", "0000")],
+    )
+
+    first, other = results
+    assert first.stats is not None
+    assert other.stats is None  # one parse, booked once
+    assert first.stats.pages_parsed == 2  # noqa: PLR2004
+    assert first.stats.pages_skipped == 1
+    assert first.stats.anchor_failures == 2  # noqa: PLR2004 - card 9999 has no table
+    assert len(first.stats.page_seconds) == 2  # noqa: PLR2004
+    assert other.frame is not None
+    assert other.frame.empty
+
+
+def test_pages_without_a_table_are_not_anchor_failures() -> None:
+    pdf = build_form_pages(["Statement Date", "Purchase Interest Rate 20.99%"])
+
+    (result,) = try_parse_statement(pdf, [TableExtractor("1234", "5678")])
+
+    assert result.stats is not None
+    assert result.stats.pages_parsed == 1  # the legal notes page
+    assert result.stats.anchor_failures == 0
+
+
+def test_read_statement_date_reads_first_page_only() -> None:
+    pdf = build_statement(pages=3, statement_date="March 15, 2024")
+
+    assert read_statement_date(pdf) == date(2024, 3, 15)
+    assert read_statement_date(b"not a pdf") is None
+
+
+@pytest.mark.parametrize("as_source", [bytes, BytesIO, "path"])
+def test_threaded_parse_matches_serial(
+    tmp_path: Path,
+    as_source: object,
+) -> None:
+    pdf = build_statement(pages=9, rows_per_page=3)
+    path = tmp_path / "statement.pdf"
+    path.write_bytes(pdf)
+    source = path if as_source == "path" else as_source(pdf)  # type: ignore[operator]
+    extractors = [TableExtractor("1234", "5678"), TableExtractor("9999", "0000")]
+    store = PageStore(tmp_path / "pages.sqlite")
+
+    serial_stats, threaded_stats = ParseStats(), ParseStats()
+    serial = parse_statement(pdf, extractors, serial_stats)
+    threaded = parse_statement(source, extractors, threaded_stats, store, threads=3)
+
+    for (df, summary), (threaded_df, threaded_summary) in zip(
+        serial,
+        threaded,
+        strict=True,
+    ):
+        pd.testing.assert_frame_equal(df, threaded_df)
+        assert threaded_summary == summary
+    assert threaded_stats.pages_parsed == serial_stats.pages_parsed
+    assert threaded_stats.pages_parsed == 8  # noqa: PLR2004
+    assert threaded_stats.anchor_failures == serial_stats.anchor_failures
+    assert len(store) == 16  # noqa: PLR2004 - 8 pages x 2 cards, from 3 threads
+    store.close()
+
+
+@pytest.mark.benchmark
+def test_engine_throughput() -> None:
+    """
+    Compare serial, process and thread engines on the same documents.
+
+    Run it with ``-m benchmark -s`` on a standard and on a free-threaded
+    (3.13t) interpreter to compare: threads only scale once the GIL is gone.
+    """
+    docs = [build_statement(pages=16, rows_per_page=8, seed=i) for i in range(4)]
+    pages = sum(16 - 1 for _ in docs)
+    engines = {
+        "serial": (PDFProcessor("1234", "5678"), 1),
+        "process": (PDFProcessor("1234", "5678"), 4),
+        "thread": (PDFProcessor("1234", "5678", threads=4), 1),
+    }
+
+    results = {}
+    gil = "on" if getattr(sys, "_is_gil_enabled", lambda: True)() else "off"
+    for name, (proc, workers) in engines.items():
+        started = time.perf_counter()
+        results[name] = [r.frame for r in proc.iter_pdfs(docs, workers=workers)]
+        elapsed = time.perf_counter() - started
+        rate = f"{pages / elapsed:,.0f} pages/s"
+        print(f"{name:>8} engine, GIL {gil}: {rate}")  # noqa: T201
+
+    for name in ("process", "thread"):
+        for expected, got in zip(results["serial"], results[name], strict=True):
+            pd.testing.assert_frame_equal(expected, got)
+
+
+def test_process_dataframe_dates_later_months_in_previous_year() -> None:
+    proc = PDFProcessor("1234", "5678")
+    df = pd.DataFrame(
+        {
+            Col.TRANS_DATE: ["Dec 28", "Jan 3"],
+            Col.POST_DATE: ["Dec 30", "Jan 4"],
+            Col.DESCRIPTION: ["WALMART TORONTO ON"] * 2,
+            Col.CATEGORY: ["Groceries"] * 2,
+            Col.AMOUNT: [1.0, 2.0],
+        },
+    )
+
+    result = proc.process_dataframe(df, "2025", statement_month=1)
+
+    assert result[Col.TRANS_DATE].dt.strftime("%Y-%m-%d").tolist() == [
+        "2024-12-28",
+        "2025-01-03",
+    ]
+    assert result[Col.POST_DATE].dt.year.tolist() == [2024, 2025]
@@ -0,0 +1,33 @@
+"""Unit tests for pdf_source.py."""
+
+import mmap
+from io import BytesIO
+from pathlib import Path
+
+from src.pdf_source import as_stream
+
+
+def test_as_stream_passes_paths_through(tmp_path: Path) -> None:
+    path = tmp_path / "a.pdf"
+    assert as_stream(path) is path
+    assert as_stream(str(path)) == str(path)
+
+
+def test_as_stream_wraps_bytes() -> None:
+    stream = as_stream(b"%PDF-1.3\n%%EOF\n")
+    assert isinstance(stream, BytesIO)
+    assert stream.read(4) == b"%PDF"
+
+
+def test_as_stream_rewinds_file_objects() -> None:
+    fp = BytesIO(b"%PDF-1.3\n%%EOF\n")
+    fp.read()
+    assert as_stream(fp) is fp
+    assert fp.tell() == 0
+
+
+def test_as_stream_accepts_mmap(tmp_path: Path) -> None:
+    path = tmp_path / "a.pdf"
+    path.write_bytes(b"%PDF-1.3\n%%EOF\n")
+    with path.open("rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert as_stream(m) is m
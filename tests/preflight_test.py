@@ -0,0 +1,69 @@
+"""Unit tests for preflight.py."""
+
+from datetime import date
+
+import pytest
+
+from src.preflight import DocumentCheck, Plan, inspect_document, inspect_documents
+from tests.fixtures.statement_pdf import build_statement
+
+
+def test_statement_passes_preflight() -> None:
+    check = inspect_document(
+        build_statement(pages=4, statement_date="March 15, 2024"),
+        card=("1234", "5678"),
+    )
+
+    assert check.status == "ok"
+    assert check.pages == 4  # noqa: PLR2004
+    assert check.statement_date == date(2024, 3, 15)
+    assert check.column_headers
+    assert check.card_header
+    assert check.estimated_seconds == pytest.approx(3 * check.page_seconds)
+
+
+@pytest.mark.parametrize(
+    ("pdf", "problem"),
+    [
+        (b"not a pdf", "PdfminerException"),
+        (build_statement(pages=1), "no transaction pages"),
+    ],
+)
+def test_hopeless_documents_are_rejected(pdf: bytes, problem: str) -> None:
+    check = inspect_document(pdf)
+
+    assert check.status == "rejected"
+    assert check.problem is not None
+    assert check.problem.startswith(problem)
+
+
+def test_other_card_is_a_warning() -> None:
+    pdf = build_statement(pages=2, first="9999")
+
+    assert inspect_document(pdf).status == "ok"  # no card given, not checked
+    check = inspect_document(pdf, card=("1234", "5678"))
+    assert check.status == "warning"
+    assert check.card_header is False
+
+
+def test_plan_counts_accepted_documents_only() -> None:
+    checks = [
+        DocumentCheck("a.pdf", pages=5, column_headers=True, page_seconds=0.5),
+        DocumentCheck("b.pdf", pages=3, column_headers=True, page_seconds=0.25),
+        DocumentCheck("c.pdf", error="PdfminerException: broken"),
+    ]
+
+    assert Plan.from_checks(checks) == Plan(
+        documents=2,
+        rejected=1,
+        pages=6,
+        seconds=2.5,
+    )
+
+
+def test_parallel_inspection_keeps_order() -> None:
+    docs = [build_statement(pages=2, seed=i) for i in range(3)] + [b"broken"]
+
+    checks = inspect_documents(docs, workers=2)
+
+    assert [c.status for c in checks] == ["ok", "ok", "ok", "rejected"]
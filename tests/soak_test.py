@@ -0,0 +1,101 @@
+"""
+Soak test: parse thousands of statements with one PDFProcessor.
+
+Deselected by default; run it with ``python -m pytest -m soak -s``
+(``SOAK_DOCUMENTS`` sets the document count, default 2000). Resident
+memory, open file descriptors and per-document latency are sampled every
+``WINDOW`` documents. Once the process has warmed up, the test fails when
+any of them grows past its threshold.
+"""
+
+import gc
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from src.pdf_processor import PDFProcessor
+from tests.fixtures.statement_pdf import build_statement
+
+DOCUMENTS = int(os.environ.get("SOAK_DOCUMENTS", "2000"))
+WARMUP = 100  # documents parsed before sampling starts
+WINDOW = 100  # documents per sample
+MAX_RSS_GROWTH = 32 * 2**20  # bytes over the first sample
+MAX_FD_GROWTH = 0
+MAX_LATENCY_DRIFT = 1.5  # median latency of a window / of the first window
+
+_PROC = Path("/proc/self")
+
+
+@dataclass(slots=True, frozen=True)
+class Sample:
+    """Process state after *documents* documents."""
+
+    documents: int
+    rss: int  # bytes
+    fds: int
+    latency: float  # median seconds per document over the last window
+
+
+def _rss() -> int:
+    resident_pages = int((_PROC / "statm").read_text().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _open_fds() -> int:
+    return len(list((_PROC / "fd").iterdir()))
+
+
+def _sample(documents: int, latencies: list[float]) -> Sample:
+    gc.collect()  # count leaks, not garbage awaiting collection
+    return Sample(documents, _rss(), _open_fds(), statistics.median(latencies))
+
+
+@pytest.mark.soak
+@pytest.mark.skipif(not _PROC.is_dir(), reason="samples /proc (Linux only)")
+def test_repeated_parsing_is_stable(tmp_path: Path) -> None:
+    proc = PDFProcessor("1234", "5678")
+    # a few dozen distinct statements, half of them read from disk so a
+    # leaked file handle shows up in the descriptor count
+    variants = 40
+    sources: list[bytes | Path] = []
+    for seed in range(variants):
+        pdf = build_statement(pages=3, rows_per_page=6, seed=seed)
+        if seed % 2:
+            path = tmp_path / f"statement_{seed}.pdf"
+            path.write_bytes(pdf)
+            sources.append(path)
+        else:
+            sources.append(pdf)
+
+    samples: list[Sample] = []
+    latencies: list[float] = []
+    for i in range(WARMUP + DOCUMENTS):
+        started = time.perf_counter()
+        df = proc.process_pdf(sources[i % variants])
+        latencies.append(time.perf_counter() - started)
+        assert len(df) == 12  # noqa: PLR2004 - 2 table pages x 6 rows
+
+        done = i + 1
+        if done == WARMUP:
+            latencies.clear()  # the first calls pay for imports and caches
+        elif done > WARMUP and (done - WARMUP) % WINDOW == 0:
+            samples.append(_sample(done, latencies))
+            latencies.clear()
+
+    baseline = samples[0]
+    for s in samples:
+        print(  # noqa: T201
+            f"{s.documents:>6} docs  rss {s.rss / 2**20:7.1f} MiB  "
+            f"fds {s.fds:3d}  median {s.latency * 1000:6.1f} ms",
+        )
+
+    rss_growth = max(s.rss for s in samples) - baseline.rss
+    fd_growth = max(s.fds for s in samples) - baseline.fds
+    drift = max(s.latency for s in samples) / baseline.latency
+    assert rss_growth <= MAX_RSS_GROWTH, f"RSS grew {rss_growth / 2**20:.1f} MiB"
+    assert fd_growth <= MAX_FD_GROWTH, f"{fd_growth} file descriptor(s) leaked"
+    assert drift <= MAX_LATENCY_DRIFT, f"latency drifted x{drift:.2f}"
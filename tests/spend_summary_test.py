@@ -0,0 +1,69 @@
+"""Unit tests for spend_summary.py."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.constants.table_headers import Col
+from src.spend_summary import SpendSummary
+
+
+def _processed(*rows: tuple[str, str, float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            Col.TRANS_DATE: pd.to_datetime([r[0] for r in rows]),
+            Col.CATEGORY: [r[1] for r in rows],
+            Col.AMOUNT: [r[2] for r in rows],
+            Col.STORE_NAME: ["STORE"] * len(rows),
+            Col.PROVINCE: ["ON"] * len(rows),
+        },
+    )
+
+
+def test_totals_accumulate_across_runs(tmp_path: Path) -> None:
+    db = tmp_path / "out.summary.sqlite"
+    with SpendSummary(db) as summary:
+        summary.add(
+            "may.pdf",
+            _processed(("2024-05-02", "Dining", 10.0), ("2024-05-20", "Dining", 5.5)),
+        )
+
+    with SpendSummary(db) as summary:
+        summary.add("jun.pdf", _processed(("2024-06-01", "Travel", 100.0)))
+        totals = summary.monthly()
+
+    assert totals["month"].tolist() == ["2024-05", "2024-06"]
+    assert totals["total"].tolist() == [pytest.approx(15.5), pytest.approx(100.0)]
+    assert totals["count"].tolist() == [2, 1]
+
+
+def test_document_is_counted_once(tmp_path: Path) -> None:
+    df = _processed(("2024-05-02", "Dining", 10.0))
+    with SpendSummary(tmp_path / "s.sqlite") as summary:
+        assert summary.add("may.pdf", df)
+        assert not summary.add("may.pdf", df)
+        assert summary.monthly()["total"].tolist() == [pytest.approx(10.0)]
+
+
+def test_breakdown_by_category(tmp_path: Path) -> None:
+    with SpendSummary(tmp_path / "s.sqlite") as summary:
+        summary.add(
+            "may.pdf",
+            _processed(("2024-05-02", "Dining", 10.0), ("2024-05-03", "Travel", -2.0)),
+        )
+        totals = summary.monthly(Col.CATEGORY)
+
+    assert totals["category"].tolist() == ["Dining", "Travel"]
+    with pytest.raises(ValueError, match="Cannot summarise"):
+        summary.monthly(Col.AMOUNT)
+
+
+def test_failed_run_is_rolled_back(tmp_path: Path) -> None:
+    db = tmp_path / "s.sqlite"
+    summary = SpendSummary(db)
+    summary.add("may.pdf", _processed(("2024-05-02", "Dining", 10.0)))
+    summary.__exit__(RuntimeError, RuntimeError("parsing failed"), None)
+
+    with SpendSummary(db) as summary:
+        assert summary.monthly().empty
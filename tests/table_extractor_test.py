@@ -67,3 +67,28 @@ def test_extract_table_data_returns_dataframe() -> None:
     assert (
         len(df.values) == expected_rows_count
     ), f"Length should be {expected_rows_count}"
+
+
+def test_extract_table_and_total_reads_footer() -> None:
+    page = DummyPage()
+    words = page.extract_words()
+    footer = [
+        {"text": text, "x0": 36 + 30 * i, "x1": 60 + 30 * i, "top": 480, "bottom": 488}
+        for i, text in enumerate(("Total", "for", "1234", "$73.66"))
+    ]
+    page.extract_words = lambda: [*words[:-4], *footer, *words[-4:]]  # type: ignore[method-assign]
+
+    df, total = TableExtractor("1234", "5678").extract_table_and_total(page)
+    assert len(df) == 1
+    assert total == 73.66  # noqa: PLR2004
+
+
+def test_unrequested_columns_are_not_assembled() -> None:
+    extractor = TableExtractor("1234", "5678", [Col.AMOUNT, Col.CATEGORY])
+
+    df = extractor.extract_table_data(DummyPage())
+
+    assert df.columns.tolist() == [Col.CATEGORY, Col.AMOUNT]
+    assert df.iloc[0].tolist() == ["Restaurants ", "73.66 "]
+    amounts_only = TableExtractor("1234", "5678", [Col.AMOUNT])
+    assert len(amounts_only.extract_table_data(DummyPage())) == 1  # rows still found
@@ -7,10 +7,13 @@ import pytest
 from src.constants.table_headers import Col
 from src.utils import (
     find_word_adjacent_to_the_sequence,
+    get_card_total,
+    get_column_header_index,
     get_column_positions,
     get_first_table_word_index,
     get_last_table_word_index,
     get_table_dimentions,
+    parse_amount,
 )
 
 
@@ -75,3 +78,26 @@ def test_get_column_positions(sample_words: list[dict[str, Any]]) -> None:
         Col.AMOUNT,
     ]:
         assert col in positions
+
+
+def test_get_column_header_index(sample_words: list[dict[str, Any]]) -> None:
+    index = get_column_header_index(sample_words)
+
+    assert sample_words[index]["text"] == "Post"  # word before "date date ..."
+    assert get_column_header_index(sample_words[index + 2 :]) == -1
+
+
+def test_get_card_total(sample_words: list[dict[str, Any]]) -> None:
+    assert get_card_total(sample_words, "1234") is None  # footer without amount
+
+    footer = [
+        {"text": text, "x0": 0, "x1": 10, "top": 0, "bottom": 10}
+        for text in ("Total", "for", "1234", "XXXX", "XXXX", "5678", "$1,234.56")
+    ]
+    assert get_card_total(footer, "1234") == pytest.approx(1234.56)
+    assert get_card_total(footer, "9999") is None
+
+
+def test_parse_amount() -> None:
+    assert parse_amount("$1,234.56") == pytest.approx(1234.56)
+    assert parse_amount("-$7.00") == pytest.approx(-7.0)